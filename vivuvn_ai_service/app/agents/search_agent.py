@@ -3,31 +3,63 @@ Search agent for place discovery and filtering.
 
 Handles:
 - Building search filters based on travel request
-- Vector search with Pinecone
+- Vector search via the configured vector store
 - Geographical clustering of results
 """
 
+import asyncio
+import math
+import re
+import time
+import unicodedata
+from functools import lru_cache
+import numpy as np
 import structlog
-from typing import Dict, List, Any
+from typing import Dict, Hashable, List, Any, Optional, Set, Tuple
 
 from app.core.config import settings
 from app.core.exceptions import NoResultsError
-from app.services.pinecone_service import get_pinecone_service
+from app.services.chunk_manifest import get_chunk_manifest
+from app.services.vector_store import get_vector_store, province_namespace
 from app.services.embedding_service import get_embedding_service
+from app.services.province_catalogue import get_province_catalogue
+from app.services.search_cache import SearchResultCache, get_search_cache
+from app.services.sparse_encoder import get_sparse_encoder
 from app.utils.geo_utils import simple_kmeans_geo
-from app.utils.helpers import normalize_province_name
+from app.utils.helpers import normalize_province_name, province_slug
+from app.utils.ranking import aggregate_by_place, mmr_select, reciprocal_rank_fusion, rerank_scores
+from app.utils.single_flight import SingleFlight
 from app.agents.state import TravelPlanningState
 
 logger = structlog.get_logger(__name__)
 
+# Separators between provinces in a multi-province destination ("Hà Nội, Ninh Bình")
+_DESTINATION_SEPARATORS = re.compile(r"\s*[,;+]\s*|\s+-\s+")
+
+
+@lru_cache(maxsize=256)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Whole-word alternation over rerank keywords (longest first), compiled once per keyword set."""
+    return re.compile(r"(?<!\w)(" + "|".join(re.escape(keyword) for keyword in keywords) + r")(?!\w)")
+
 
 class SearchAgent:
     """Agent responsible for searching and filtering places."""
 
     def __init__(self):
         """Initialize search agent."""
-        self.pinecone_service = get_pinecone_service()
+        self.vector_store = get_vector_store()
         self.embedding_service = get_embedding_service()
+        self.search_cache = get_search_cache()
+        # Local BM25 encoder for hybrid keyword + dense retrieval (None when disabled)
+        self.sparse_encoder = get_sparse_encoder()
+        # In-memory snapshots of small provinces (None when disabled)
+        self.catalogue = get_province_catalogue()
+        # Concurrent identical searches share one embedding call and vector query
+        self.search_flight: SingleFlight[List[Dict[str, Any]]] = SingleFlight("search")
+        # Slugs of indexed provinces, for resolving destination parts
+        self._known_provinces: Optional[Set[str]] = None
+        self._known_provinces_at = 0.0
 
         # Preference keywords mapping for semantic search
         # Keywords are words commonly found in place descriptions for each category
@@ -43,38 +75,84 @@ class SearchAgent:
             "đời sống về đêm": ["phố đi bộ", "bar", "chợ đêm", "giải trí"],
         }
 
+    @staticmethod
+    def _normalize_preference(preference: str) -> str:
+        """Canonical form of a preference (NFC, trimmed, lowercase), as used in cached query strings."""
+        return unicodedata.normalize("NFC", preference or "").strip().lower()
+
+    def _get_preferences(self, travel_request) -> List[str]:
+        """Distinct normalized preferences of a request, in request order."""
+        preferences = (self._normalize_preference(preference) for preference in travel_request.preferences or [])
+        return list(dict.fromkeys(preference for preference in preferences if preference))
+
     def _get_preference_keywords(self, preference: str) -> List[str]:
         """Get keywords for a preference category."""
-        return self.preference_keywords.get(preference.lower(), [])
+        return self.preference_keywords.get(self._normalize_preference(preference), [])
+
+    def _build_preference_query(self, preference: str) -> str:
+        """Build the preference-only part of a semantic query (preference + 2 keywords)."""
+        preference = self._normalize_preference(preference)
+        query_parts = [preference]
+
+        # Add 2-3 relevant keywords for better semantic matching with descriptions
+        keywords = self._get_preference_keywords(preference)
+        query_parts.extend(keywords[:2])
+
+        return " ".join(query_parts)
 
-    def _build_semantic_query(self, travel_request) -> str:
+    def _get_rerank_keywords(self, travel_request) -> List[str]:
+        """Keywords counted by the reranker: each searched preference and its keywords."""
+        preferences = self._get_preferences(travel_request)
+        keywords = []
+        for preference in preferences[:max(1, settings.SEARCH_MAX_PREFERENCE_QUERIES)]:
+            keywords.append(preference)
+            keywords.extend(self._get_preference_keywords(preference))
+        return list(dict.fromkeys(keyword.lower() for keyword in keywords))
+
+    async def warm_query_cache(self) -> int:
         """
-        Build semantic query focused on preferences.
+        Pre-warm the query embedding cache with every preference-only query.
 
-        Note: Destination filtering is handled by province_filter in Node 1,
-        so this query focuses only on preferences and special requirements.
+        Requests without special requirements build exactly one of these strings
+        (preferences are normalized first, so "Ẩm Thực" and "ẩm thực" share one),
+        so after warm-up their searches never call the embedding API.
+
+        Returns:
+            int: Number of query strings pinned in the cache
         """
-        if not travel_request.preferences:
-            return "địa điểm du lịch"
+        queries = ["địa điểm du lịch"] + [
+            self._build_preference_query(preference)
+            for preference in self.preference_keywords
+        ]
+        return await self.embedding_service.warm_query_embeddings(queries)
 
-        query_parts = []
+    def _build_semantic_queries(self, travel_request) -> List[str]:
+        """
+        Build one semantic sub-query per preference.
 
-        # Use primary preference as main query focus
-        primary_pref = travel_request.preferences[0]
-        query_parts.append(primary_pref)
+        Note: Destination filtering is handled by province_filter in Node 1,
+        so these queries focus only on preferences and special requirements.
+        Up to SEARCH_MAX_PREFERENCE_QUERIES preferences are searched separately;
+        brief special requirements are added to the primary preference's query,
+        so the other sub-queries stay pre-warmed in the query embedding cache.
+        """
+        preferences = self._get_preferences(travel_request)
+        if not preferences:
+            return ["địa điểm du lịch"]
 
-        # Add 2-3 relevant keywords for better semantic matching with descriptions
-        keywords = self._get_preference_keywords(primary_pref)
-        query_parts.extend(keywords[:2])
+        queries = [
+            self._build_preference_query(preference)
+            for preference in preferences[:max(1, settings.SEARCH_MAX_PREFERENCE_QUERIES)]
+        ]
 
         # Include special requirements if they're brief and focused
         if travel_request.special_requirements:
             special_req = travel_request.special_requirements.strip().lower()
             # Only add if it's a short, meaningful requirement (avoid noise)
             if special_req and len(special_req) < 50:
-                query_parts.append(special_req)
+                queries[0] = f"{queries[0]} {special_req}"
 
-        return " ".join(query_parts)
+        return queries
 
     def calculate_dynamic_top_k(self, duration_days: int) -> int:
         """
@@ -92,7 +170,7 @@ class SearchAgent:
         Examples:
             1 day:  8 + (3.0 * 1 * 1.5) = 12-13
             3 days: 8 + (3.0 * 3 * 1.5) = 21-22
-            7 days: 8 + (3.0 * 7 * 1.5) = 39-40 (capped at 35)
+            7 days: 8 + (3.0 * 7 * 1.5) = 39-40 (capped at VECTOR_SEARCH_MAX_K = 35)
         """
         # Optimized formula: reduced diversity factor and activities per day
         calculated_k = int(
@@ -101,11 +179,56 @@ class SearchAgent:
         )
 
         # Clamp between min and max (with tighter max)
-        top_k = max(settings.VECTOR_SEARCH_MIN_K, min(calculated_k, 35))  # Reduced max from 50 to 35
+        top_k = max(settings.VECTOR_SEARCH_MIN_K, min(calculated_k, settings.VECTOR_SEARCH_MAX_K))
 
         logger.info(f"Dynamic top_k: {duration_days} days → {top_k} places (calculated: {calculated_k})")
         return top_k
 
+    async def _known_province_slugs(self) -> Set[str]:
+        """Slugs of the provinces in the chunk manifest (empty if unavailable), cached like the catalogue."""
+        age = time.monotonic() - self._known_provinces_at
+        if self._known_provinces is None or age > settings.PROVINCE_CATALOGUE_TTL_SECONDS:
+            try:
+                counts = await asyncio.to_thread(get_chunk_manifest().province_counts)
+            except Exception as e:
+                logger.warning("Failed to list indexed provinces", error=str(e))
+                counts = {}
+            self._known_provinces = {province_slug(province) for province in counts if province}
+            self._known_provinces_at = time.monotonic()
+        return self._known_provinces
+
+    async def _resolve_destination(self, destination: str) -> List[str]:
+        """
+        Resolve a destination to the normalized province names to search.
+
+        A destination naming one province is used as is. Otherwise it is split on
+        separators and only parts that are indexed provinces are kept, so
+        "Hội An, Quảng Nam" searches Quảng Nam alone. Several provinces are
+        searched together only with SEARCH_MULTI_PROVINCE_DESTINATIONS; without it
+        the first one is used.
+
+        Args:
+            destination: Destination from the travel request
+
+        Returns:
+            Normalized province names (one unless multi-province search is enabled)
+        """
+        # Normalize the province name to handle cases where:
+        # - User inputs "Hà Nội" but database has "Thành phố Hà Nội"
+        # - User inputs "Thành phố Đà Nẵng" but database has "Đà Nẵng"
+        whole = normalize_province_name(destination or "")
+        known = await self._known_province_slugs()
+        if not whole or not known or province_slug(whole) in known:
+            return [whole] if whole else []
+
+        parts = [normalize_province_name(part) for part in _DESTINATION_SEPARATORS.split(whole)]
+        provinces = list(dict.fromkeys(part for part in parts if part and province_slug(part) in known))
+        if not provinces:
+            return [whole]
+        if not settings.SEARCH_MULTI_PROVINCE_DESTINATIONS:
+            return provinces[:1]
+        return provinces
+
     async def build_search_filters(self, state: TravelPlanningState) -> TravelPlanningState:
         """Node 1: Build smart search filters based on travel request."""
         try:
@@ -117,14 +240,19 @@ class SearchAgent:
             additional_filters = {}
 
             # Province/Location filtering with normalization
-            province = travel_request.destination.strip()
+            provinces = await self._resolve_destination(travel_request.destination)
+
+            if provinces:
+                filters["province"] = provinces[0]
+            if len(provinces) > 1:
+                filters["provinces"] = provinces
 
-            if province:
-                # Normalize the province name to handle cases where:
-                # - User inputs "Hà Nội" but database has "Thành phố Hà Nội"
-                # - User inputs "Thành phố Đà Nẵng" but database has "Đà Nẵng"
-                normalized_province = normalize_province_name(province)
-                filters["province"] = normalized_province
+            # Optional "within N km of" area, pushed down as a latitude/longitude range filter
+            if travel_request.center_latitude is not None and travel_request.center_longitude is not None:
+                filters["search_area"] = {
+                    "center": (travel_request.center_latitude, travel_request.center_longitude),
+                    "radius_km": travel_request.radius_km or settings.SEARCH_DEFAULT_RADIUS_KM,
+                }
 
             # Place ID filtering (for specific place requests)
             if additional_filters:
@@ -143,6 +271,311 @@ class SearchAgent:
             state["search_filters"] = {}
             return state
 
+    async def _search_with_cache(
+        self,
+        search_queries: List[str],
+        provinces: List[str],
+        top_k: int,
+        filter_dict: Dict[str, Any],
+        keywords: Optional[List[str]] = None,
+        search_area: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Embed the queries and search the provinces, serving repeats from the search cache.
+
+        Cache misses are coalesced: concurrent identical searches await one shared
+        upstream call.
+
+        Args:
+            search_queries: Semantic sub-queries (one per preference)
+            provinces: Normalized province names (empty for all provinces)
+            top_k: Number of results
+            filter_dict: Additional metadata filters
+            keywords: Preference keywords for the reranker (derived from the same
+                      preferences as the queries, so not part of the cache key)
+            search_area: Optional {"center": (lat, lng), "radius_km": r} restricting
+                         results to a radius (see build_search_filters)
+
+        Returns:
+            Search results, best first
+        """
+        key_filter = {**filter_dict, "search_area": search_area} if search_area else filter_dict
+        key = SearchResultCache.make_key(provinces, " | ".join(search_queries), top_k, key_filter)
+        if self.search_cache is not None:
+            cached = self.search_cache.get(key)
+            if cached is not None:
+                logger.info(f"[Node 2/6] Search cache hit ({len(cached)} places)")
+                return cached
+
+        results = await self.search_flight.do(
+            key,
+            lambda: self._search_uncached(
+                key, search_queries, provinces, top_k, filter_dict, keywords or [], search_area
+            )
+        )
+        # Waiters share one result list; give each its own copy
+        return list(results)
+
+    async def _search_uncached(
+        self,
+        key: Hashable,
+        search_queries: List[str],
+        provinces: List[str],
+        top_k: int,
+        filter_dict: Dict[str, Any],
+        keywords: List[str],
+        search_area: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Embed the sub-queries, search them concurrently and fuse the results.
+
+        One shared call per key (see _search_with_cache); the fused results are cached.
+        With SEARCH_AGGREGATE_BY_PLACE, each sub-query over-fetches chunks and its
+        matches are collapsed to distinct places, so top_k counts unique venues.
+        With several sub-queries, every preference is guaranteed an equal share of
+        SEARCH_PREFERENCE_QUOTA_SHARE * top_k results; the remaining slots go to
+        the best reciprocal-rank-fusion scores. With SEARCH_RERANK_ENABLED or
+        SEARCH_MMR_ENABLED, a pool of SEARCH_CANDIDATE_POOL_FACTOR * top_k places is
+        reranked with place features and/or diversified, then cut to top_k.
+        A search area is pushed down to the vector store as a radius filter.
+        Provinces with at most top_k places in the province catalogue are ranked
+        in-process from their snapshot, without a vector store query.
+        """
+        aggregate = settings.SEARCH_AGGREGATE_BY_PLACE
+        rerank = settings.SEARCH_RERANK_ENABLED
+        mmr = settings.SEARCH_MMR_ENABLED
+        pool_k = math.ceil(top_k * max(1.0, settings.SEARCH_CANDIDATE_POOL_FACTOR)) if rerank or mmr else top_k
+        fetch_k = math.ceil(pool_k * max(1.0, settings.SEARCH_OVERFETCH_FACTOR)) if aggregate else pool_k
+        generation = self.search_cache.generation if self.search_cache is not None else None
+        center = tuple(search_area["center"]) if search_area else None
+        radius_km = search_area["radius_km"] if search_area else None
+
+        # One batched embedding request for all sub-queries (cached ones skip the API)
+        query_embeddings = await self.embedding_service._generate_embeddings(
+            search_queries,
+            task_type=settings.EMBEDDING_TASK_TYPE_QUERY
+        )
+        # Hybrid mode: exact Vietnamese keywords ("chợ đêm", "thác") also score via BM25
+        if self.sparse_encoder is not None:
+            self.sparse_encoder.maybe_reload()
+            sparse_vectors = [self.sparse_encoder.encode_query(query) for query in search_queries]
+        else:
+            sparse_vectors = [None] * len(search_queries)
+
+        # Small provinces: the whole catalogue fits in top_k, so rank it in-process
+        snapshots = None
+        if self.catalogue is not None:
+            snapshots = await self.catalogue.get_snapshots(provinces, max_places=top_k)
+
+        if snapshots is not None:
+            result_lists = [
+                self.catalogue.search(
+                    snapshots,
+                    query_embedding,
+                    top_k=fetch_k,
+                    filter_dict=filter_dict,
+                    sparse_vector=sparse_vector,
+                    center=center,
+                    radius_km=radius_km
+                )
+                for query_embedding, sparse_vector in zip(query_embeddings, sparse_vectors)
+            ]
+            logger.info(
+                f"[Node 2/6] Ranked {sum(snapshot.place_count for snapshot in snapshots)} places "
+                f"of {', '.join(snapshot.province for snapshot in snapshots)} in-process (province catalogue)"
+            )
+        else:
+            # Per-province namespaces are queried directly (merged for multi-province trips)
+            result_lists = await asyncio.gather(
+                *(
+                    self.vector_store.search_provinces(
+                        query_embedding,
+                        provinces=provinces,
+                        top_k=fetch_k,
+                        filter_dict=filter_dict,
+                        sparse_vector=sparse_vector,
+                        center=center,
+                        radius_km=radius_km
+                    )
+                    for query_embedding, sparse_vector in zip(query_embeddings, sparse_vectors)
+                )
+            )
+
+        if aggregate:
+            chunk_count = sum(len(chunks) for chunks in result_lists)
+            result_lists = [
+                aggregate_by_place(chunks, mode=settings.SEARCH_PLACE_SCORE_MODE)
+                for chunks in result_lists
+            ]
+            logger.info(
+                f"[Node 2/6] Collapsed {chunk_count} chunk matches into "
+                f"{', '.join(str(len(r)) for r in result_lists)} places"
+            )
+
+        if len(result_lists) == 1:
+            results = result_lists[0][:pool_k]
+        else:
+            quota = int(top_k * settings.SEARCH_PREFERENCE_QUOTA_SHARE) // len(result_lists)
+            results = reciprocal_rank_fusion(
+                result_lists,
+                top_k=pool_k,
+                k=settings.SEARCH_RRF_K,
+                quotas=[quota] * len(result_lists),
+                key="place_id" if aggregate else "id"
+            )
+            logger.info(
+                f"[Node 2/6] Fused {len(result_lists)} sub-queries "
+                f"({', '.join(str(len(r)) for r in result_lists)} matches) into {len(results)} places"
+            )
+
+        if rerank and results:
+            results = self._rerank(results, keywords, center)
+
+        if len(results) > top_k:
+            results = await self._diversify(results, top_k) if mmr else results[:top_k]
+
+        # Empty results are not cached so newly loaded provinces show up immediately
+        if self.search_cache is not None and results:
+            self.search_cache.set(key, results, generation=generation)
+        return results
+
+    def _rerank(
+        self,
+        results: List[Dict[str, Any]],
+        keywords: List[str],
+        center: Optional[Tuple[float, float]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Reorder candidates by similarity, smoothed rating, centroid distance and keyword hits.
+
+        Args:
+            results: Candidate pool
+            keywords: Preference keywords searched in each place's name and snippet
+            center: Requested search center (default: centroid of the candidates)
+
+        Returns:
+            Candidates with an added "rerank_score", best first
+        """
+        metadata = [result.get("metadata") or {} for result in results]
+        similarity = np.array([result.get("rrf_score", result.get("score", 0.0)) or 0.0 for result in results])
+        ratings = np.array([float(meta.get("rating") or 0) for meta in metadata])
+        coords = np.array(
+            [[float(meta.get("latitude") or 0), float(meta.get("longitude") or 0)] for meta in metadata],
+            dtype=np.float64
+        ).reshape(-1, 2)
+
+        keyword_hits = np.zeros(len(results))
+        if keywords:
+            ordered = tuple(sorted(set(keywords), key=lambda keyword: (-len(keyword), keyword)))
+            findall = _keyword_pattern(ordered).findall
+            normalize = unicodedata.normalize
+            keyword_hits = np.fromiter(
+                (
+                    len(set(findall(normalize("NFC", f"{meta.get('name', '')} {meta.get('chunk_text', '')}".lower()))))
+                    for meta in metadata
+                ),
+                dtype=np.float64,
+                count=len(metadata),
+            )
+
+        scores = rerank_scores(
+            similarity,
+            ratings,
+            coords,
+            keyword_hits,
+            weights=(
+                settings.SEARCH_RERANK_WEIGHT_SIMILARITY,
+                settings.SEARCH_RERANK_WEIGHT_RATING,
+                settings.SEARCH_RERANK_WEIGHT_DISTANCE,
+                settings.SEARCH_RERANK_WEIGHT_KEYWORDS,
+            ),
+            rating_prior=settings.SEARCH_RERANK_RATING_PRIOR,
+            distance_scale_km=settings.SEARCH_RERANK_DISTANCE_SCALE_KM,
+            center=center
+        )
+        order = np.argsort(-scores, kind="stable")
+        return [{**results[index], "rerank_score": float(scores[index])} for index in order]
+
+    async def _diversify(self, results: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+        """
+        Pick a diverse top_k from the candidate pool with Maximal Marginal Relevance.
+
+        Candidate embeddings come from the province catalogue when cached, otherwise
+        they are fetched by vector ID from their province namespaces. Near-identical
+        venues (similar embeddings) and venues at the same spot
+        (SEARCH_MMR_GEO_RADIUS_KM) are penalized. Falls back to the top_k best
+        candidates if the vectors cannot be fetched.
+
+        Args:
+            results: Candidate pool, best first
+            top_k: Number of results to keep
+
+        Returns:
+            Selected results, best score first
+        """
+        vectors_by_id = self.catalogue.get_vectors(result["id"] for result in results) if self.catalogue else {}
+
+        ids_by_namespace: Dict[str, List[str]] = {}
+        for result in results:
+            if result["id"] in vectors_by_id:
+                continue
+            namespace = province_namespace((result.get("metadata") or {}).get("province"))
+            ids_by_namespace.setdefault(namespace, []).append(result["id"])
+
+        try:
+            fetched = await asyncio.gather(
+                *(
+                    self.vector_store.fetch_vectors(ids, namespace=namespace)
+                    for namespace, ids in ids_by_namespace.items()
+                )
+            )
+        except Exception as e:
+            logger.warning(f"[Node 2/6] MMR skipped, candidate vectors unavailable: {e}")
+            return results[:top_k]
+
+        vectors_by_id.update(
+            (vector_id, vector["values"]) for batch in fetched for vector_id, vector in batch.items()
+        )
+        dimension = next((len(values) for values in vectors_by_id.values() if values), 0)
+        if not dimension:
+            return results[:top_k]
+
+        zero = [0.0] * dimension
+        vectors = np.array([vectors_by_id.get(result["id"]) or zero for result in results], dtype=np.float64)
+        relevance = np.array(
+            [
+                result.get("rerank_score", result.get("rrf_score", result.get("score", 0.0))) or 0.0
+                for result in results
+            ],
+            dtype=np.float64
+        )
+        coords = np.array(
+            [
+                [
+                    float((result.get("metadata") or {}).get("latitude") or 0),
+                    float((result.get("metadata") or {}).get("longitude") or 0),
+                ]
+                for result in results
+            ],
+            dtype=np.float64
+        )
+
+        selected = mmr_select(
+            relevance,
+            vectors,
+            k=top_k,
+            lambda_=settings.SEARCH_MMR_LAMBDA,
+            coords=coords,
+            geo_weight=settings.SEARCH_MMR_GEO_WEIGHT,
+            geo_radius_km=settings.SEARCH_MMR_GEO_RADIUS_KM
+        )
+        logger.info(
+            f"[Node 2/6] MMR kept {len(selected)} of {len(results)} candidates "
+            f"({len(vectors_by_id)} vectors fetched)"
+        )
+        # Keep the relevance order for the prompt; MMR only decides membership
+        return [results[index] for index in sorted(selected)]
+
     async def search_places(self, state: TravelPlanningState) -> TravelPlanningState:
         """Node 2: Search for grounded, verified places with smart filtering."""
         try:
@@ -153,21 +586,19 @@ class SearchAgent:
             duration_days = travel_request.duration_days
             dynamic_top_k = self.calculate_dynamic_top_k(duration_days)
 
-            # Build semantic query focused on preferences
-            search_query = self._build_semantic_query(travel_request)
+            # Build one semantic query per preference
+            search_queries = self._build_semantic_queries(travel_request)
 
-            logger.info(f"[Node 2/6] Searching: {search_query} (duration: {duration_days} days, top_k: {dynamic_top_k})")
+            logger.info(f"[Node 2/6] Searching: {search_queries} (duration: {duration_days} days, top_k: {dynamic_top_k})")
 
-            # Generate embedding and search with filters
-            query_embedding = await self.embedding_service._generate_embedding(
-                search_query,
-                task_type=settings.EMBEDDING_TASK_TYPE_QUERY
-            )
-            results = await self.pinecone_service.search_places(
-                query_embedding=query_embedding,
-                top_k=dynamic_top_k,
-                province_filter=filters.get("province"),
-                filter_dict=filters.get("additional_filters", {})
+            provinces = filters.get("provinces") or ([filters["province"]] if filters.get("province") else [])
+            results = await self._search_with_cache(
+                search_queries,
+                provinces,
+                dynamic_top_k,
+                filters.get("additional_filters", {}),
+                keywords=self._get_rerank_keywords(travel_request),
+                search_area=filters.get("search_area")
             )
 
             logger.info(f"[Node 2/6] Found {len(results)} places")
@@ -185,7 +616,7 @@ class SearchAgent:
                 state["top_relevant_places"] = []
                 return state
 
-            # Preserve top places by Pinecone score (for descriptions) BEFORE clustering
+            # Preserve top places by vector score (for descriptions) BEFORE clustering
             top_by_score = sorted(results, key=lambda x: x.get('score', 0), reverse=True)[:5]
 
             try:
@@ -4,24 +4,56 @@ Data management API routes for ViVu Vietnam AI Service.
 This module provides endpoints for managing travel data in Pinecone vector database.
 """
 
+from typing import Dict, List, Optional, Set
+
 import structlog
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
 
 from app.api.schemas.place import PlaceUpsertRequest, PlaceUpsertResponse
+from app.core.config import settings
+from app.core.exceptions import DataLoadingError
 from app.services.data_management_service import get_data_management_service
+from app.services.ingestion_queue import IngestionJob, get_ingestion_queue
+from app.utils.json_stream import aiter_ndjson_lines
 from app.api.schemas import (
     PlaceUpsertResponse,
     PlaceUpsertRequest,
+    PlaceBulkUpsertResult,
+    PlaceBulkUpsertResponse,
     DataDeleteResponse,
+    DataBulkDeleteRequest,
+    DataBulkDeleteResponse,
+    IngestionJobResponse,
 )
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
+ASYNC_MODE_QUERY = Query(
+    False,
+    description="Queue the write and return 202 with a job ID instead of waiting for it",
+)
+QUEUED_RESPONSES = {202: {"model": IngestionJobResponse, "description": "Write queued"}}
+
+
+def _accepted(job: IngestionJob) -> JSONResponse:
+    """202 response for a queued write."""
+    return JSONResponse(status_code=202, content=IngestionJobResponse(**job.to_dict()).model_dump())
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """Summarize the first problem of a rejected bulk record."""
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first.get("loc", ()))
+    message = first.get("msg", str(error))
+    return f"Invalid record: {location}: {message}" if location else f"Invalid record: {message}"
+
 
-@router.post("/place/insert", response_model=PlaceUpsertResponse)
-async def insert_place(request: PlaceUpsertRequest):
+@router.post("/place/insert", response_model=PlaceUpsertResponse, responses=QUEUED_RESPONSES)
+async def insert_place(request: PlaceUpsertRequest, async_mode: bool = ASYNC_MODE_QUERY):
     """
     Insert or upsert a single place in Pinecone using optimized embedding service.
 
@@ -31,6 +63,7 @@ async def insert_place(request: PlaceUpsertRequest):
 
     Args:
         request: Place data to insert
+        async_mode: Queue the write (202 + job ID) instead of waiting for it
 
     Returns:
         PlaceInsertResponse: Success status and place ID
@@ -40,6 +73,9 @@ async def insert_place(request: PlaceUpsertRequest):
 
     logger.info(f"Inserting place", place_name=place_name, place_id=place_id)
 
+    if async_mode:
+        return _accepted(await get_ingestion_queue().submit_upsert(request.model_dump()))
+
     dm_service = get_data_management_service()
 
     place_dict = request.model_dump()
@@ -58,8 +94,8 @@ async def insert_place(request: PlaceUpsertRequest):
     )
 
 
-@router.put("/place/update", response_model=PlaceUpsertResponse)
-async def update_place(request: PlaceUpsertRequest):
+@router.put("/place/update", response_model=PlaceUpsertResponse, responses=QUEUED_RESPONSES)
+async def update_place(request: PlaceUpsertRequest, async_mode: bool = ASYNC_MODE_QUERY):
     """
     Update a single place in Pinecone using upsert operation.
 
@@ -68,6 +104,7 @@ async def update_place(request: PlaceUpsertRequest):
 
     Args:
         request: Updated place data
+        async_mode: Queue the write (202 + job ID) instead of waiting for it
 
     Returns:
         PlaceUpdateResponse: Success status and place ID
@@ -77,6 +114,9 @@ async def update_place(request: PlaceUpsertRequest):
 
     logger.info(f"Updating place", place_name=place_name, place_id=place_id)
 
+    if async_mode:
+        return _accepted(await get_ingestion_queue().submit_upsert(request.model_dump()))
+
     dm_service = get_data_management_service()
 
     place_dict = request.model_dump()
@@ -96,19 +136,165 @@ async def update_place(request: PlaceUpsertRequest):
     )
 
 
-@router.delete("/place/{item_id}", response_model=DataDeleteResponse)
-async def delete_data_item(item_id: str):
+@router.post(
+    "/places/bulk",
+    response_model=PlaceBulkUpsertResponse,
+    responses={
+        400: {
+            "model": PlaceBulkUpsertResponse,
+            "description": "Malformed body (see stream_error); records before the error were processed",
+        },
+        413: {
+            "model": PlaceBulkUpsertResponse,
+            "description": "More than BULK_UPSERT_MAX_RECORDS records; the first ones were processed (see results)",
+        },
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "description": "One PlaceUpsertRequest JSON object per line",
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def bulk_upsert_places(request: Request):
+    """
+    Insert or update many places from a streamed NDJSON body.
+
+    Each line is one PlaceUpsertRequest. Records are validated as they arrive and
+    fed straight into the batched ingestion pipeline, so chunks of different places
+    share embedding and upsert requests, and processing starts before the body has
+    been fully received. Invalid records are rejected individually.
+
+    A body with more than BULK_UPSERT_MAX_RECORDS records is answered with 413,
+    but records before the limit have already been written by then; the 413 body
+    is the usual response with truncated=true and their per-record results.
+    Likewise, a body that breaks off mid-stream (invalid UTF-8, over-long line)
+    is answered with 400 carrying stream_error and the results of the records
+    read before it.
+
+    Args:
+        request: Raw HTTP request with an NDJSON body
+
+    Returns:
+        PlaceBulkUpsertResponse: Per-record results in input order
+    """
+    logger.info("Bulk upserting places")
+
+    dm_service = get_data_management_service()
+    results: List[PlaceBulkUpsertResult] = []
+    # Pipeline ordinal → index into results (only valid records enter the pipeline)
+    result_index: Dict[int, int] = {}
+    seen_place_ids: Set[str] = set()
+    truncated = False
+    stream_error: Optional[str] = None
+
+    async def valid_places():
+        nonlocal truncated, stream_error
+        try:
+            async for line_number, line in aiter_ndjson_lines(request.stream()):
+                if len(results) >= settings.BULK_UPSERT_MAX_RECORDS:
+                    # Stop reading; places already fed to the pipeline still finish
+                    truncated = True
+                    return
+
+                try:
+                    place = PlaceUpsertRequest.model_validate_json(line)
+                except ValidationError as e:
+                    results.append(PlaceBulkUpsertResult(
+                        line=line_number,
+                        success=False,
+                        error=_format_validation_error(e),
+                    ))
+                    continue
+
+                # Two versions of one place in flight would race on its chunks
+                if place.googlePlaceId in seen_place_ids:
+                    results.append(PlaceBulkUpsertResult(
+                        line=line_number,
+                        place_id=place.googlePlaceId,
+                        success=False,
+                        error="Duplicate googlePlaceId in request",
+                    ))
+                    continue
+                seen_place_ids.add(place.googlePlaceId)
+
+                result_index[len(result_index)] = len(results)
+                results.append(PlaceBulkUpsertResult(
+                    line=line_number,
+                    place_id=place.googlePlaceId,
+                    success=False,
+                ))
+                yield place.model_dump()
+        except ValueError as e:
+            # Malformed body: stop reading, as for the record limit
+            stream_error = str(e)
+
+    def on_place_done(ordinal, place, success, error):
+        record = results[result_index[ordinal]]
+        record.success = success
+        record.error = error
+
+    try:
+        ingestion = await dm_service.ingest_places(valid_places(), on_place_done=on_place_done)
+    except DataLoadingError as e:
+        # Surface body problems (e.g. an oversized request) as client errors
+        if isinstance(e.__cause__, HTTPException):
+            raise e.__cause__
+        raise
+
+    succeeded = sum(1 for record in results if record.success)
+    failed = len(results) - succeeded
+
+    logger.info(
+        "Bulk upsert finished",
+        total=len(results),
+        succeeded=succeeded,
+        failed=failed,
+        truncated=truncated,
+        stream_error=stream_error,
+    )
+
+    message = f"Upserted {succeeded} of {len(results)} places"
+    if truncated:
+        message += f"; records after the first {settings.BULK_UPSERT_MAX_RECORDS} were not processed"
+    if stream_error:
+        message += f"; the rest of the body was not processed: {stream_error}"
+    response = PlaceBulkUpsertResponse(
+        success=failed == 0 and not truncated and stream_error is None,
+        message=message,
+        total=len(results),
+        succeeded=succeeded,
+        failed=failed,
+        truncated=truncated,
+        stream_error=stream_error,
+        elapsed_seconds=round(ingestion.elapsed_seconds, 3),
+        results=results,
+    )
+    if truncated:
+        return JSONResponse(status_code=413, content=response.model_dump())
+    if stream_error:
+        return JSONResponse(status_code=400, content=response.model_dump())
+    return response
+
+
+@router.delete("/place/{item_id}", response_model=DataDeleteResponse, responses=QUEUED_RESPONSES)
+async def delete_data_item(item_id: str, async_mode: bool = ASYNC_MODE_QUERY):
     """
     Delete a data item from Pinecone by ID.
 
     Args:
         item_id: Item ID to delete (path parameter)
+        async_mode: Queue the delete (202 + job ID) instead of waiting for it
 
     Returns:
         DataDeleteResponse: Success status
     """
     logger.info(f"Deleting item {item_id}", item_id=item_id)
 
+    if async_mode:
+        return _accepted(await get_ingestion_queue().submit_delete(item_id))
+
     dm_service = get_data_management_service()
     success = await dm_service.delete_place(item_id)
 
@@ -121,4 +307,52 @@ async def delete_data_item(item_id: str):
         success=True,
         message=f"Successfully deleted item {item_id}",
         item_id=item_id
-    )
\ No newline at end of file
+    )
+
+
+@router.post("/place/delete", response_model=DataBulkDeleteResponse)
+async def delete_data_items(request: DataBulkDeleteRequest):
+    """
+    Delete several places from Pinecone in one call.
+
+    Chunk vectors are addressed by ID and removed with batched delete requests.
+
+    Args:
+        request: Place IDs to delete
+
+    Returns:
+        DataBulkDeleteResponse: Deleted and failed place IDs
+    """
+    logger.info("Deleting items", items_count=len(request.place_ids))
+
+    dm_service = get_data_management_service()
+    results = await dm_service.delete_places(request.place_ids)
+
+    deleted = [place_id for place_id, success in results.items() if success]
+    failed = [place_id for place_id, success in results.items() if not success]
+
+    logger.info("Bulk delete finished", deleted=len(deleted), failed=len(failed))
+
+    return DataBulkDeleteResponse(
+        success=not failed,
+        message=f"Deleted {len(deleted)} of {len(results)} items",
+        deleted=deleted,
+        failed=failed,
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=IngestionJobResponse)
+async def get_job_status(job_id: str):
+    """
+    Get the status of a queued (async mode) data write.
+
+    Args:
+        job_id: Job ID returned by a 202 response
+
+    Returns:
+        IngestionJobResponse: Current job status
+    """
+    job = await get_ingestion_queue().get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return IngestionJobResponse(**job.to_dict())
@@ -5,9 +5,9 @@ This package contains request and response models for all API endpoints.
 Each schema class is in its own module for better organization.
 
 Structure:
-  - place.py         - PlaceUpsertRequest/Response
+  - place.py         - PlaceUpsertRequest/Response, PlaceBulkUpsertResult/Response
   - travel.py        - TravelRequest, TravelResponse
-  - data.py          - DataDeleteRequest/Response, DataBatchUploadResponse
+  - data.py          - DataDeleteResponse, DataBulkDeleteRequest/Response, IngestionJobResponse
   - system.py        - HealthCheckResponse, ErrorResponse
 """
 
@@ -27,11 +27,16 @@ from app.api.schemas.system import (
 from app.api.schemas.place import (
     PlaceUpsertRequest,
     PlaceUpsertResponse,
+    PlaceBulkUpsertResult,
+    PlaceBulkUpsertResponse,
 )
 
 # Generic Data Management Schemas
 from app.api.schemas.data import (
     DataDeleteResponse,
+    DataBulkDeleteRequest,
+    DataBulkDeleteResponse,
+    IngestionJobResponse,
 )
 
 # Export all schemas
@@ -47,8 +52,13 @@ __all__ = [
     # Place Data Management Schemas
     "PlaceUpsertRequest",
     "PlaceUpsertResponse",
+    "PlaceBulkUpsertResult",
+    "PlaceBulkUpsertResponse",
 
     # Generic Data Management Schemas
     "DataDeleteRequest",
     "DataDeleteResponse",
+    "DataBulkDeleteRequest",
+    "DataBulkDeleteResponse",
+    "IngestionJobResponse",
 ]
@@ -1,6 +1,6 @@
 """Generic data management schemas (delete, batch upload)."""
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -12,6 +12,43 @@ class DataDeleteResponse(BaseModel):
     message: str = Field(..., description="Result message")
     item_id: str = Field(..., description="Deleted item ID (Google Place ID)")
 
+
+class DataBulkDeleteRequest(BaseModel):
+    """Request schema for deleting several places at once."""
+
+    place_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Google Place IDs to delete",
+    )
+
+
+class DataBulkDeleteResponse(BaseModel):
+    """Response schema for bulk delete operations."""
+
+    success: bool = Field(..., description="True if every place was deleted")
+    message: str = Field(..., description="Result message")
+    deleted: List[str] = Field(default_factory=list, description="Deleted place IDs")
+    failed: List[str] = Field(default_factory=list, description="Place IDs that could not be deleted")
+
+
+class IngestionJobResponse(BaseModel):
+    """Status of a queued (async mode) data write."""
+
+    job_id: str = Field(..., description="Job ID")
+    place_id: str = Field(..., description="Google Place ID")
+    operation: str = Field(..., description="Write operation: upsert or delete")
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    coalesced: bool = Field(False, description="Superseded by a newer write to the same place before being applied")
+    error: Optional[str] = Field(None, description="Error message if the write failed")
+    created_at: float = Field(..., description="Submission time (Unix seconds)")
+    updated_at: float = Field(..., description="Last status change (Unix seconds)")
+
+
 __all__ = [
     "DataDeleteResponse",
+    "DataBulkDeleteRequest",
+    "DataBulkDeleteResponse",
+    "IngestionJobResponse",
 ]
@@ -1,5 +1,7 @@
 """Place-related API schemas with comprehensive validation."""
 
+from typing import List, Optional
+
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -108,7 +110,36 @@ class PlaceUpsertResponse(BaseModel):
     place_id: str = Field(..., description="Google Place ID of upserted place")
 
 
+class PlaceBulkUpsertResult(BaseModel):
+    """Outcome of one record in a bulk upsert."""
+
+    line: int = Field(..., description="1-based NDJSON line number of the record")
+    place_id: Optional[str] = Field(None, description="Google Place ID (if the record could be parsed)")
+    success: bool = Field(..., description="Whether the place was fully upserted")
+    error: Optional[str] = Field(None, description="Validation or ingestion error")
+
+
+class PlaceBulkUpsertResponse(BaseModel):
+    """Response schema for bulk place upserts."""
+
+    success: bool = Field(..., description="True if every record was upserted")
+    message: str = Field(..., description="Result message")
+    total: int = Field(..., description="Number of records received")
+    succeeded: int = Field(..., description="Number of places upserted")
+    failed: int = Field(..., description="Number of records rejected or failed")
+    truncated: bool = Field(
+        False, description="True if the body exceeded BULK_UPSERT_MAX_RECORDS and later records were not processed"
+    )
+    stream_error: Optional[str] = Field(
+        None, description="Why reading the body stopped early (e.g. invalid UTF-8); later records were not processed"
+    )
+    elapsed_seconds: float = Field(..., description="Processing time")
+    results: List[PlaceBulkUpsertResult] = Field(default_factory=list, description="Per-record results in input order")
+
+
 __all__ = [
     "PlaceUpsertRequest",
     "PlaceUpsertResponse",
+    "PlaceBulkUpsertResult",
+    "PlaceBulkUpsertResponse",
 ]
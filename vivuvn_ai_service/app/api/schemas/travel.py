@@ -3,7 +3,7 @@
 from datetime import date
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator, ValidationInfo
+from pydantic import BaseModel, Field, field_validator, model_validator, ValidationInfo
 
 # Import travel models from dedicated module
 from app.models.travel_models import (
@@ -68,6 +68,27 @@ class TravelRequest(BaseModel):
         description="Preferred mode of transportation",
         example="xe khách"
     )
+    center_latitude: Optional[float] = Field(
+        None,
+        description="Latitude of the area to stay around (e.g. the city center)",
+        example=16.0544,
+        ge=-90.0,
+        le=90.0
+    )
+    center_longitude: Optional[float] = Field(
+        None,
+        description="Longitude of the area to stay around",
+        example=108.2022,
+        ge=-180.0,
+        le=180.0
+    )
+    radius_km: Optional[float] = Field(
+        None,
+        description="Only suggest places within this distance of the center (default: SEARCH_DEFAULT_RADIUS_KM)",
+        example=20.0,
+        gt=0.0,
+        le=500.0
+    )
 
     @field_validator("end_date")
     @classmethod
@@ -109,6 +130,15 @@ class TravelRequest(BaseModel):
             raise ValueError(f"Invalid transportation mode: {v}")
         return v
 
+    @model_validator(mode="after")
+    def validate_search_area(self):
+        """Validate that the search center has both coordinates."""
+        if (self.center_latitude is None) != (self.center_longitude is None):
+            raise ValueError("center_latitude and center_longitude must be given together")
+        if self.radius_km is not None and self.center_latitude is None:
+            raise ValueError("radius_km requires center_latitude and center_longitude")
+        return self
+
     @property
     def duration_days(self) -> int:
         """Calculate trip duration in days."""
@@ -7,13 +7,16 @@ Provides retry logic, error handling, and structured logging.
 
 import asyncio
 import structlog
-from typing import Optional, List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, List
 
 from google import genai
 from google.genai import types
 from google.api_core import exceptions as google_exceptions
 
 from app.core.config import settings
+from app.utils.executors import ConcurrencyLimiter, get_limiter
+from app.utils.rate_limiter import TokenBucketRateLimiter
 
 logger = structlog.get_logger(__name__)
 
@@ -23,7 +26,7 @@ class GeminiClient:
     Wrapper around Google Gemini API client.
 
     Provides high-level methods for:
-    - Embedding generation (embed_content)
+    - Embedding generation (embed_content, batched embed_contents)
     - Content generation (generate_content)
 
     Handles initialization, error handling, and logging.
@@ -39,8 +42,35 @@ class GeminiClient:
         self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
         self.model = settings.GEMINI_MODEL
         self.embedding_model = settings.EMBEDDING_MODEL
+        # Every embedding API request (single or batch) consumes one token. Search
+        # queries have their own bucket, so they never queue behind a bulk load.
+        self.embed_rate_limiter = TokenBucketRateLimiter(
+            rate_per_minute=settings.GEMINI_EMBED_REQUESTS_PER_MINUTE
+        )
+        self.query_embed_rate_limiter = TokenBucketRateLimiter(
+            rate_per_minute=settings.GEMINI_QUERY_EMBED_REQUESTS_PER_MINUTE
+        )
+        # Native async calls (client.aio): separate generate/embed limits so bulk
+        # embeddings never hold generation slots, plus one global cap on top;
+        # in-flight requests cost coroutines, not threads
+        self.generate_limiter = get_limiter("gemini_generate")
+        self.embed_limiter = get_limiter("gemini_embed")
+        self.limiter = get_limiter("gemini")
         logger.info("Gemini client initialized successfully")
 
+    def _embed_rate_limiter(self, task_type: str) -> TokenBucketRateLimiter:
+        """Requests-per-minute bucket for an embedding task type."""
+        if task_type == settings.EMBEDDING_TASK_TYPE_QUERY:
+            return self.query_embed_rate_limiter
+        return self.embed_rate_limiter
+
+    @asynccontextmanager
+    async def _slot(self, limiter: ConcurrencyLimiter) -> AsyncIterator[None]:
+        """Hold a slot of the per-kind limiter, then of the global limiter."""
+        async with limiter.slot():
+            async with self.limiter.slot():
+                yield
+
     async def embed_content(
         self,
         text: str,
@@ -60,9 +90,9 @@ class GeminiClient:
             Exception: If embedding generation fails
         """
         try:
-            embedding = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.models.embed_content(
+            await self._embed_rate_limiter(task_type).acquire()
+            async with self._slot(self.embed_limiter):
+                embedding = await self.client.aio.models.embed_content(
                     model=self.embedding_model,
                     contents=text,
                     config=types.EmbedContentConfig(
@@ -70,7 +100,6 @@ class GeminiClient:
                         task_type=task_type
                     )
                 )
-            )
             return embedding.embeddings[0].values
 
         except Exception as e:
@@ -84,6 +113,76 @@ class GeminiClient:
             )
             raise
 
+    async def embed_contents(
+        self,
+        texts: List[str],
+        task_type: str = "RETRIEVAL_DOCUMENT"
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for many texts using batched Gemini API requests.
+
+        Texts are packed into requests of up to EMBEDDING_BATCH_SIZE contents
+        (the API's per-request limit), so N texts cost ceil(N / batch size)
+        round trips instead of N. Each request is paced by the requests-per-minute
+        limiter of its task type (documents and queries have separate budgets).
+
+        Args:
+            texts: Texts to embed
+            task_type: Task type for embedding (RETRIEVAL_DOCUMENT or RETRIEVAL_QUERY)
+
+        Returns:
+            Embedding vectors in the same order as the input texts
+
+        Raises:
+            Exception: If any batch fails
+        """
+        if not texts:
+            return []
+
+        batch_size = max(1, settings.EMBEDDING_BATCH_SIZE)
+        embeddings: List[List[float]] = []
+
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            try:
+                await self._embed_rate_limiter(task_type).acquire()
+                async with self._slot(self.embed_limiter):
+                    response = await self.client.aio.models.embed_content(
+                        model=self.embedding_model,
+                        contents=batch,
+                        config=types.EmbedContentConfig(
+                            output_dimensionality=settings.VECTOR_DIMENSION,
+                            task_type=task_type
+                        )
+                    )
+            except Exception as e:
+                logger.error(
+                    "Gemini batch embedding generation failed",
+                    error=str(e),
+                    error_code="GEMINI_EMBEDDING_ERROR",
+                    task_type=task_type,
+                    batch_start=start,
+                    batch_size=len(batch),
+                    exc_info=True
+                )
+                raise
+
+            if len(response.embeddings) != len(batch):
+                raise ValueError(
+                    f"Gemini returned {len(response.embeddings)} embeddings "
+                    f"for a batch of {len(batch)} texts"
+                )
+
+            embeddings.extend(embedding.values for embedding in response.embeddings)
+
+        logger.debug(
+            "Batch embeddings generated",
+            texts=len(texts),
+            requests=(len(texts) + batch_size - 1) // batch_size,
+            task_type=task_type
+        )
+        return embeddings
+
     async def generate_content(
         self,
         config: types.GenerateContentConfig,
@@ -107,14 +206,13 @@ class GeminiClient:
             Exception: If generation fails after retries
         """
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.models.generate_content(
+            # The slot is released before any retry backoff sleep
+            async with self._slot(self.generate_limiter):
+                response = await self.client.aio.models.generate_content(
                     model=self.model,
                     config=config,
                     contents=contents
                 )
-            )
             return response
 
         except google_exceptions.ServiceUnavailable as e:
@@ -27,18 +27,71 @@ class Settings(BaseSettings):
     # Gemini Embedding Task Types (for optimization)
     EMBEDDING_TASK_TYPE_DOCUMENT: str = "RETRIEVAL_DOCUMENT"  # For storing documents in vector DB
     EMBEDDING_TASK_TYPE_QUERY: str = "RETRIEVAL_QUERY"       # For user search queries
+    EMBEDDING_BATCH_SIZE: int = 100  # Max texts per batch embedding request (API per-request limit)
+
+    # Persistent embedding cache (SQLite, content-addressed, LRU eviction)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = "data/cache/embedding_cache.sqlite3"
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 200_000
+
+    # In-process query embedding cache (LRU + TTL, pre-warmed at startup)
+    QUERY_EMBEDDING_CACHE_SIZE: int = 1024
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: float = 86400.0
+    QUERY_EMBEDDING_PREWARM: bool = True
+
+    # In-process search-result cache ((provinces, query, top_k, filter) → matches)
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_SIZE: int = 512
+    SEARCH_CACHE_TTL_SECONDS: float = 600.0  # Bounds staleness for writes made by other processes
+
+    # In-memory catalogue of small provinces (place metadata + chunk vectors from the
+    # chunk manifest); provinces with at most top_k places are ranked in-process.
+    # Enable once the chunk manifest covers every indexed place.
+    PROVINCE_CATALOGUE_ENABLED: bool = False
+    PROVINCE_CATALOGUE_TTL_SECONDS: float = 600.0  # Bounds staleness for writes made by other processes
+
+    # Ingestion pipeline (chunk → embed → upsert, connected by bounded queues)
+    GEMINI_EMBED_REQUESTS_PER_MINUTE: int = 100  # Document (ingestion) embedding quota (0 disables the limiter)
+    GEMINI_QUERY_EMBED_REQUESTS_PER_MINUTE: int = 50  # Separate search-query embedding budget (0: unlimited)
+    INGEST_EMBED_WORKERS: int = 4      # Concurrent embedding requests
+    INGEST_UPSERT_WORKERS: int = 2     # Concurrent vector upserts
+    INGEST_QUEUE_SIZE: int = 8         # Max pending batches between stages (backpressure)
+    BULK_UPSERT_MAX_RECORDS: int = 5000  # Max NDJSON records per bulk upsert request
+
+    # Write-behind queue for async-mode data writes
+    WRITE_QUEUE_DEBOUNCE_SECONDS: float = 2.0   # Quiet period before a place is written
+    WRITE_QUEUE_MAX_DELAY_SECONDS: float = 10.0  # Longest a write may be deferred by new edits
+    WRITE_QUEUE_MAX_BATCH_PLACES: int = 200     # Places applied per worker batch
+    WRITE_QUEUE_JOB_RETENTION: int = 10_000     # Finished jobs kept for status lookups
+    WRITE_QUEUE_DB_PATH: str = "data/cache/write_queue.sqlite3"  # Jobs and pending writes, shared by workers
+
+    # Chunk manifest (place_id → chunk count/province) for orphan-free upserts and ID-based deletes
+    CHUNK_MANIFEST_PATH: str = "data/cache/chunk_manifest.sqlite3"
+    CHUNK_MANIFEST_REMOTE_FALLBACK: bool = True  # Read chunk_0 metadata for places not in the manifest
+
+    # Vector backend: "pinecone" (remote serverless index) or "local" (in-process NumPy index)
+    VECTOR_BACKEND: str = "pinecone"
+    LOCAL_VECTOR_STORE_PATH: str = "data/vector_store"  # Empty: memory-only local store
+    LOCAL_VECTOR_STORE_QUANTIZATION: str = "float32"  # On-disk scan format: "float32" or "int8"
+    LOCAL_VECTOR_STORE_RESCORE_FACTOR: int = 4        # int8 candidates per result rescored in float32
+    LOCAL_VECTOR_STORE_RELOAD_SECONDS: float = 5.0    # Check for versions published by other workers
+    LOCAL_VECTOR_STORE_KEEP_VERSIONS: int = 2         # Published index versions kept on disk
+    LOCAL_VECTOR_STORE_FLUSH_DELAY_SECONDS: float = 2.0  # Debounce for publishing single API writes (0: immediate)
 
     # Pinecone Configuration (Serverless)
     PINECONE_API_KEY: Optional[str] = None
     PINECONE_INDEX_NAME: str = "vivuvn-travel"
     PINECONE_CLOUD: str = "aws"  # AWS, GCP, or Azure
     PINECONE_REGION: str = "us-east-1"  # Region for serverless
+    PINECONE_EXECUTOR_WORKERS: int = 8  # Dedicated threads for Pinecone SDK calls
 
     # Pinecone Query Optimization
     PINECONE_INCLUDE_VALUES: bool = False  # Don't return vectors in query results
     PINECONE_SHOW_PROGRESS: bool = False   # Disable progress tracking in production
     PINECONE_METRIC: str = "cosine"        # Explicit similarity metric
     PINECONE_DEFAULT_NAMESPACE: str = "travel_location"   # Namespace for travel/location data
+    PINECONE_NAMESPACE_PER_PROVINCE: bool = False  # One namespace per province ("<default>_<province slug>");
+                                                   # run migrate_namespaces.py when switching an existing index
 
     # Dynamic top_k Configuration (optimized for token efficiency)
     VECTOR_SEARCH_BASE_K: int = 8          # Baseline places for any search
@@ -47,9 +100,57 @@ class Settings(BaseSettings):
     VECTOR_SEARCH_ACTIVITIES_PER_DAY: float = 3.0  # Activities per day (reduced from 3.5)
     VECTOR_SEARCH_DIVERSITY_FACTOR: float = 1.5    # Diversity factor (reduced from 2.0 for efficiency)
 
+    # Multi-preference retrieval (one sub-query per preference, merged by reciprocal-rank fusion)
+    SEARCH_MAX_PREFERENCE_QUERIES: int = 4     # Preferences searched separately (the rest are ignored)
+    SEARCH_RRF_K: int = 60                     # RRF rank constant
+    SEARCH_PREFERENCE_QUOTA_SHARE: float = 0.5  # Share of top_k reserved, split evenly across preferences
+
+    # Place-level results: over-fetch chunks, collapse them to distinct places
+    SEARCH_AGGREGATE_BY_PLACE: bool = True
+    SEARCH_OVERFETCH_FACTOR: float = 2.0  # Chunks fetched per requested place
+    SEARCH_PLACE_SCORE_MODE: str = "max"  # Place score from its chunks: "max" or "sum"
+
+    # Search every indexed province named in a destination ("Hà Nội, Ninh Bình");
+    # off: only the first one. Parts that are not indexed provinces are never split off
+    SEARCH_MULTI_PROVINCE_DESTINATIONS: bool = False
+
+    # Radius around a request's center_latitude/center_longitude when it gives no radius_km
+    SEARCH_DEFAULT_RADIUS_KM: float = 25.0
+
+    # Candidates kept per final place for the rerank/MMR stages below
+    SEARCH_CANDIDATE_POOL_FACTOR: float = 2.0
+
+    # Local reranking of the candidate pool (weighted sum of features in [0, 1])
+    SEARCH_RERANK_ENABLED: bool = True
+    SEARCH_RERANK_WEIGHT_SIMILARITY: float = 0.6  # Retrieval score (min-max normalized)
+    SEARCH_RERANK_WEIGHT_RATING: float = 0.2      # Bayesian-smoothed rating / 5
+    SEARCH_RERANK_WEIGHT_DISTANCE: float = 0.1    # Closeness to the destination centroid
+    SEARCH_RERANK_WEIGHT_KEYWORDS: float = 0.1    # Preference keywords in name/snippet
+    SEARCH_RERANK_RATING_PRIOR: float = 2.0       # Pseudo-ratings at the candidates' mean rating
+    SEARCH_RERANK_DISTANCE_SCALE_KM: float = 10.0  # Closeness decay distance
+
+    # MMR diversification of the final place list (near-duplicate and co-located venues)
+    SEARCH_MMR_ENABLED: bool = True
+    SEARCH_MMR_LAMBDA: float = 0.7        # 1.0 = pure relevance, lower = more diverse
+    SEARCH_MMR_GEO_WEIGHT: float = 0.3    # Share of redundancy from geographic proximity
+    SEARCH_MMR_GEO_RADIUS_KM: float = 1.0  # Proximity decay distance
+
+    # Hybrid sparse (local BM25) + dense retrieval. Pinecone needs PINECONE_METRIC="dotproduct"
+    # for native sparse-dense queries; otherwise keyword matches are merged in-process.
+    HYBRID_SEARCH_ENABLED: bool = False
+    HYBRID_SEARCH_ALPHA: float = 0.75       # Dense weight (1 - alpha goes to the BM25 score)
+    HYBRID_SPARSE_CANDIDATES: int = 50      # Keyword-only candidates merged by the in-process fallback
+    SPARSE_ENCODER_PATH: str = "data/cache/bm25_encoder.sqlite3"  # Empty: memory-only
+    BM25_K1: float = 1.2
+    BM25_B: float = 0.75
+    BM25_AVG_DOC_LENGTH: float = 300.0      # Reference chunk length in tokens for length normalization
+
     # AI Configuration (Updated to use google-genai v0.12+)
     GEMINI_API_KEY: Optional[str] = None
     GEMINI_MODEL: str = "gemini-2.5-flash"
+    GEMINI_GENERATE_MAX_CONCURRENT_REQUESTS: int = 48  # In-flight itinerary generations
+    GEMINI_EMBED_MAX_CONCURRENT_REQUESTS: int = 16     # In-flight embedding requests (ingestion + queries)
+    GEMINI_MAX_CONCURRENT_REQUESTS: int = 64  # Global cap on in-flight Gemini requests (generate + embed)
 
     # OpenWeather API Configuration
     OPENWEATHER_API_KEY: Optional[str] = None
@@ -17,6 +17,10 @@ from app.core.middleware import register_middleware
 from app.api.routes.travel_planner import router as travel_router
 from app.api.routes.data_management import router as data_router
 from app.api.schemas import HealthCheckResponse
+from app.services.data_management_service import close_data_management_service
+from app.services.ingestion_queue import get_ingestion_queue
+from app.services.vector_store import close_vector_store, get_vector_store
+from app.utils.executors import get_executor_stats, shutdown_executors
 
 # Configure structured logging
 structlog.configure(
@@ -70,6 +74,27 @@ async def lifespan(app: FastAPI):
     logger.info("Starting ViVu Vietnam AI Service")
     
     try:
+        if settings.VECTOR_BACKEND.lower() == "local" or settings.PINECONE_API_KEY:
+            try:
+                # Resolve the vector index handle once, off the request path
+                await get_vector_store().initialize()
+                logger.info("Vector store initialized", backend=settings.VECTOR_BACKEND)
+            except Exception as e:
+                # Not fatal: the first vector operation retries initialization
+                logger.warning("Vector store initialization failed", error=str(e))
+
+        if settings.QUERY_EMBEDDING_PREWARM and settings.GEMINI_API_KEY:
+            try:
+                from app.agents import get_travel_agent
+
+                warmed = await get_travel_agent().search_agent.warm_query_cache()
+                logger.info("Query embedding cache pre-warmed", queries=warmed)
+            except Exception as e:
+                # Not fatal: searches fall back to on-demand query embedding
+                logger.warning("Query embedding cache pre-warm failed", error=str(e))
+
+        await get_ingestion_queue().start()
+
         logger.info("AI service initialization completed")
         logger.info("Application startup completed successfully")
         
@@ -82,6 +107,13 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down ViVu Vietnam AI Service")
     
     try:
+        # Apply writes still waiting in the write-behind queue before exiting
+        await get_ingestion_queue().stop()
+
+        await close_data_management_service()
+        await close_vector_store()
+        shutdown_executors()
+
         logger.info("AI service cleanup completed")
         logger.info("Application shutdown completed successfully")
         
@@ -151,6 +183,17 @@ async def root():
     }
 
 
+@app.get("/metrics/executors")
+async def executor_metrics():
+    """
+    Queue depth, utilization and wait/run latency of the per-dependency executors.
+
+    A growing "queued" count or wait_ms_p95 means calls to that dependency are
+    waiting for a free worker thread.
+    """
+    return get_executor_stats()
+
+
 # Register API routes
 app.include_router(
     travel_router,
@@ -0,0 +1,176 @@
+"""
+Local chunk manifest for indexed places.
+
+Records, for every place written to the vector index, how many chunk vectors it
+has (`place_<id>_chunk_0 .. place_<id>_chunk_<n-1>`) and its province. This lets
+the upsert path delete surplus chunks when a description shrinks, and the delete
+path address every chunk by deterministic ID, without scanning the index.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+def chunk_vector_id(place_id: str, chunk_index: int) -> str:
+    """Build the deterministic vector ID of a place chunk."""
+    return f"place_{place_id}_chunk_{chunk_index}"
+
+
+def chunk_vector_ids(place_id: str, chunk_count: int, start: int = 0) -> List[str]:
+    """Build vector IDs for chunks start..chunk_count-1 of a place."""
+    return [chunk_vector_id(place_id, i) for i in range(start, chunk_count)]
+
+
+class ChunkManifest:
+    """
+    SQLite-backed map of place_id → (chunk_count, province).
+
+    Methods are synchronous and thread-safe; async callers should run them
+    through asyncio.to_thread.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the manifest database.
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS places (
+                place_id TEXT PRIMARY KEY,
+                chunk_count INTEGER NOT NULL,
+                province TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_places_province ON places(province)")
+        self._conn.commit()
+
+        logger.info("Chunk manifest opened", path=path)
+
+    def get_many(self, place_ids: Sequence[str]) -> Dict[str, Tuple[int, Optional[str]]]:
+        """
+        Look up chunk counts and provinces.
+
+        Args:
+            place_ids: Google Place IDs
+
+        Returns:
+            Dict mapping known place IDs to (chunk_count, province)
+        """
+        found: Dict[str, Tuple[int, Optional[str]]] = {}
+        unique_ids = list(dict.fromkeys(place_ids))
+
+        with self._lock:
+            for start in range(0, len(unique_ids), 500):
+                batch = unique_ids[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT place_id, chunk_count, province FROM places WHERE place_id IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for place_id, chunk_count, province in rows:
+                    found[place_id] = (chunk_count, province)
+
+        return found
+
+    def set_many(self, entries: Iterable[Tuple[str, int, Optional[str]]]) -> None:
+        """
+        Record chunk counts for places.
+
+        Args:
+            entries: (place_id, chunk_count, province) tuples
+        """
+        now = time.time()
+        rows = [(place_id, chunk_count, province, now) for place_id, chunk_count, province in entries]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO places (place_id, chunk_count, province, updated_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def delete_many(self, place_ids: Sequence[str]) -> None:
+        """Forget places (after their vectors were deleted)."""
+        if not place_ids:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM places WHERE place_id = ?",
+                [(place_id,) for place_id in place_ids],
+            )
+            self._conn.commit()
+
+    def list_province(self, province: str) -> Dict[str, int]:
+        """
+        List the places of one province.
+
+        Args:
+            province: Province name as stored in place metadata
+
+        Returns:
+            Dict mapping place IDs to chunk counts
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT place_id, chunk_count FROM places WHERE province = ?",
+                (province,),
+            ).fetchall()
+        return {place_id: chunk_count for place_id, chunk_count in rows}
+
+    def province_counts(self) -> Dict[Optional[str], int]:
+        """Number of places per province."""
+        with self._lock:
+            rows = self._conn.execute("SELECT province, COUNT(*) FROM places GROUP BY province").fetchall()
+        return {province: count for province, count in rows}
+
+    def count(self) -> int:
+        """Number of places in the manifest."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+
+
+# Global manifest instance
+_chunk_manifest: Optional[ChunkManifest] = None
+
+
+def get_chunk_manifest() -> ChunkManifest:
+    """
+    Get global chunk manifest instance.
+
+    Returns:
+        ChunkManifest: Manifest stored at CHUNK_MANIFEST_PATH
+    """
+    global _chunk_manifest
+    if _chunk_manifest is None:
+        _chunk_manifest = ChunkManifest(settings.CHUNK_MANIFEST_PATH)
+    return _chunk_manifest
+
+
+__all__ = ["ChunkManifest", "chunk_vector_id", "chunk_vector_ids", "get_chunk_manifest"]
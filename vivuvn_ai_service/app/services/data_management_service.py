@@ -2,7 +2,7 @@
 Data management service for ViVu Vietnam AI Service.
 
 This service orchestrates data operations (insert, update, delete) by coordinating
-embedding generation and Pinecone vector storage. It replaces the previous data_loader
+embedding generation and vector storage (Pinecone or the local vector store). It replaces the previous data_loader
 utility and implements proper 3-layer architecture.
 
 Responsibilities:
@@ -12,15 +12,27 @@ Responsibilities:
 - Statistics aggregation
 """
 
-import json
+import asyncio
 import structlog
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
 
 from app.core.exceptions import DataLoadingError
 from app.core.config import settings
-from app.services.pinecone_service import get_pinecone_service
+from app.services.vector_store import get_vector_store, province_namespace
 from app.services.embedding_service import get_embedding_service
-from app.utils.helpers import chunk_list
+from app.services.chunk_manifest import chunk_vector_id, chunk_vector_ids, get_chunk_manifest
+from app.services.ingestion_pipeline import (
+    IngestionPipeline,
+    IngestionResult,
+    PlaceDoneFn,
+    PlaceSource,
+    ProgressFn,
+)
+from app.services.ingestion_checkpoint import IngestionCheckpoint
+from app.services.province_catalogue import get_province_catalogue
+from app.services.search_cache import get_search_cache
+from app.services.sparse_encoder import get_sparse_encoder
+from app.utils.json_stream import iter_places_from_file
 
 logger = structlog.get_logger(__name__)
 
@@ -31,7 +43,7 @@ class DataManagementService:
 
     Orchestrates embedding generation and vector storage operations. Handles:
     - Single place insert/update
-    - Batch place processing
+    - Concurrent, rate-limited batch ingestion (chunk → embed → upsert pipeline)
     - Place deletion with all chunks
     - JSON file loading with province structure
 
@@ -42,9 +54,21 @@ class DataManagementService:
     """
 
     def __init__(self):
-        """Initialize with embedding and pinecone services."""
-        self.pinecone_service = get_pinecone_service()
+        """Initialize with embedding service and vector store."""
+        self.vector_store = get_vector_store()
         self.embedding_service = get_embedding_service()
+        self.chunk_manifest = get_chunk_manifest()
+        self.search_cache = get_search_cache()
+        self.province_catalogue = get_province_catalogue()
+        self.sparse_encoder = get_sparse_encoder()
+        # Pending debounced flush after single-place writes
+        self._flush_task: Optional[asyncio.Task] = None
+        self.ingestion_pipeline = IngestionPipeline(
+            embedding_service=self.embedding_service,
+            upsert_fn=self.vector_store.upsert_place_vectors,
+            prepare_fn=self._prepare_place_entries,
+            commit_fn=self._commit_place_entries,
+        )
         logger.info("DataManagementService initialized")
 
     async def upsert_place(self, place_data: Dict[str, Any]) -> bool:
@@ -55,9 +79,14 @@ class DataManagementService:
         - Inserting new places
         - Overwriting existing places (if googlePlaceId already exists)
 
-        The upsert operation will:
+        The place runs through the same ingestion pipeline as batch loads
+        (ingest_places), which will:
         1. Generate embeddings with chunking
-        2. Upsert vectors to Pinecone (automatically overwrites old vectors)
+        2. Look up the place's previous chunk count (chunk manifest)
+        3. Upsert vectors to Pinecone (automatically overwrites old vectors)
+        4. Delete surplus chunks if the description shrank, and record the new count
+
+        Unlike batch loads, the local-store flush is debounced (see _schedule_flush).
 
         Args:
             place_data: Place data dictionary with fields:
@@ -72,183 +101,209 @@ class DataManagementService:
 
         Returns:
             bool: True if successfully upserted, False otherwise
-
-        Raises:
-            Exception: If critical error occurs during upsert
         """
-        try:
-            place_name = place_data.get("name", "unknown")
-            place_id = place_data.get("googlePlaceId")
+        place_name = place_data.get("name", "unknown")
+        place_id = place_data.get("googlePlaceId")
+        logger.info("Upserting place", place_name=place_name, place_id=place_id)
 
-            logger.info(
-                "Upserting place",
-                place_name=place_name,
-                place_id=place_id,
+        errors: List[Optional[str]] = []
+        try:
+            result = await self.ingest_places(
+                [place_data],
+                on_place_done=lambda ordinal, place, success, error: errors.append(error),
+                flush=False,
             )
+        except DataLoadingError as e:
+            logger.error("Failed to upsert place", place_name=place_name, place_id=place_id, error=str(e))
+            return False
 
-            # Generate embeddings with chunking
-            place_vectors = await self.embedding_service.process_place(place_data)
-
-            if not place_vectors:
-                logger.warning(
-                    "No vectors generated for place",
-                    place_name=place_name,
-                    place_id=place_id,
-                )
-                return False
-
-            # Upsert to Pinecone (handles both insert and update automatically)
-            success = await self.pinecone_service.upsert_vectors(vectors=place_vectors)
-
-            if success:
-                logger.info(
-                    "Successfully upserted place",
-                    place_id=place_id,
-                    place_name=place_name,
-                    vectors_count=len(place_vectors),
-                )
-            else:
-                logger.error(
-                    "Failed to upsert vectors for place",
-                    place_id=place_id,
-                    place_name=place_name,
-                )
-
-            return success
-
-        except Exception as e:
+        if result.loaded_places != 1:
             logger.error(
                 "Failed to upsert place",
-                place_name=place_data.get("name", "unknown"),
-                place_id=place_data.get("googlePlaceId"),
-                error=str(e),
+                place_name=place_name,
+                place_id=place_id,
+                error=next((error for error in errors if error), "No vectors generated"),
             )
             return False
 
+        logger.info(
+            "Successfully upserted place",
+            place_id=place_id,
+            place_name=place_name,
+            vectors_count=result.total_vectors,
+        )
+        return True
+
     async def insert_places_batch(
-        self, places: List[Dict[str, Any]], batch_size: int = 50
+        self,
+        places: PlaceSource,
+        on_place_done: Optional[PlaceDoneFn] = None,
     ) -> int:
         """
-        Insert multiple places in batches.
+        Insert multiple places through the concurrent ingestion pipeline.
 
-        This method processes places in batches to manage memory and API rate limits.
-        Individual place failures don't stop batch processing.
+        Individual place failures don't stop processing.
 
         Args:
-            places: List of place data dictionaries
-            batch_size: Number of places to process per batch (default: 50)
+            places: Iterable or async iterable of place data dictionaries (consumed lazily)
+            on_place_done: Optional callback(ordinal, place, success, error) per place
 
         Returns:
             int: Number of places successfully inserted
 
         Raises:
-            DataLoadingError: If batch upsert fails (critical error)
+            DataLoadingError: If the place source cannot be read
         """
-        logger.info(
-            "Batch insert started",
-            total_places=len(places),
-            batch_size=batch_size,
-        )
-
-        total_loaded = 0
-        place_chunks = chunk_list(places, batch_size)
-
-        for i, chunk in enumerate(place_chunks, 1):
-            try:
-                loaded_count = await self._process_places_batch(chunk)
-                total_loaded += loaded_count
-                logger.info(
-                    "Batch processed",
-                    batch_num=i,
-                    batch_size=len(chunk),
-                    loaded=loaded_count,
-                )
-            except Exception as e:
-                logger.error(
-                    "Batch processing failed",
-                    batch_num=i,
-                    error=str(e),
-                )
-                # Continue processing remaining batches
-
-        logger.info(
-            "Batch insert completed",
-            total_loaded=total_loaded,
-            total_batches=len(list(place_chunks)),
-        )
-        return total_loaded
-
-    async def _process_places_batch(self, places: List[Dict[str, Any]]) -> int:
+        result = await self.ingest_places(places, on_place_done=on_place_done)
+        return result.loaded_places
+
+    async def ingest_places(
+        self,
+        places: PlaceSource,
+        on_place_done: Optional[PlaceDoneFn] = None,
+        on_progress: Optional[ProgressFn] = None,
+        flush: bool = True,
+    ) -> IngestionResult:
         """
-        Process a batch of places (internal method).
+        Run places through the concurrent ingestion pipeline.
 
-        Generates embeddings for all places, then upserts vectors in sub-batches
-        to Pinecone to manage API rate limits.
+        Chunking, batched embedding (INGEST_EMBED_WORKERS concurrent requests paced by
+        the Gemini RPM limiter) and upserting (INGEST_UPSERT_WORKERS writers) run as
+        overlapping stages connected by bounded queues. Places are consumed lazily,
+        so generators (e.g. a streaming file reader) are never fully materialized.
 
         Args:
-            places: List of place dictionaries to process
+            places: Iterable or async iterable of place data dictionaries
+            on_place_done: Optional callback(ordinal, place, success, error) per place
+            on_progress: Optional callback(result) with live counts (e.g. IngestionProgress)
+            flush: Flush buffered writes when the run ends (False: debounced flush)
 
         Returns:
-            int: Number of places successfully processed
+            IngestionResult: Counts and timing for the run
 
         Raises:
-            DataLoadingError: If batch upsert fails
+            DataLoadingError: If the place source cannot be read
         """
-        loaded_count = 0
-        vectors_to_upsert = []
+        logger.info("Batch insert started")
 
-        # Generate embeddings for all places in batch
-        for place_data in places:
-            try:
-                place_vectors = await self.embedding_service.process_place(place_data)
-                if place_vectors:
-                    vectors_to_upsert.extend(place_vectors)
-                    loaded_count += 1
-            except Exception as e:
-                logger.warning(
-                    "Failed to process place",
-                    place_name=place_data.get("name", "unknown"),
-                    error=str(e),
-                )
-                continue
-
-        # Batch upsert to Pinecone with sub-batching
-        if vectors_to_upsert:
-            batch_size = 100
-            for i in range(0, len(vectors_to_upsert), batch_size):
-                batch = vectors_to_upsert[i : i + batch_size]
-                try:
-                    success = await self.pinecone_service.upsert_vectors(vectors=batch)
-
-                    if not success:
-                        logger.error(
-                            "Failed to upsert batch",
-                            batch_num=i // batch_size + 1,
-                        )
-                        raise DataLoadingError("Batch upsert failed")
-
-                    logger.debug(
-                        "Batch upserted",
-                        batch_num=i // batch_size + 1,
-                        vectors_count=len(batch),
-                    )
-                except DataLoadingError:
-                    raise
-                except Exception as e:
-                    logger.error(
-                        "Error upserting batch",
-                        batch_num=i // batch_size + 1,
-                        error=str(e),
+        try:
+            result = await self.ingestion_pipeline.run(
+                places, on_place_done=on_place_done, on_progress=on_progress
+            )
+        except Exception as e:
+            logger.error("Batch insert aborted", error=str(e))
+            raise DataLoadingError(f"Batch insert failed: {str(e)}", operation="insert_places_batch") from e
+        finally:
+            if flush:
+                await self._flush_vector_store()
+            else:
+                self._schedule_flush()
+
+        logger.info("Batch insert completed", **result.to_dict())
+        return result
+
+    async def _prepare_place_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Annotate place entries with their previous chunk counts.
+
+        Must run before the new chunks are upserted. Counts (and the province the
+        chunks were written under) come from the local chunk manifest; places missing
+        from it fall back to the `total_chunks` metadata of their existing chunk 0
+        (one fetch per namespace for the whole batch).
+
+        Args:
+            entries: Place entries ({"place_id", "province", "chunk_count"}), updated in place
+        """
+        place_ids = [entry["place_id"] for entry in entries if entry.get("place_id")]
+        try:
+            known = await asyncio.to_thread(self.chunk_manifest.get_many, place_ids)
+
+            remote: Dict[str, int] = {}
+            missing_by_namespace: Dict[str, List[str]] = {}
+            for entry in entries:
+                place_id = entry.get("place_id")
+                if place_id and place_id not in known:
+                    namespace = province_namespace(entry.get("province"))
+                    missing_by_namespace.setdefault(namespace, []).append(place_id)
+
+            if missing_by_namespace and settings.CHUNK_MANIFEST_REMOTE_FALLBACK:
+                for namespace, missing in missing_by_namespace.items():
+                    metadata = await self.vector_store.fetch_metadata(
+                        [chunk_vector_id(place_id, 0) for place_id in missing],
+                        namespace=namespace,
                     )
-                    raise DataLoadingError(f"Batch upsert failed: {str(e)}")
+                    for place_id in missing:
+                        chunk_metadata = metadata.get(chunk_vector_id(place_id, 0))
+                        if chunk_metadata:
+                            remote[place_id] = int(chunk_metadata.get("total_chunks", 1) or 1)
+        except Exception as e:
+            # Without previous counts we only lose surplus cleanup, never the upsert itself
+            logger.warning("Failed to look up previous chunk counts", places=len(place_ids), error=str(e))
+            return
+
+        for entry in entries:
+            place_id = entry.get("place_id")
+            if place_id in known:
+                entry["previous_chunk_count"], entry["previous_province"] = known[place_id]
+            else:
+                entry["previous_chunk_count"] = remote.get(place_id, 0)
+                entry["previous_province"] = entry.get("province")
 
-            logger.info(
-                "Batch upsert completed",
-                total_vectors=len(vectors_to_upsert),
-                total_places=loaded_count,
+    async def _commit_place_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Finalize places whose new chunks are fully upserted.
+
+        Deletes surplus chunk IDs left over when a description shrank (e.g. chunks
+        2-4 after going from 5 chunks to 2), registers the new chunks with the
+        sparse encoder and records the new chunk counts. With
+        per-province namespaces, a place that moved to another province has all of
+        its old chunks deleted from the previous province's namespace. Cached
+        searches of the affected provinces are invalidated.
+
+        Args:
+            entries: Place entries annotated by _prepare_place_entries
+
+        Raises:
+            DataLoadingError: If surplus chunks cannot be deleted
+        """
+        surplus_by_namespace: Dict[str, List[str]] = {}
+        surplus_documents: List[str] = []
+        for entry in entries:
+            namespace = province_namespace(entry.get("province"))
+            previous_namespace = province_namespace(entry.get("previous_province", entry.get("province")))
+            surplus_by_namespace.setdefault(previous_namespace, []).extend(chunk_vector_ids(
+                entry["place_id"],
+                entry.get("previous_chunk_count", 0),
+                start=entry["chunk_count"] if previous_namespace == namespace else 0,
+            ))
+            # Chunk IDs below the new count are replaced by the new documents below
+            surplus_documents.extend(chunk_vector_ids(
+                entry["place_id"],
+                entry.get("previous_chunk_count", 0),
+                start=entry["chunk_count"],
+            ))
+
+        surplus_count = sum(len(ids) for ids in surplus_by_namespace.values())
+        if surplus_count:
+            success = await self.vector_store.delete_place_vectors(surplus_by_namespace)
+            if not success:
+                raise DataLoadingError("Failed to delete surplus chunks", operation="commit_places")
+            logger.info("Deleted surplus chunks", vectors_deleted=surplus_count)
+        if self.sparse_encoder is not None:
+            if surplus_documents:
+                self.sparse_encoder.remove_documents(surplus_documents)
+            self.sparse_encoder.add_documents(
+                [document for entry in entries for document in entry.get("sparse_documents", ())]
             )
 
-        return loaded_count
+        await asyncio.to_thread(
+            self.chunk_manifest.set_many,
+            [(entry["place_id"], entry["chunk_count"], entry.get("province")) for entry in entries],
+        )
+
+        provinces = [entry.get("province") for entry in entries]
+        provinces.extend(entry["previous_province"] for entry in entries if "previous_province" in entry)
+        self._invalidate_search_cache(provinces)
 
     async def delete_place(self, place_id: str) -> bool:
         """
@@ -259,64 +314,179 @@ class DataManagementService:
 
         Returns:
             bool: True if deletion succeeded, False otherwise
+        """
+        results = await self.delete_places([place_id])
+        return results.get(place_id, False)
 
-        Raises:
-            DataLoadingError: If critical error occurs
+    async def delete_places(self, place_ids: List[str]) -> Dict[str, bool]:
         """
-        try:
-            logger.info("Deleting place", place_id=place_id)
+        Delete several places and all of their chunks.
 
-            namespace = settings.PINECONE_DEFAULT_NAMESPACE
+        Chunk vector IDs are deterministic (`place_<id>_chunk_<n>`), so places known
+        to the chunk manifest are addressed directly from their chunk count and
+        province namespace. Places missing from the manifest are resolved with an ID
+        prefix listing (in every place namespace when namespaces are per province).
+        All IDs are then removed with batched delete requests; no similarity query
+        is issued.
 
-            # Try to get index stats to understand the data
-            vector_ids_to_delete = []
+        Args:
+            place_ids: Google Place IDs to delete
 
-            # Query Pinecone using the index to find all chunks
-            # We'll use a filter on place_id in metadata
-            query_results = await self.pinecone_service.query_by_metadata(
-                place_id=place_id, namespace=namespace
-            )
+        Returns:
+            Dict mapping each place ID to True if deletion succeeded
+        """
+        place_ids = list(dict.fromkeys(place_ids))
+        if not place_ids:
+            return {}
 
-            if query_results:
-                vector_ids_to_delete = query_results
-                logger.info(
-                    "Found vectors to delete",
-                    place_id=place_id,
-                    vectors_count=len(vector_ids_to_delete),
-                )
+        logger.info("Deleting places", places_count=len(place_ids))
 
-            if not vector_ids_to_delete:
+        # place_id → namespace → chunk vector IDs
+        vector_ids_by_place: Dict[str, Dict[str, List[str]]] = {}
+        results: Dict[str, bool] = {}
+
+        try:
+            known = await asyncio.to_thread(self.chunk_manifest.get_many, place_ids)
+        except Exception as e:
+            logger.warning("Chunk manifest lookup failed, listing IDs instead", error=str(e))
+            known = {}
+
+        for place_id, (chunk_count, province) in known.items():
+            vector_ids_by_place[place_id] = {
+                province_namespace(province): chunk_vector_ids(place_id, chunk_count)
+            }
+
+        # Places written before the manifest existed: list their chunk IDs by prefix
+        unknown = [place_id for place_id in place_ids if place_id not in known]
+        if unknown:
+            if settings.PINECONE_NAMESPACE_PER_PROVINCE:
+                namespaces = await self.vector_store.list_place_namespaces()
+            else:
+                namespaces = [settings.PINECONE_DEFAULT_NAMESPACE]
+            lookups = [(place_id, namespace) for place_id in unknown for namespace in namespaces]
+            listings = await asyncio.gather(
+                *(
+                    self.vector_store.list_ids(prefix=f"place_{place_id}_chunk_", namespace=namespace)
+                    for place_id, namespace in lookups
+                ),
+                return_exceptions=True,
+            )
+            for (place_id, namespace), listing in zip(lookups, listings):
+                if isinstance(listing, Exception):
+                    logger.error("Failed to list place vectors", place_id=place_id, error=str(listing))
+                    results[place_id] = False
+                elif results.get(place_id) is not False:
+                    vector_ids_by_place.setdefault(place_id, {})[namespace] = listing
+            for place_id, result in results.items():
+                if result is False:
+                    vector_ids_by_place.pop(place_id, None)
+
+        ids_by_namespace: Dict[str, List[str]] = {}
+        for namespaces_ids in vector_ids_by_place.values():
+            for namespace, ids in namespaces_ids.items():
+                ids_by_namespace.setdefault(namespace, []).extend(ids)
+        vector_count = sum(len(ids) for ids in ids_by_namespace.values())
+
+        if vector_count:
+            success = await self.vector_store.delete_place_vectors(ids_by_namespace)
+        else:
+            success = True
+
+        for place_id, namespaces_ids in vector_ids_by_place.items():
+            if not any(namespaces_ids.values()):
                 logger.warning("No vectors found to delete", place_id=place_id)
-                return True  # Consider it a success if nothing to delete
+            results[place_id] = success
 
-            # Delete vectors
-            success = await self.pinecone_service.delete_vectors(vector_ids_to_delete)
+        if success and vector_ids_by_place:
+            try:
+                await asyncio.to_thread(self.chunk_manifest.delete_many, list(vector_ids_by_place))
+            except Exception as e:
+                logger.warning("Failed to update chunk manifest after delete", error=str(e))
 
-            if success:
-                logger.info(
-                    "Successfully deleted place",
-                    place_id=place_id,
-                    vectors_deleted=len(vector_ids_to_delete),
+            if self.sparse_encoder is not None:
+                self.sparse_encoder.remove_documents(
+                    vector_id for ids in ids_by_namespace.values() for vector_id in ids
                 )
-            else:
-                logger.error("Failed to delete place vectors", place_id=place_id)
 
-            return success
+            # Places not in the manifest have an unknown province (None clears every entry)
+            self._invalidate_search_cache(
+                known[place_id][1] if place_id in known else None
+                for place_id in vector_ids_by_place
+            )
 
-        except Exception as e:
-            logger.error(
-                "Failed to delete place",
-                place_id=place_id,
-                error=str(e),
+        if success:
+            logger.info(
+                "Successfully deleted places",
+                places_count=len(vector_ids_by_place),
+                vectors_deleted=vector_count,
             )
-            return False
+        else:
+            logger.error("Failed to delete place vectors", places_count=len(vector_ids_by_place))
+
+        self._schedule_flush()
+        return results
+
+    def _invalidate_search_cache(self, provinces: Iterable[Optional[str]]) -> None:
+        """Drop cached searches and catalogue snapshots of the given provinces (None: unknown province)."""
+        provinces = list(provinces)
+        if self.search_cache is not None:
+            self.search_cache.invalidate_provinces(provinces)
+        if self.province_catalogue is not None:
+            self.province_catalogue.invalidate_provinces(provinces)
+
+    def _schedule_flush(self) -> None:
+        """
+        Flush after LOCAL_VECTOR_STORE_FLUSH_DELAY_SECONDS (single-place API writes).
+
+        A local-store flush republishes the whole index, so writes arriving within
+        the delay share one publish instead of paying it per place.
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(max(0.0, settings.LOCAL_VECTOR_STORE_FLUSH_DELAY_SECONDS))
+        await self._flush_vector_store()
+
+    async def close(self) -> None:
+        """Run a pending debounced flush now (application shutdown)."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            await self._flush_vector_store()
+
+    async def _flush_vector_store(self) -> None:
+        """Persist buffered vector store writes (local backend) and sparse encoder statistics; failures are only logged."""
+        try:
+            await self.vector_store.flush()
+        except Exception as e:
+            logger.warning("Failed to flush vector store", error=str(e))
+
+        if self.sparse_encoder is not None:
+            try:
+                await asyncio.to_thread(self.sparse_encoder.save)
+            except Exception as e:
+                logger.warning("Failed to save sparse encoder", error=str(e))
 
     async def load_from_json_file(
-        self, file_path: str, batch_size: int = 50
+        self,
+        file_path: str,
+        checkpoint: Optional[IngestionCheckpoint] = None,
+        on_progress: Optional[ProgressFn] = None,
     ) -> int:
         """
         Load places from JSON file with province structure.
 
+        The file is read incrementally (see iter_places_from_file): places are
+        yielded province by province into the ingestion pipeline, so memory stays
+        flat regardless of file size and embedding starts as soon as the first
+        province is parsed. NDJSON files (.ndjson/.jsonl) with one province or place
+        object per line are also accepted.
+
         Expected JSON format:
         ```json
         [
@@ -338,8 +508,10 @@ class DataManagementService:
         ```
 
         Args:
-            file_path: Path to JSON file
-            batch_size: Number of places per batch (default: 50)
+            file_path: Path to JSON or NDJSON file
+            checkpoint: Optional checkpoint; committed places are skipped and newly
+                        committed places are recorded durably as the load progresses
+            on_progress: Optional callback(result) with live counts (e.g. IngestionProgress)
 
         Returns:
             int: Total number of places successfully loaded
@@ -353,34 +525,39 @@ class DataManagementService:
                 file_path=file_path,
             )
 
-            # Read JSON file
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Stream places province by province straight into the ingestion pipeline
+            places = iter_places_from_file(file_path)
+            on_place_done: Optional[PlaceDoneFn] = None
 
-            # Extract places from provinces structure
-            all_places = []
-            if isinstance(data, list):
-                for province_data in data:
-                    province_name = province_data.get("province", "")
-                    places = province_data.get("places", [])
+            if checkpoint is not None:
+                # Pipeline ordinals count only pending places; map them back to file ordinals
+                file_ordinals: Dict[int, int] = {}
+                places = checkpoint.skip_committed(places, file_ordinals)
 
-                    for place in places:
-                        # Add province info to each place for context
-                        place["province"] = province_name
-                        all_places.append(place)
+                def mark_checkpoint(ordinal, place, success, error):
+                    checkpoint.mark_done(file_ordinals.pop(ordinal, ordinal), place, success)
 
-            if not all_places:
-                logger.warning("No places found in JSON file", file_path=file_path)
-                return 0
+                on_place_done = mark_checkpoint
 
-            logger.info(
-                "Extracted places from file",
-                file_path=file_path,
-                total_places=len(all_places),
-            )
+            try:
+                result = await self.ingest_places(
+                    places, on_place_done=on_place_done, on_progress=on_progress
+                )
+            finally:
+                if checkpoint is not None:
+                    await checkpoint.save_async()
 
-            # Process in batches
-            total_loaded = await self.insert_places_batch(all_places, batch_size)
+            if checkpoint is not None and not result.failed_places:
+                await checkpoint.save_async(completed=True)
+
+            total_loaded = result.loaded_places
+
+            if not result.total_places:
+                logger.warning(
+                    "No places to load from JSON file (empty or already committed)",
+                    file_path=file_path,
+                )
+                return 0
 
             logger.info(
                 "Successfully loaded from JSON file",
@@ -401,11 +578,11 @@ class DataManagementService:
 
     async def get_stats(self) -> Dict[str, Any]:
         """
-        Get combined statistics from embedding and Pinecone services.
+        Get combined statistics from embedding service and vector store.
 
         Returns statistics about:
         - Embedding service configuration and stats
-        - Pinecone index status
+        - Vector index status
         - Chunking configuration
 
         Returns:
@@ -416,7 +593,8 @@ class DataManagementService:
             stats = await service.get_stats()
             # {
             #     "embedding_service": {...},
-            #     "pinecone_service": {...},
+            #     "vector_store": {...},
+            #     "search_cache": {...},
             #     "chunking_enabled": True,
             #     "optimization": "minimal_metadata"
             # }
@@ -424,11 +602,16 @@ class DataManagementService:
         """
         try:
             embedding_stats = self.embedding_service.get_embedding_stats()
-            pinecone_stats = await self.pinecone_service.get_index_stats()
+            vector_store_stats = await self.vector_store.get_index_stats()
 
             return {
                 "embedding_service": embedding_stats,
-                "pinecone_service": pinecone_stats,
+                "vector_store": vector_store_stats,
+                "search_cache": self.search_cache.get_stats() if self.search_cache else {"enabled": False},
+                "sparse_encoder": self.sparse_encoder.get_stats() if self.sparse_encoder else {"enabled": False},
+                "province_catalogue": (
+                    self.province_catalogue.get_stats() if self.province_catalogue else {"enabled": False}
+                ),
                 "chunking_enabled": True,
                 "optimization": "minimal_metadata",
             }
@@ -443,21 +626,21 @@ class DataManagementService:
         """
         Check if the data management service is healthy.
 
-        Verifies both embedding service and Pinecone service are operational.
+        Verifies both embedding service and vector store are operational.
 
         Returns:
             bool: True if service is healthy
         """
         try:
             embedding_healthy = await self.embedding_service.health_check()
-            pinecone_healthy = await self.pinecone_service.health_check()
+            vector_store_healthy = await self.vector_store.health_check()
 
-            is_healthy = embedding_healthy and pinecone_healthy
+            is_healthy = embedding_healthy and vector_store_healthy
 
             logger.info(
                 "Health check completed",
                 embedding_healthy=embedding_healthy,
-                pinecone_healthy=pinecone_healthy,
+                vector_store_healthy=vector_store_healthy,
                 overall_healthy=is_healthy,
             )
 
@@ -493,7 +676,14 @@ def get_data_management_service() -> DataManagementService:
     return _service_instance
 
 
+async def close_data_management_service() -> None:
+    """Flush pending writes of the service if one was created (application shutdown)."""
+    if _service_instance is not None:
+        await _service_instance.close()
+
+
 __all__ = [
     "DataManagementService",
+    "close_data_management_service",
     "get_data_management_service",
 ]
@@ -0,0 +1,229 @@
+"""
+Persistent content-addressed embedding cache.
+
+Embeddings are stored in a local SQLite database keyed by a hash of
+(EMBEDDING_MODEL, VECTOR_DIMENSION, task_type, text). Re-ingesting an unchanged
+corpus therefore makes zero Gemini calls, and a partial description edit only
+re-embeds the chunks whose text changed.
+
+Eviction policy: least-recently-used. When the number of entries exceeds
+EMBEDDING_CACHE_MAX_ENTRIES, the oldest-accessed entries are removed until the
+cache is back to 90% of its capacity.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache with LRU eviction.
+
+    All methods are synchronous and thread-safe; async callers should run them
+    through asyncio.to_thread to keep disk I/O off the event loop.
+    """
+
+    def __init__(self, path: str, max_entries: int = 200_000):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+            max_entries: Maximum number of cached embeddings before LRU eviction
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings(last_access)"
+        )
+        self._conn.commit()
+
+        logger.info("Embedding cache opened", path=path, max_entries=max_entries)
+
+    @staticmethod
+    def make_key(text: str, task_type: str) -> str:
+        """
+        Build the content-addressed cache key for a text.
+
+        Args:
+            text: Exact text sent to the embedding model
+            task_type: Embedding task type
+
+        Returns:
+            str: SHA-256 hex digest of (model, dimension, task type, text)
+        """
+        payload = "\x1f".join([
+            settings.EMBEDDING_MODEL,
+            str(settings.VECTOR_DIMENSION),
+            task_type,
+            text,
+        ])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """
+        Look up embeddings for many keys and refresh their access time.
+
+        Args:
+            keys: Cache keys from make_key
+
+        Returns:
+            Dict mapping found keys to embedding vectors
+        """
+        if not keys:
+            return {}
+
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, List[float]] = {}
+
+        with self._lock:
+            # SQLite limits bound parameters per statement, so look up in slices
+            for start in range(0, len(unique_keys), 500):
+                batch = unique_keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self._conn.commit()
+
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+
+        return found
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Look up a single embedding (see get_many)."""
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: Sequence[Tuple[str, List[float]]]) -> None:
+        """
+        Store embeddings and evict least-recently-used entries if over capacity.
+
+        Args:
+            items: (key, embedding) pairs
+        """
+        if not items:
+            return
+
+        now = time.time()
+        rows = [(key, array("f", vector).tobytes(), now) for key, vector in items]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, last_access) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._evict_if_needed()
+            self._conn.commit()
+
+    def _evict_if_needed(self) -> None:
+        """Evict oldest-accessed entries down to 90% of capacity (caller holds the lock)."""
+        count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        if count <= self.max_entries:
+            return
+
+        to_evict = count - int(self.max_entries * 0.9)
+        self._conn.execute(
+            """
+            DELETE FROM embeddings WHERE key IN (
+                SELECT key FROM embeddings ORDER BY last_access ASC LIMIT ?
+            )
+            """,
+            (to_evict,),
+        )
+        self.evictions += to_evict
+        logger.info("Embedding cache evicted entries", evicted=to_evict, max_entries=self.max_entries)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache hit/miss counters and size.
+
+        Returns:
+            dict: Cache statistics
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Global cache instance
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Get global embedding cache instance.
+
+    Returns:
+        EmbeddingCache, or None if caching is disabled in settings
+    """
+    global _embedding_cache
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(
+            path=settings.EMBEDDING_CACHE_PATH,
+            max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+        )
+    return _embedding_cache
+
+
+__all__ = ["EmbeddingCache", "get_embedding_cache"]
@@ -7,14 +7,20 @@ metadata while full place data is stored separately and fetched after search.
 Uses Google Gemini embedding model (gemini-embedding-001) with task-specific optimization.
 """
 
+import asyncio
 import structlog
 import uuid
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from app.core.config import settings
 from app.clients.gemini_client import get_gemini_client
+from app.services.chunk_manifest import chunk_vector_id
+from app.services.embedding_cache import EmbeddingCache, get_embedding_cache
+from app.services.sparse_encoder import get_sparse_encoder
+from app.utils.cache import TTLCache
+from app.utils.helpers import province_slug
 
 logger = structlog.get_logger(__name__)
 
@@ -57,6 +63,15 @@ class EmbeddingService:
             logger.error(f"Failed to get Gemini client: {e}")
             raise EmbeddingServiceError(f"Failed to initialize Gemini: {e}")
 
+        # Persistent content-addressed cache (None when disabled)
+        self.embedding_cache = get_embedding_cache()
+
+        # In-process LRU+TTL cache for RETRIEVAL_QUERY embeddings
+        self.query_cache = TTLCache(
+            max_size=settings.QUERY_EMBEDDING_CACHE_SIZE,
+            ttl_seconds=settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS
+        )
+
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=1200,
             chunk_overlap=100,
@@ -77,61 +92,155 @@ class EmbeddingService:
         Returns:
             List[Dict]: List of vectors ready for Pinecone upsert
 
+        Raises:
+            EmbeddingServiceError: If processing fails
+        """
+        place_vectors = await self.process_places([place])
+        return place_vectors[0]
+
+    async def process_places(self, places: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Process many places with batched embedding requests.
+
+        Chunks from all places are grouped into shared batch embedding calls, so the
+        number of Gemini round trips is bounded by batch count, not chunk count.
+        A failed embedding request therefore fails the whole call; bulk loads go
+        through IngestionPipeline, which retries a failed batch per place.
+
+        Args:
+            places: Place data dictionaries from location_data.json
+
+        Returns:
+            List[List[Dict]]: Vectors for each input place (same order, empty list for skipped places)
+
         Raises:
             EmbeddingServiceError: If processing fails
         """
         try:
-            place_name = place.get('name', '').strip()
-            if not place_name:
-                logger.warning("Place missing name, skipping")
-                return []
+            place_chunks = [self.build_chunk_records(place) for place in places]
+            all_records = [record for records in place_chunks for record in records]
 
-            logger.info(f"Processing: {place_name}")
+            vectors = await self.embed_chunk_records(all_records)
+            vectors_by_id = {vector["id"]: vector for vector in vectors}
 
-            # Smart chunking based on description length
-            chunks = self._smart_chunk(place)
-            total_chunks = len(chunks)
+            # Map vectors back to their places by chunk ID
+            results = [
+                [vectors_by_id[record["id"]] for record in records]
+                for records in place_chunks
+            ]
 
-            if len(place.get('description', '')) > 1200:
-                logger.debug(f"{len(place.get('description', ''))} chars → {total_chunks} chunks")
-            else:
-                logger.debug(f"{len(place.get('description', ''))} chars → {total_chunks} chunk (no split)")
+            logger.info(
+                f"Generated {len(vectors)} vectors for {len(places)} places (minimal metadata)"
+            )
+            return results
 
-            vectors = []
-            for chunk_index, chunk_text in enumerate(chunks):
-                try:
-                    # Create embedding text with context
-                    embedding_text = self._create_embedding_text(place, chunk_text)
+        except EmbeddingServiceError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to process {len(places)} places: {e}")
+            raise EmbeddingServiceError(f"Processing failed: {e}")
 
-                    # Generate embedding
-                    embedding = await self._generate_embedding(embedding_text)
+    def build_chunk_records(self, place: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Chunk a place and build the embedding text and metadata for every chunk.
 
-                    # Create minimal metadata (use province from place data)
-                    province = place.get('province', 'Vietnam')
-                    metadata = self._create_minimal_metadata(
-                        place, chunk_text, chunk_index, total_chunks, province=province
-                    )
+        Args:
+            place: Place data dictionary from location_data.json
+
+        Returns:
+            List[Dict]: Chunk records with 'id', 'embedding_text' and 'metadata'
+        """
+        place_name = place.get('name', '').strip()
+        if not place_name:
+            logger.warning("Place missing name, skipping")
+            return []
 
-                    # Create vector for Pinecone
-                    vector = {
-                        "id": f"place_{place.get('googlePlaceId', uuid.uuid4())}_chunk_{chunk_index}",
-                        "values": embedding,
-                        "metadata": metadata
-                    }
+        logger.info(f"Processing: {place_name}")
 
-                    vectors.append(vector)
+        # Smart chunking based on description length
+        chunks = self._smart_chunk(place)
+        total_chunks = len(chunks)
 
-                except Exception as e:
-                    logger.warning(f"Failed to create vector for chunk {chunk_index}: {e}")
-                    continue
+        if len(place.get('description', '')) > 1200:
+            logger.debug(f"{len(place.get('description', ''))} chars → {total_chunks} chunks")
+        else:
+            logger.debug(f"{len(place.get('description', ''))} chars → {total_chunks} chunk (no split)")
 
-            logger.info(f"Generated {len(vectors)} vectors (minimal metadata)")
-            return vectors
+        place_id = place.get('googlePlaceId') or str(uuid.uuid4())
+        province = place.get('province', 'Vietnam')
+
+        records = []
+        for chunk_index, chunk_text in enumerate(chunks):
+            metadata = self._create_minimal_metadata(
+                {**place, 'googlePlaceId': place_id},
+                chunk_text, chunk_index, total_chunks, province=province
+            )
+            records.append({
+                "id": chunk_vector_id(place_id, chunk_index),
+                "embedding_text": self._create_embedding_text(place, chunk_text),
+                "metadata": metadata
+            })
+
+        return records
+
+    async def embed_chunk_records(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Embed chunk records in batches and build Pinecone vectors.
+
+        With HYBRID_SEARCH_ENABLED, BM25 sparse vectors are attached as
+        'sparse_values'. The chunks are not registered with the sparse encoder
+        here; that happens once their upsert is committed (see sparse_documents).
+
+        Args:
+            records: Chunk records from build_chunk_records (any number of places)
+
+        Returns:
+            List[Dict]: Vectors with 'id', 'values' and 'metadata', in record order
+        """
+        if not records:
+            return []
+
+        embeddings = await self._generate_embeddings(
+            [record["embedding_text"] for record in records]
+        )
+
+        vectors = [
+            {
+                "id": record["id"],
+                "values": embedding,
+                "metadata": record["metadata"]
+            }
+            for record, embedding in zip(records, embeddings)
+        ]
+
+        sparse_encoder = get_sparse_encoder()
+        if sparse_encoder is not None:
+            sparse_vectors = sparse_encoder.encode_documents([record["embedding_text"] for record in records])
+            for vector, sparse_vector in zip(vectors, sparse_vectors):
+                if sparse_vector["indices"]:
+                    vector["sparse_values"] = sparse_vector
+
+        return vectors
+
+    @staticmethod
+    def sparse_documents(records: List[Dict[str, Any]]) -> List[Tuple[str, str, str]]:
+        """
+        Sparse encoder documents of chunk records.
+
+        Args:
+            records: Chunk records from build_chunk_records
+
+        Returns:
+            (vector id, text, province slug) triples for BM25SparseEncoder.add_documents
+            (empty when HYBRID_SEARCH_ENABLED is off)
+        """
+        if not settings.HYBRID_SEARCH_ENABLED:
+            return []
+        return [
+            (record["id"], record["embedding_text"], province_slug(record["metadata"].get("province") or ""))
+            for record in records
+        ]
 
-        except Exception as e:
-            logger.error(f"Failed to process place {place.get('name', 'unknown')}: {e}")
-            raise EmbeddingServiceError(f"Processing failed: {e}")
-    
     def _smart_chunk(self, place: Dict[str, Any]) -> List[str]:
         """
         Chunk description if needed based on length.
@@ -191,21 +300,54 @@ class EmbeddingService:
         
         return "\n".join(part for part in embedding_parts if part)
     
-    async def _generate_embedding(self, text: str, task_type: Optional[str] = None) -> List[float]:
+    async def _generate_embedding(
+        self,
+        text: str,
+        task_type: Optional[str] = None,
+        use_cache: bool = True
+    ) -> List[float]:
         """
         Generate embedding using Google Gemini embedding model (gemini-embedding-001).
 
         This model produces embeddings optimized for various tasks using task-specific configuration.
-        Default dimension is 768 (configurable from 128-3072).
+        Default dimension is 768 (configurable from 128-3072). The persistent embedding
+        cache is consulted first, so unchanged texts never reach the API.
 
         Args:
             text: Text to embed
             task_type: Task type for optimization (RETRIEVAL_DOCUMENT, RETRIEVAL_QUERY, etc.)
                       Defaults to RETRIEVAL_DOCUMENT if not specified.
+            use_cache: Whether to read/write the embedding cache
 
         Returns:
             List[float]: Embedding vector (dimension specified in settings)
 
+        Raises:
+            EmbeddingServiceError: If embedding generation fails
+        """
+        embeddings = await self._generate_embeddings([text], task_type=task_type, use_cache=use_cache)
+        return embeddings[0]
+
+    async def _generate_embeddings(
+        self,
+        texts: List[str],
+        task_type: Optional[str] = None,
+        use_cache: bool = True
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for many texts with batched Gemini requests.
+
+        Cached embeddings are served from the persistent cache; only the remaining
+        (deduplicated) texts are sent to Gemini, and their results are cached.
+
+        Args:
+            texts: Texts to embed
+            task_type: Task type for optimization (defaults to RETRIEVAL_DOCUMENT)
+            use_cache: Whether to read/write the embedding cache
+
+        Returns:
+            List[List[float]]: Embedding vectors in input order
+
         Raises:
             EmbeddingServiceError: If embedding generation fails
         """
@@ -214,28 +356,101 @@ class EmbeddingService:
             if task_type is None:
                 task_type = settings.EMBEDDING_TASK_TYPE_DOCUMENT
 
-            # Generate embedding using shared GeminiClient
-            embedding_list = await self.gemini_client.embed_content(
-                text=text,
-                task_type=task_type
+            cache = self.embedding_cache if use_cache else None
+            query_cache = (
+                self.query_cache
+                if use_cache and task_type == settings.EMBEDDING_TASK_TYPE_QUERY
+                else None
             )
+            keys = [EmbeddingCache.make_key(text, task_type) for text in texts]
+
+            # In-process query cache first (no I/O at all for hot query strings)
+            cached: Dict[str, List[float]] = {}
+            if query_cache is not None:
+                for key in keys:
+                    embedding = query_cache.get(key)
+                    if embedding is not None:
+                        cached[key] = embedding
+
+            pending_keys = [key for key in keys if key not in cached]
+            if cache is not None and pending_keys:
+                disk_hits = await asyncio.to_thread(cache.get_many, pending_keys)
+                if query_cache is not None:
+                    for key, embedding in disk_hits.items():
+                        query_cache.set(key, embedding)
+                cached.update(disk_hits)
+
+            # Embed each distinct missing text once
+            missing: Dict[str, str] = {}
+            for key, text in zip(keys, texts):
+                if key not in cached and key not in missing:
+                    missing[key] = text
+
+            if missing:
+                embeddings = await self.gemini_client.embed_contents(
+                    texts=list(missing.values()),
+                    task_type=task_type
+                )
 
-            # Verify dimension matches configuration
-            if len(embedding_list) != settings.VECTOR_DIMENSION:
-                raise EmbeddingServiceError(
-                    f"Embedding dimension mismatch: model produced {len(embedding_list)} dimensions, "
-                    f"but config expects {settings.VECTOR_DIMENSION}. "
-                    f"Please update VECTOR_DIMENSION in .env to {len(embedding_list)}"
+                for embedding_list in embeddings:
+                    # Verify dimension matches configuration
+                    if len(embedding_list) != settings.VECTOR_DIMENSION:
+                        raise EmbeddingServiceError(
+                            f"Embedding dimension mismatch: model produced {len(embedding_list)} dimensions, "
+                            f"but config expects {settings.VECTOR_DIMENSION}. "
+                            f"Please update VECTOR_DIMENSION in .env to {len(embedding_list)}"
+                        )
+
+                fresh = dict(zip(missing.keys(), embeddings))
+                if cache is not None:
+                    await asyncio.to_thread(cache.put_many, list(fresh.items()))
+                if query_cache is not None:
+                    for key, embedding in fresh.items():
+                        query_cache.set(key, embedding)
+                cached.update(fresh)
+
+            if cache is not None:
+                logger.debug(
+                    "Embedding cache lookup",
+                    texts=len(texts),
+                    embedded=len(missing),
+                    task_type=task_type
                 )
 
-            return embedding_list
+            return [cached[key] for key in keys]
 
         except EmbeddingServiceError:
             raise
         except Exception as e:
             logger.error(f"Failed to generate embedding with Gemini: {e}")
             raise EmbeddingServiceError(f"{e}")
-    
+
+    async def warm_query_embeddings(self, queries: List[str]) -> int:
+        """
+        Pre-compute and pin query embeddings in the in-process query cache.
+
+        All queries are embedded with one batched request (minus persistent-cache hits)
+        and pinned, so later searches with these strings never touch the embedding API.
+
+        Args:
+            queries: Query strings to pre-warm
+
+        Returns:
+            int: Number of distinct queries pinned
+        """
+        unique_queries = list(dict.fromkeys(q for q in queries if q))
+        if not unique_queries:
+            return 0
+
+        task_type = settings.EMBEDDING_TASK_TYPE_QUERY
+        embeddings = await self._generate_embeddings(unique_queries, task_type=task_type)
+
+        for query, embedding in zip(unique_queries, embeddings):
+            self.query_cache.set(EmbeddingCache.make_key(query, task_type), embedding, pin=True)
+
+        logger.info("Query embedding cache pre-warmed", queries=len(unique_queries))
+        return len(unique_queries)
+
     def _create_minimal_metadata(
         self, 
         place: Dict[str, Any], 
@@ -306,8 +521,11 @@ class EmbeddingService:
             "chunk_size": 1200,
             "chunk_overlap": 100,
             "min_chunk_length": 100,
+            "embedding_batch_size": settings.EMBEDDING_BATCH_SIZE,
             "client_initialized": self.gemini_client is not None,
-            "splitter_configured": self.text_splitter is not None
+            "splitter_configured": self.text_splitter is not None,
+            "embedding_cache": self.embedding_cache.get_stats() if self.embedding_cache else {"enabled": False},
+            "query_cache": self.query_cache.get_stats()
         }
 
     async def health_check(self) -> bool:
@@ -319,7 +537,7 @@ class EmbeddingService:
         """
         try:
             # Test embedding generation
-            test_embedding = await self._generate_embedding("Test text for health check")
+            test_embedding = await self._generate_embedding("Test text for health check", use_cache=False)
             return len(test_embedding) == settings.VECTOR_DIMENSION
         except Exception as e:
             logger.error(f"Health check failed: {e}")
@@ -0,0 +1,266 @@
+"""
+Durable checkpoints for resumable bulk loads.
+
+A checkpoint records, for one source file:
+- the last committed position (file-wide place ordinal + its province) below which
+  every place has been fully upserted
+- content hashes of every place already committed
+- the number of places in the file, once a run has read it to the end (lets a
+  resumed run report an ETA without an extra pass over the file)
+
+A resumed load skips places whose content hash is committed, so a run that died
+at 90% only re-processes the remaining 10% (and any place whose data changed).
+Checkpoints are written atomically (temp file + os.replace), so a crash during a
+save never leaves a corrupt file behind. Inside an event loop, periodic saves run
+on a worker thread (asyncio.to_thread), never on the loop itself.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, Optional, Set
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+def place_content_hash(place: Dict[str, Any]) -> str:
+    """
+    Hash the full content of a place (order-independent).
+
+    Args:
+        place: Place dictionary (including its province)
+
+    Returns:
+        str: 128-bit hex digest
+    """
+    payload = json.dumps(place, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class IngestionCheckpoint:
+    """Resumable progress state for loading one source file."""
+
+    def __init__(
+        self,
+        path: str,
+        source_file: str,
+        save_every: int = 100,
+        save_interval_seconds: float = 5.0,
+    ):
+        """
+        Initialize an empty checkpoint.
+
+        Args:
+            path: Checkpoint file path
+            source_file: Data file this checkpoint belongs to
+            save_every: Persist after this many newly committed places
+            save_interval_seconds: Persist at least this often while committing
+        """
+        self.path = path
+        self.source_file = os.path.abspath(source_file)
+        self.save_every = save_every
+        self.save_interval_seconds = save_interval_seconds
+
+        self.committed_hashes: Set[str] = set()
+        self.last_committed_ordinal = -1
+        self.last_committed_province: Optional[str] = None
+        self.total_places: Optional[int] = None
+        self.completed = False
+
+        self._finished_ordinals: Dict[int, Optional[str]] = {}
+        self._unsaved = 0
+        self._last_saved_at = time.monotonic()
+        self._save_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def load(cls, path: str, source_file: str, **kwargs) -> "IngestionCheckpoint":
+        """
+        Load a checkpoint for source_file, or start a fresh one.
+
+        A checkpoint written for a different source file is ignored.
+
+        Args:
+            path: Checkpoint file path
+            source_file: Data file being loaded
+            **kwargs: Save cadence options (see __init__)
+
+        Returns:
+            IngestionCheckpoint: Restored or empty checkpoint
+        """
+        checkpoint = cls(path, source_file, **kwargs)
+        if not os.path.exists(path):
+            return checkpoint
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable checkpoint", path=path, error=str(e))
+            return checkpoint
+
+        if data.get("source_file") != checkpoint.source_file:
+            logger.warning(
+                "Checkpoint belongs to another source file, starting fresh",
+                path=path,
+                checkpoint_source=data.get("source_file"),
+            )
+            return checkpoint
+
+        checkpoint.committed_hashes = set(data.get("committed_hashes", []))
+        checkpoint.last_committed_ordinal = data.get("last_committed_ordinal", -1)
+        checkpoint.last_committed_province = data.get("last_committed_province")
+        checkpoint.total_places = data.get("total_places")
+        checkpoint.completed = data.get("completed", False)
+
+        logger.info(
+            "Checkpoint loaded",
+            path=path,
+            committed_places=len(checkpoint.committed_hashes),
+            last_committed_ordinal=checkpoint.last_committed_ordinal,
+            last_committed_province=checkpoint.last_committed_province,
+        )
+        return checkpoint
+
+    def is_committed(self, place: Dict[str, Any]) -> bool:
+        """Whether this exact place content was already committed."""
+        return place_content_hash(place) in self.committed_hashes
+
+    def skip_committed(self, places: Iterator[Dict[str, Any]], ordinals: Dict[int, int]) -> Iterator[Dict[str, Any]]:
+        """
+        Filter out committed places from a place stream.
+
+        Args:
+            places: Places in file order
+            ordinals: Filled with {stream position: file ordinal} for yielded places,
+                      so completion callbacks can be mapped back to file positions
+
+        Yields:
+            Places that still need to be loaded
+        """
+        position = 0
+        skipped = 0
+        file_places = 0
+        for file_ordinal, place in enumerate(places):
+            file_places += 1
+            if self.is_committed(place):
+                # Already durable: only the position moves, nothing new to save
+                skipped += 1
+                self._advance(file_ordinal, place.get("province"))
+                continue
+            ordinals[position] = file_ordinal
+            position += 1
+            yield place
+
+        self.total_places = file_places
+        logger.info("Checkpoint skip summary", skipped_places=skipped, pending_places=position)
+
+    def mark_done(self, ordinal: int, place: Dict[str, Any], success: bool) -> None:
+        """
+        Record that a place finished processing.
+
+        Successful places are committed by content hash. The committed position
+        only advances over a contiguous run of successes, so a failed place keeps
+        the position behind it until it is retried. Periodic saves triggered here
+        run in the background when called from an event loop; await save_async()
+        to make the final state durable.
+
+        Args:
+            ordinal: File-wide ordinal of the place
+            place: Place dictionary
+            success: Whether all of its vectors were upserted
+        """
+        if success:
+            self.committed_hashes.add(place_content_hash(place))
+            self._advance(ordinal, place.get("province"))
+            self._unsaved += 1
+
+        if (
+            self._unsaved >= self.save_every
+            or (self._unsaved and time.monotonic() - self._last_saved_at >= self.save_interval_seconds)
+        ):
+            self._schedule_save()
+
+    def _advance(self, ordinal: int, province: Optional[str]) -> None:
+        """Move the committed position over a contiguous run of finished ordinals."""
+        self._finished_ordinals[ordinal] = province
+        while self.last_committed_ordinal + 1 in self._finished_ordinals:
+            self.last_committed_ordinal += 1
+            self.last_committed_province = self._finished_ordinals.pop(self.last_committed_ordinal)
+
+    def _schedule_save(self) -> None:
+        """Save in the background when called from an event loop, else synchronously."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+            return
+        if self._save_task is not None and not self._save_task.done():
+            # Still writing the previous state; a later mark_done saves again
+            return
+        self._save_task = loop.create_task(asyncio.to_thread(self._write, self._snapshot(self.completed)))
+        self._save_task.add_done_callback(self._on_save_done)
+
+    def _on_save_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Checkpoint save failed", path=self.path, error=str(task.exception()))
+
+    def save(self, completed: bool = False) -> None:
+        """
+        Persist the checkpoint atomically.
+
+        Args:
+            completed: Mark the source file as fully loaded
+        """
+        self._write(self._snapshot(completed))
+
+    async def save_async(self, completed: bool = False) -> None:
+        """
+        Persist the checkpoint atomically on a worker thread, after any background save.
+
+        Args:
+            completed: Mark the source file as fully loaded
+        """
+        if self._save_task is not None:
+            await asyncio.gather(self._save_task, return_exceptions=True)
+            self._save_task = None
+        await asyncio.to_thread(self._write, self._snapshot(completed))
+
+    def _snapshot(self, completed: bool) -> Dict[str, Any]:
+        """Capture the current state for _write (cheap; runs on the caller's thread)."""
+        self.completed = completed
+        self._unsaved = 0
+        self._last_saved_at = time.monotonic()
+        return {
+            "version": CHECKPOINT_VERSION,
+            "source_file": self.source_file,
+            "last_committed_ordinal": self.last_committed_ordinal,
+            "last_committed_province": self.last_committed_province,
+            "committed_places": len(self.committed_hashes),
+            "total_places": self.total_places,
+            "completed": completed,
+            "updated_at": time.time(),
+            "committed_hashes": list(self.committed_hashes),
+        }
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        data["committed_hashes"].sort()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+__all__ = ["IngestionCheckpoint", "place_content_hash"]
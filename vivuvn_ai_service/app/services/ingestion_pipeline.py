@@ -0,0 +1,418 @@
+"""
+Streaming ingestion pipeline for place data.
+
+Three stages connected by bounded asyncio queues (backpressure):
+
+    places ──► [chunk] ──► embed_queue ──► [embed × N] ──► upsert_queue ──► [upsert × M]
+
+- Chunk: splits places into chunk records and packs them into embedding batches
+  (chunks from different places share a batch)
+- Embed: N workers call the batched embedding API; requests are paced by the
+  Gemini client's token-bucket limiter, so the quota is saturated but not exceeded
+- Upsert: M writers push vectors to the vector store
+
+Chunking, embedding and upserting overlap, so the event loop is never idle while
+a single round trip is in flight. A place counts as loaded once all of its
+chunks have been upserted.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Sentinel that tells a stage worker to stop
+_STOP = object()
+
+PlaceSource = Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+UpsertFn = Callable[[List[Dict[str, Any]]], Awaitable[bool]]
+PlaceDoneFn = Callable[[int, Dict[str, Any], bool, Optional[str]], Any]
+PlaceEntriesFn = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+ProgressFn = Callable[["IngestionResult"], Any]
+
+
+@dataclass
+class IngestionResult:
+    """Summary of a pipeline run."""
+
+    total_places: int = 0
+    loaded_places: int = 0
+    failed_places: int = 0
+    skipped_places: int = 0
+    total_vectors: int = 0
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize result for logging/API responses."""
+        return {
+            "total_places": self.total_places,
+            "loaded_places": self.loaded_places,
+            "failed_places": self.failed_places,
+            "skipped_places": self.skipped_places,
+            "total_vectors": self.total_vectors,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+
+
+class IngestionProgress:
+    """
+    Periodic progress reporter for pipeline runs (pass as on_progress).
+
+    Logs places/sec, vectors/sec and ETA at most once per log interval.
+    """
+
+    def __init__(self, total_places: Optional[int] = None, log_interval_seconds: float = 5.0):
+        """
+        Initialize reporter.
+
+        Args:
+            total_places: Expected number of places in the run (enables ETA)
+            log_interval_seconds: Minimum seconds between progress log lines
+        """
+        self.total_places = total_places
+        self.log_interval_seconds = log_interval_seconds
+        self._last_logged_at = 0.0
+
+    def __call__(self, result: IngestionResult) -> None:
+        now = time.monotonic()
+        if now - self._last_logged_at >= self.log_interval_seconds:
+            self._last_logged_at = now
+            self.report(result)
+
+    def report(self, result: IngestionResult) -> Dict[str, Any]:
+        """
+        Log and return current throughput figures.
+
+        Args:
+            result: Live result of the running pipeline
+
+        Returns:
+            dict: Progress snapshot
+        """
+        elapsed = max(result.elapsed_seconds, 1e-6)
+        done = result.loaded_places + result.failed_places + result.skipped_places
+        places_per_sec = done / elapsed
+
+        eta_seconds = None
+        if self.total_places is not None and places_per_sec > 0:
+            eta_seconds = max(0, self.total_places - done) / places_per_sec
+
+        snapshot = {
+            "places_done": done,
+            "total_places": self.total_places,
+            "places_per_sec": round(result.loaded_places / elapsed, 2),
+            "vectors_per_sec": round(result.total_vectors / elapsed, 2),
+            "eta_seconds": round(eta_seconds, 1) if eta_seconds is not None else None,
+        }
+        logger.info("Ingestion progress", **snapshot)
+        return snapshot
+
+
+class _PlaceState:
+    """Tracks outstanding chunks for one place (internal)."""
+
+    __slots__ = ("place", "remaining", "error", "entry")
+
+    def __init__(self, place: Dict[str, Any], remaining: int, entry: Optional[Dict[str, Any]] = None):
+        self.place = place
+        self.remaining = remaining
+        self.error: Optional[str] = None
+        self.entry = entry
+
+
+class IngestionPipeline:
+    """
+    Producer/consumer pipeline that turns places into upserted vectors.
+
+    The pipeline is stateless between runs; each run() call creates its own queues
+    and workers.
+    """
+
+    def __init__(
+        self,
+        embedding_service,
+        upsert_fn: UpsertFn,
+        embed_workers: Optional[int] = None,
+        upsert_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        prepare_fn: Optional[PlaceEntriesFn] = None,
+        commit_fn: Optional[PlaceEntriesFn] = None,
+    ):
+        """
+        Initialize pipeline.
+
+        Args:
+            embedding_service: EmbeddingService used for chunking and embedding
+            upsert_fn: Coroutine that writes a list of vectors, returning success
+            embed_workers: Concurrent embedding workers (default: INGEST_EMBED_WORKERS)
+            upsert_workers: Concurrent upsert writers (default: INGEST_UPSERT_WORKERS)
+            queue_size: Bounded queue size between stages (default: INGEST_QUEUE_SIZE)
+            batch_size: Chunks per embedding batch (default: EMBEDDING_BATCH_SIZE)
+            prepare_fn: Optional coroutine called with place entries
+                        ({"place_id", "province", "chunk_count", "sparse_documents"})
+                        before any of their chunks are embedded; it may annotate the
+                        entries in place
+            commit_fn: Optional coroutine called with the (annotated) entries of places
+                       whose chunks have all been upserted; if it raises, those places
+                       are reported as failed
+        """
+        self.embedding_service = embedding_service
+        self.upsert_fn = upsert_fn
+        self.embed_workers = max(1, embed_workers or settings.INGEST_EMBED_WORKERS)
+        self.upsert_workers = max(1, upsert_workers or settings.INGEST_UPSERT_WORKERS)
+        self.queue_size = max(1, queue_size or settings.INGEST_QUEUE_SIZE)
+        self.batch_size = max(1, batch_size or settings.EMBEDDING_BATCH_SIZE)
+        self.prepare_fn = prepare_fn
+        self.commit_fn = commit_fn
+
+    async def run(
+        self,
+        places: PlaceSource,
+        on_place_done: Optional[PlaceDoneFn] = None,
+        on_progress: Optional[ProgressFn] = None,
+    ) -> IngestionResult:
+        """
+        Run all places through the pipeline.
+
+        Args:
+            places: Iterable or async iterable of place dictionaries (consumed lazily)
+            on_place_done: Optional callback(ordinal, place, success, error) invoked once
+                           per place when it is fully upserted, failed, or skipped
+            on_progress: Optional callback(result) invoked with live counts after
+                         every finished upsert/embedding batch
+
+        Returns:
+            IngestionResult: Counts and timing for the run
+
+        Raises:
+            Exception: If reading the place source fails
+        """
+        result = IngestionResult()
+        started = time.monotonic()
+
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        upsert_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        states: Dict[int, _PlaceState] = {}
+
+        def notify(ordinal: int, place: Dict[str, Any], success: bool, error: Optional[str]) -> None:
+            if on_place_done is None:
+                return
+            try:
+                on_place_done(ordinal, place, success, error)
+            except Exception as e:
+                # A faulty callback must never stall the pipeline
+                logger.warning("Place completion callback failed", ordinal=ordinal, error=str(e))
+
+        def finish_place(ordinal: int, success: bool, error: Optional[str]) -> None:
+            state = states.pop(ordinal, None)
+            place = state.place if state else {}
+            if success:
+                result.loaded_places += 1
+            else:
+                result.failed_places += 1
+            notify(ordinal, place, success, error)
+
+        async def release_chunks(batch: List[Tuple[int, Dict[str, Any]]], error: Optional[str]) -> None:
+            """Decrement outstanding chunk counts; commit and finish places with nothing left."""
+            completed = []
+            for ordinal, _ in batch:
+                state = states.get(ordinal)
+                if state is None:
+                    continue
+                state.remaining -= 1
+                if error and not state.error:
+                    state.error = error
+                if state.remaining == 0:
+                    completed.append(ordinal)
+
+            committable = [states[o] for o in completed if states[o].error is None]
+            if committable and self.commit_fn is not None:
+                try:
+                    await self.commit_fn([state.entry for state in committable])
+                except Exception as e:
+                    logger.error("Place commit failed", places=len(committable), error=str(e))
+                    for state in committable:
+                        state.error = f"Commit failed: {e}"
+
+            for ordinal in completed:
+                state = states[ordinal]
+                finish_place(ordinal, state.error is None, state.error)
+
+            if on_progress is not None:
+                result.elapsed_seconds = time.monotonic() - started
+                try:
+                    on_progress(result)
+                except Exception as e:
+                    logger.warning("Progress callback failed", error=str(e))
+
+        async def flush(batch: List[Tuple[int, Dict[str, Any]]], unprepared: List[Dict[str, Any]]) -> None:
+            # Prepare every place with chunks in this batch before the batch can be upserted
+            if unprepared and self.prepare_fn is not None:
+                try:
+                    await self.prepare_fn(unprepared)
+                except Exception as e:
+                    logger.warning("Place prepare hook failed", places=len(unprepared), error=str(e))
+            unprepared.clear()
+            await embed_queue.put(batch)
+
+        async def chunk_stage() -> None:
+            batch: List[Tuple[int, Dict[str, Any]]] = []
+            unprepared: List[Dict[str, Any]] = []
+            try:
+                async for ordinal, place in _enumerate_async(places):
+                    result.total_places += 1
+                    try:
+                        records = self.embedding_service.build_chunk_records(place)
+                    except Exception as e:
+                        logger.warning(
+                            "Failed to chunk place",
+                            place_name=place.get("name", "unknown"),
+                            error=str(e),
+                        )
+                        states[ordinal] = _PlaceState(place, 0)
+                        finish_place(ordinal, False, f"Chunking failed: {e}")
+                        continue
+
+                    if not records:
+                        result.skipped_places += 1
+                        notify(ordinal, place, False, "No vectors generated")
+                        continue
+
+                    entry = {
+                        "place_id": records[0]["metadata"].get("place_id"),
+                        "province": records[0]["metadata"].get("province"),
+                        "chunk_count": len(records),
+                        "sparse_documents": self.embedding_service.sparse_documents(records),
+                    }
+                    states[ordinal] = _PlaceState(place, len(records), entry)
+                    unprepared.append(entry)
+                    for record in records:
+                        batch.append((ordinal, record))
+                        if len(batch) >= self.batch_size:
+                            await flush(batch, unprepared)
+                            batch = []
+
+                if batch:
+                    await flush(batch, unprepared)
+            finally:
+                for _ in range(self.embed_workers):
+                    await embed_queue.put(_STOP)
+
+        async def embed_worker() -> None:
+            while True:
+                batch = await embed_queue.get()
+                if batch is _STOP:
+                    return
+                try:
+                    vectors = await self.embedding_service.embed_chunk_records(
+                        [record for _, record in batch]
+                    )
+                except Exception as e:
+                    sub_batches = _split_by_place(batch)
+                    logger.error(
+                        "Embedding batch failed",
+                        chunks=len(batch),
+                        places=len(sub_batches),
+                        error=str(e),
+                    )
+                    if len(sub_batches) == 1:
+                        await release_chunks(batch, f"Embedding failed: {e}")
+                        continue
+                    # One bad place must not fail the others sharing its batch
+                    for sub_batch in sub_batches:
+                        try:
+                            vectors = await self.embedding_service.embed_chunk_records(
+                                [record for _, record in sub_batch]
+                            )
+                        except Exception as sub_error:
+                            logger.error(
+                                "Per-place embedding retry failed",
+                                chunks=len(sub_batch),
+                                error=str(sub_error),
+                            )
+                            await release_chunks(sub_batch, f"Embedding failed: {sub_error}")
+                            continue
+                        await upsert_queue.put((sub_batch, vectors))
+                    continue
+                await upsert_queue.put((batch, vectors))
+
+        async def upsert_worker() -> None:
+            while True:
+                item = await upsert_queue.get()
+                if item is _STOP:
+                    return
+                batch, vectors = item
+                try:
+                    success = await self.upsert_fn(vectors)
+                    error = None if success else "Vector upsert failed"
+                except Exception as e:
+                    error = f"Vector upsert failed: {e}"
+                if error:
+                    logger.error("Upsert batch failed", vectors_count=len(vectors), error=error)
+                else:
+                    result.total_vectors += len(vectors)
+                await release_chunks(batch, error)
+
+        async def embed_stage() -> None:
+            await asyncio.gather(*(embed_worker() for _ in range(self.embed_workers)))
+            for _ in range(self.upsert_workers):
+                await upsert_queue.put(_STOP)
+
+        upsert_stage = asyncio.gather(*(upsert_worker() for _ in range(self.upsert_workers)))
+        outcomes = await asyncio.gather(
+            chunk_stage(), embed_stage(), upsert_stage, return_exceptions=True
+        )
+
+        result.elapsed_seconds = time.monotonic() - started
+
+        # Places still pending here lost chunks to an aborted source read
+        for ordinal in list(states):
+            finish_place(ordinal, False, "Ingestion aborted")
+
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logger.error("Ingestion pipeline aborted", error=str(outcome), **result.to_dict())
+                raise outcome
+
+        elapsed = max(result.elapsed_seconds, 1e-6)
+        logger.info(
+            "Ingestion pipeline completed",
+            places_per_sec=round(result.loaded_places / elapsed, 2),
+            vectors_per_sec=round(result.total_vectors / elapsed, 2),
+            **result.to_dict(),
+        )
+        return result
+
+
+def _split_by_place(batch: List[Tuple[int, Dict[str, Any]]]) -> List[List[Tuple[int, Dict[str, Any]]]]:
+    """Split an embedding batch into per-place sub-batches (first-appearance order)."""
+    by_place: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {}
+    for ordinal, record in batch:
+        by_place.setdefault(ordinal, []).append((ordinal, record))
+    return list(by_place.values())
+
+
+async def _enumerate_async(places: PlaceSource):
+    """Enumerate a sync or async iterable of places as (ordinal, place) pairs."""
+    ordinal = 0
+    if hasattr(places, "__aiter__"):
+        async for place in places:
+            yield ordinal, place
+            ordinal += 1
+    else:
+        for place in places:
+            yield ordinal, place
+            ordinal += 1
+            # Let embed/upsert workers run between places of a large sync source
+            if ordinal % 50 == 0:
+                await asyncio.sleep(0)
+
+
+__all__ = ["IngestionPipeline", "IngestionProgress", "IngestionResult"]
@@ -0,0 +1,728 @@
+"""
+Write-behind queue for place writes (upserts and deletes).
+
+Data write endpoints can hand their work to this queue and acknowledge
+immediately with a job ID instead of waiting on Gemini and Pinecone. A single
+background worker applies pending writes in batches:
+
+- Debounce: a place is written only after WRITE_QUEUE_DEBOUNCE_SECONDS without new
+  edits (but never later than WRITE_QUEUE_MAX_DELAY_SECONDS after its first edit)
+- Coalescing: successive writes to the same googlePlaceId replace each other while
+  pending, so only the latest version is embedded; every coalesced job resolves
+  with the outcome of that final write
+- Batching: due upserts go through the ingestion pipeline together, due deletes
+  through one bulk delete
+
+Jobs and pending writes are persisted in SQLite (WRITE_QUEUE_DB_PATH) before a
+write is acknowledged, so with several uvicorn/gunicorn workers sharing the file:
+
+- GET /jobs/{job_id} answers on any worker (it falls back to the database)
+- Writes acknowledged with 202 survive a crash: pending writes of a dead process
+  on the same host are claimed and re-applied by the next worker that starts
+  (at-least-once; upserts and deletes are idempotent)
+
+A done-callback restarts the background worker if it dies unexpectedly. Writes
+to the same place are applied in submission order within one process; writes to
+one place submitted through different processes are not ordered against each other.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+OPERATION_UPSERT = "upsert"
+OPERATION_DELETE = "delete"
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+_FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED)
+
+# Seconds before a crashed worker task is restarted
+_WORKER_RESTART_DELAY_SECONDS = 1.0
+
+# Applied batches between prunes of finished jobs in the database
+_PRUNE_EVERY_BATCHES = 50
+
+
+@dataclass
+class IngestionJob:
+    """Status of one submitted write."""
+
+    job_id: str
+    place_id: str
+    operation: str
+    status: str = STATUS_QUEUED
+    coalesced: bool = False
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize job for API responses."""
+        return {
+            "job_id": self.job_id,
+            "place_id": self.place_id,
+            "operation": self.operation,
+            "status": self.status,
+            "coalesced": self.coalesced,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+@dataclass
+class _PendingWrite:
+    """Latest pending write for one place (internal)."""
+
+    operation: str
+    payload: Optional[Dict[str, Any]]
+    jobs: List[IngestionJob]
+    first_submitted: float
+    due: float
+    write_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def to_row(self, place_id: str) -> Dict[str, Any]:
+        """Snapshot for the job store."""
+        return {
+            "write_id": self.write_id,
+            "place_id": place_id,
+            "operation": self.operation,
+            "payload": self.payload,
+            "job_ids": [job.job_id for job in self.jobs],
+        }
+
+
+class IngestionJobStore:
+    """
+    SQLite-backed jobs and pending writes of the ingestion queue.
+
+    Methods are synchronous and thread-safe; the queue runs them on a single
+    thread so they apply in call order.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the job database.
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                place_id TEXT NOT NULL,
+                operation TEXT NOT NULL,
+                status TEXT NOT NULL,
+                coalesced INTEGER NOT NULL,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_updated ON jobs(status, updated_at)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pending_writes (
+                write_id TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                place_id TEXT NOT NULL,
+                operation TEXT NOT NULL,
+                payload TEXT,
+                job_ids TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pending_writes_owner ON pending_writes(owner)")
+        self._conn.commit()
+
+        logger.info("Ingestion job store opened", path=path)
+
+    def _upsert_jobs(self, jobs: Sequence[Dict[str, Any]]) -> None:
+        self._conn.executemany(
+            """
+            INSERT OR REPLACE INTO jobs
+                (job_id, place_id, operation, status, coalesced, error, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    job["job_id"], job["place_id"], job["operation"], job["status"],
+                    int(job["coalesced"]), job["error"], job["created_at"], job["updated_at"],
+                )
+                for job in jobs
+            ],
+        )
+
+    def save(self, owner: str, jobs: Sequence[Dict[str, Any]], pending: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record jobs and (optionally) the pending write they belong to.
+
+        Args:
+            owner: Process owning the pending write
+            jobs: Job snapshots (IngestionJob.to_dict())
+            pending: Pending write snapshot (_PendingWrite.to_row())
+        """
+        with self._lock, self._conn:
+            self._upsert_jobs(jobs)
+            if pending is not None:
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO pending_writes
+                        (write_id, owner, place_id, operation, payload, job_ids, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        pending["write_id"], owner, pending["place_id"], pending["operation"],
+                        None if pending["payload"] is None else json.dumps(pending["payload"], ensure_ascii=False),
+                        json.dumps(pending["job_ids"]), time.time(),
+                    ),
+                )
+
+    def finish(self, jobs: Sequence[Dict[str, Any]], write_ids: Sequence[str]) -> None:
+        """
+        Record job outcomes and drop the applied pending writes in one transaction.
+
+        Args:
+            jobs: Job snapshots (IngestionJob.to_dict())
+            write_ids: Applied pending writes
+        """
+        with self._lock, self._conn:
+            self._upsert_jobs(jobs)
+            self._conn.executemany("DELETE FROM pending_writes WHERE write_id = ?", [(w,) for w in write_ids])
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a job snapshot by ID (None if unknown or pruned)."""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT job_id, place_id, operation, status, coalesced, error, created_at, updated_at
+                FROM jobs WHERE job_id = ?
+                """,
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(
+            ("job_id", "place_id", "operation", "status", "coalesced", "error", "created_at", "updated_at"),
+            row[:4] + (bool(row[4]),) + row[5:],
+        ))
+
+    def claim_orphans(
+        self, owner: str, is_alive: Callable[[str], bool]
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Take over pending writes of dead processes.
+
+        Args:
+            owner: Claiming process
+            is_alive: Whether another owner is still running
+
+        Returns:
+            (pending write, its job snapshots) pairs, oldest first
+        """
+        with self._lock, self._conn:
+            owners = [row[0] for row in self._conn.execute("SELECT DISTINCT owner FROM pending_writes")]
+            dead = [other for other in owners if other != owner and not is_alive(other)]
+            for other in dead:
+                self._conn.execute("UPDATE pending_writes SET owner = ? WHERE owner = ?", (owner, other))
+            if not dead:
+                return []
+            rows = self._conn.execute(
+                """
+                SELECT write_id, place_id, operation, payload, job_ids
+                FROM pending_writes WHERE owner = ? ORDER BY updated_at
+                """,
+                (owner,),
+            ).fetchall()
+
+        claimed = []
+        for write_id, place_id, operation, payload, job_ids in rows:
+            jobs = [job for job in (self.get_job(job_id) for job_id in json.loads(job_ids)) if job]
+            claimed.append((
+                {
+                    "write_id": write_id,
+                    "place_id": place_id,
+                    "operation": operation,
+                    "payload": None if payload is None else json.loads(payload),
+                },
+                jobs,
+            ))
+        return claimed
+
+    def prune(self, retention: int) -> None:
+        """Delete the oldest finished jobs beyond the retention limit."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                DELETE FROM jobs
+                WHERE status IN (?, ?) AND job_id NOT IN (
+                    SELECT job_id FROM jobs WHERE status IN (?, ?) ORDER BY updated_at DESC LIMIT ?
+                )
+                """,
+                (*_FINISHED_STATUSES, *_FINISHED_STATUSES, retention),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _process_owner() -> str:
+    """Owner tag of this process: host, PID and a per-boot token (PIDs are reused)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _owner_alive(owner: str) -> bool:
+    """Whether the process behind an owner tag may still be running."""
+    try:
+        host, pid, _ = owner.rsplit(":", 2)
+        pid = int(pid)
+    except ValueError:
+        return False
+    if host != socket.gethostname():
+        # Cannot tell for another host; leave its writes alone
+        return True
+    if pid == os.getpid():
+        # Same PID, different boot token: an earlier incarnation of this process
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class IngestionQueue:
+    """Debouncing, coalescing write-behind queue with a single background worker."""
+
+    def __init__(
+        self,
+        debounce_seconds: Optional[float] = None,
+        max_delay_seconds: Optional[float] = None,
+        max_batch_places: Optional[int] = None,
+        job_retention: Optional[int] = None,
+        store: Optional[IngestionJobStore] = None,
+    ):
+        """
+        Initialize queue (call start() to run the worker).
+
+        Args:
+            debounce_seconds: Quiet period before a place is written (default: WRITE_QUEUE_DEBOUNCE_SECONDS)
+            max_delay_seconds: Longest a write may be deferred (default: WRITE_QUEUE_MAX_DELAY_SECONDS)
+            max_batch_places: Max places applied per worker batch (default: WRITE_QUEUE_MAX_BATCH_PLACES)
+            job_retention: Finished jobs kept for status lookups (default: WRITE_QUEUE_JOB_RETENTION)
+            store: Job database (default: one at WRITE_QUEUE_DB_PATH)
+        """
+        self.debounce_seconds = max(
+            0.0,
+            settings.WRITE_QUEUE_DEBOUNCE_SECONDS if debounce_seconds is None else debounce_seconds,
+        )
+        self.max_delay_seconds = max(
+            self.debounce_seconds,
+            settings.WRITE_QUEUE_MAX_DELAY_SECONDS if max_delay_seconds is None else max_delay_seconds,
+        )
+        self.max_batch_places = max(1, max_batch_places or settings.WRITE_QUEUE_MAX_BATCH_PLACES)
+        self.job_retention = max(1, job_retention or settings.WRITE_QUEUE_JOB_RETENTION)
+
+        self.store = store or IngestionJobStore(settings.WRITE_QUEUE_DB_PATH)
+        self.owner = _process_owner()
+        # One thread, so store calls apply in the order they were made
+        self._store_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingestion-jobs")
+
+        self._pending: Dict[str, _PendingWrite] = {}
+        self._jobs: "OrderedDict[str, IngestionJob]" = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._recovered = False
+
+        self._submitted = 0
+        self._coalesced = 0
+        self._writes_applied = 0
+        self._recovered_writes = 0
+        self._worker_restarts = 0
+        self._batches = 0
+
+    async def _persist(self, fn: Callable[..., Any], *args) -> Any:
+        """Run a store call on the store thread; it completes even if the caller is cancelled."""
+        loop = asyncio.get_running_loop()
+        return await asyncio.shield(loop.run_in_executor(self._store_executor, fn, *args))
+
+    async def submit_upsert(self, place: Dict[str, Any]) -> IngestionJob:
+        """
+        Queue an insert/update of a place.
+
+        Args:
+            place: Place data dictionary (must contain googlePlaceId)
+
+        Returns:
+            IngestionJob: Job tracking this write
+        """
+        return await self._submit(place["googlePlaceId"], OPERATION_UPSERT, place)
+
+    async def submit_delete(self, place_id: str) -> IngestionJob:
+        """
+        Queue deletion of a place.
+
+        Args:
+            place_id: Google Place ID to delete
+
+        Returns:
+            IngestionJob: Job tracking this write
+        """
+        return await self._submit(place_id, OPERATION_DELETE, None)
+
+    async def get_job(self, job_id: str) -> Optional[IngestionJob]:
+        """Look up a job by ID, also one submitted through another process (None if unknown or expired)."""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        row = await self._persist(self.store.get_job, job_id)
+        return IngestionJob(**row) if row else None
+
+    async def _submit(self, place_id: str, operation: str, payload: Optional[Dict[str, Any]]) -> IngestionJob:
+        if self._stopping:
+            raise RuntimeError("Ingestion queue is shutting down")
+
+        now = time.monotonic()
+        job = IngestionJob(job_id=uuid.uuid4().hex, place_id=place_id, operation=operation)
+        self._remember(job)
+        self._submitted += 1
+
+        pending = self._pending.get(place_id)
+        if pending is None:
+            pending = self._pending[place_id] = _PendingWrite(
+                operation=operation,
+                payload=payload,
+                jobs=[job],
+                first_submitted=now,
+                due=now + self.debounce_seconds,
+            )
+        else:
+            # Newer write replaces the pending one; earlier jobs follow its outcome
+            for earlier in pending.jobs:
+                earlier.coalesced = True
+                earlier.updated_at = time.time()
+            pending.operation = operation
+            pending.payload = payload
+            pending.jobs.append(job)
+            pending.due = min(now + self.debounce_seconds, pending.first_submitted + self.max_delay_seconds)
+            self._coalesced += 1
+
+        # Durable before it is acknowledged; store calls run in order, so this
+        # lands before the worker can record the write as applied
+        await self._persist(
+            self.store.save, self.owner, [j.to_dict() for j in pending.jobs], pending.to_row(place_id)
+        )
+        self._wakeup.set()
+        return job
+
+    def _remember(self, job: IngestionJob) -> None:
+        """Store a job, evicting the oldest finished jobs beyond the retention limit."""
+        self._jobs[job.job_id] = job
+        if len(self._jobs) <= self.job_retention:
+            return
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.job_retention:
+                break
+            if self._jobs[job_id].status in _FINISHED_STATUSES:
+                del self._jobs[job_id]
+
+    async def start(self) -> None:
+        """Recover pending writes of dead processes and start the background worker (idempotent)."""
+        self._stopping = False
+        if not self._recovered:
+            self._recovered = True
+            try:
+                await self._recover()
+            except Exception as e:
+                logger.error("Ingestion queue recovery failed", error=str(e))
+
+        if self._worker is None or self._worker.done():
+            self._spawn_worker()
+            logger.info(
+                "Ingestion queue started",
+                debounce_seconds=self.debounce_seconds,
+                max_delay_seconds=self.max_delay_seconds,
+                recovered_writes=self._recovered_writes,
+            )
+
+    async def _recover(self) -> None:
+        """Re-queue writes acknowledged by a process that died before applying them."""
+        claimed = await self._persist(self.store.claim_orphans, self.owner, _owner_alive)
+        now = time.monotonic()
+        for row, job_rows in claimed:
+            jobs = [IngestionJob(**job_row) for job_row in job_rows]
+            self._set_status(jobs, STATUS_QUEUED)
+            for job in jobs:
+                self._remember(job)
+
+            place_id = row["place_id"]
+            pending = self._pending.get(place_id)
+            if pending is not None:
+                # Already rewritten here: the recovered jobs follow the newer write
+                for job in jobs:
+                    job.coalesced = True
+                pending.jobs[:0] = jobs
+                await self._persist(
+                    self.store.save, self.owner, [j.to_dict() for j in pending.jobs], pending.to_row(place_id)
+                )
+                await self._persist(self.store.finish, [], [row["write_id"]])
+                continue
+
+            self._pending[place_id] = _PendingWrite(
+                operation=row["operation"],
+                payload=row["payload"],
+                jobs=jobs,
+                first_submitted=now,
+                due=now,
+                write_id=row["write_id"],
+            )
+            self._recovered_writes += 1
+
+        if claimed:
+            logger.warning("Recovered pending writes of a dead process", writes=len(claimed))
+            self._wakeup.set()
+
+    def _spawn_worker(self) -> None:
+        self._worker = asyncio.create_task(self._run(), name="ingestion-queue-worker")
+        self._worker.add_done_callback(self._on_worker_done)
+
+    def _on_worker_done(self, task: asyncio.Task) -> None:
+        """Restart the worker if it died while the queue is running."""
+        if self._stopping or task.cancelled():
+            return
+        error = task.exception()
+        logger.error("Ingestion queue worker died; restarting", error=str(error) if error else None)
+        self._worker_restarts += 1
+
+        def restart():
+            if not self._stopping and (self._worker is task or self._worker is None):
+                self._spawn_worker()
+
+        asyncio.get_running_loop().call_later(_WORKER_RESTART_DELAY_SECONDS, restart)
+
+    async def stop(self) -> None:
+        """Flush all pending writes immediately, then stop the worker."""
+        self._stopping = True
+        self._wakeup.set()
+        if self._worker is not None:
+            try:
+                await self._worker
+            except Exception as e:
+                # Writes still pending stay in the job store for the next start
+                logger.error("Ingestion queue worker failed while stopping", error=str(e))
+            self._worker = None
+        self._store_executor.shutdown(wait=True)
+        self.store.close()
+        logger.info("Ingestion queue stopped", **self.get_stats())
+
+    async def _run(self) -> None:
+        while True:
+            batch = self._take_due()
+            if batch:
+                try:
+                    await self._apply(batch)
+                except Exception as e:
+                    if self._stopping:
+                        raise
+                    logger.error("Ingestion queue batch failed; retrying", places=len(batch), error=str(e))
+                    await self._requeue(batch)
+                continue
+
+            if self._stopping and not self._pending:
+                return
+
+            self._wakeup.clear()
+            timeout = None
+            if self._pending:
+                timeout = max(0.0, min(p.due for p in self._pending.values()) - time.monotonic())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _take_due(self) -> Dict[str, _PendingWrite]:
+        """Remove and return due pending writes (all of them when stopping)."""
+        now = time.monotonic()
+        due: Dict[str, _PendingWrite] = {}
+        for place_id, pending in list(self._pending.items()):
+            if len(due) >= self.max_batch_places:
+                break
+            if self._stopping or pending.due <= now:
+                due[place_id] = self._pending.pop(place_id)
+        return due
+
+    async def _requeue(self, batch: Dict[str, _PendingWrite]) -> None:
+        """Put back writes whose batch could not be applied (newer pending writes win)."""
+        due = time.monotonic() + self.debounce_seconds
+        for place_id, pending in batch.items():
+            self._set_status(pending.jobs, STATUS_QUEUED)
+            newer = self._pending.get(place_id)
+            if newer is None:
+                pending.due = due
+                self._pending[place_id] = pending
+                continue
+            for job in pending.jobs:
+                job.coalesced = True
+            newer.jobs[:0] = pending.jobs
+            await self._drop_superseded(place_id, newer, pending.write_id)
+
+    async def _drop_superseded(self, place_id: str, newer: _PendingWrite, write_id: str) -> None:
+        """Record merged jobs on the newer write and drop the superseded one."""
+        try:
+            await self._persist(
+                self.store.save, self.owner, [j.to_dict() for j in newer.jobs], newer.to_row(place_id)
+            )
+            await self._persist(self.store.finish, [], [write_id])
+        except Exception as e:
+            # The in-memory queue is already merged; only the job store lags behind
+            logger.error("Failed to persist superseded write", place_id=place_id, error=str(e))
+
+    async def _apply(self, batch: Dict[str, _PendingWrite]) -> None:
+        """Apply one batch of writes and resolve their jobs."""
+        from app.services.data_management_service import get_data_management_service
+
+        for pending in batch.values():
+            self._set_status(pending.jobs, STATUS_RUNNING)
+        await self._persist(self.store.save, self.owner, [j.to_dict() for p in batch.values() for j in p.jobs])
+
+        upserts = [p for p in batch.values() if p.operation == OPERATION_UPSERT]
+        deletes = [place_id for place_id, p in batch.items() if p.operation == OPERATION_DELETE]
+
+        try:
+            data_service = get_data_management_service()
+        except Exception as e:
+            logger.error("Ingestion queue cannot reach data service", error=str(e))
+            for pending in batch.values():
+                self._set_status(pending.jobs, STATUS_FAILED, f"Data service unavailable: {e}")
+            await self._finish(batch)
+            return
+
+        if upserts:
+            def on_place_done(ordinal, place, success, error):
+                self._set_status(
+                    upserts[ordinal].jobs,
+                    STATUS_SUCCEEDED if success else STATUS_FAILED,
+                    None if success else error or "Upsert failed",
+                )
+
+            try:
+                await data_service.ingest_places(
+                    [pending.payload for pending in upserts], on_place_done=on_place_done
+                )
+            except Exception as e:
+                logger.error("Queued upsert batch failed", places=len(upserts), error=str(e))
+                for pending in upserts:
+                    if pending.jobs[-1].status == STATUS_RUNNING:
+                        self._set_status(pending.jobs, STATUS_FAILED, str(e))
+
+        if deletes:
+            try:
+                results = await data_service.delete_places(deletes)
+            except Exception as e:
+                logger.error("Queued delete batch failed", places=len(deletes), error=str(e))
+                results = {}
+            for place_id in deletes:
+                success = results.get(place_id, False)
+                self._set_status(
+                    batch[place_id].jobs,
+                    STATUS_SUCCEEDED if success else STATUS_FAILED,
+                    None if success else "Delete failed",
+                )
+
+        await self._finish(batch)
+        self._writes_applied += len(batch)
+        logger.info(
+            "Ingestion queue batch applied",
+            upserts=len(upserts),
+            deletes=len(deletes),
+            pending=len(self._pending),
+        )
+
+    async def _finish(self, batch: Dict[str, _PendingWrite]) -> None:
+        """Persist job outcomes and drop the batch's pending writes from the store."""
+        await self._persist(
+            self.store.finish,
+            [j.to_dict() for p in batch.values() for j in p.jobs],
+            [p.write_id for p in batch.values()],
+        )
+        self._batches += 1
+        if self._batches % _PRUNE_EVERY_BATCHES == 0:
+            await self._persist(self.store.prune, self.job_retention)
+
+    @staticmethod
+    def _set_status(jobs: List[IngestionJob], status: str, error: Optional[str] = None) -> None:
+        now = time.time()
+        for job in jobs:
+            job.status = status
+            job.error = error
+            job.updated_at = now
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue statistics."""
+        return {
+            "pending_places": len(self._pending),
+            "submitted_jobs": self._submitted,
+            "coalesced_jobs": self._coalesced,
+            "writes_applied": self._writes_applied,
+            "tracked_jobs": len(self._jobs),
+            "recovered_writes": self._recovered_writes,
+            "worker_restarts": self._worker_restarts,
+            "running": self._worker is not None and not self._worker.done(),
+        }
+
+
+# Global queue instance
+_ingestion_queue: Optional[IngestionQueue] = None
+
+
+def get_ingestion_queue() -> IngestionQueue:
+    """
+    Get global ingestion queue instance.
+
+    Returns:
+        IngestionQueue: Shared write-behind queue
+    """
+    global _ingestion_queue
+    if _ingestion_queue is None:
+        _ingestion_queue = IngestionQueue()
+    return _ingestion_queue
+
+
+__all__ = ["IngestionJob", "IngestionJobStore", "IngestionQueue", "get_ingestion_queue"]
@@ -0,0 +1,537 @@
+"""
+In-process vector store backed by NumPy.
+
+Vectors live in two layers:
+
+- Base: the published on-disk index (see app.services.mmap_vector_index), mapped
+  read-only so all worker processes share one copy through the OS page cache.
+  Rows are grouped per (namespace, province) and can be int8-quantized.
+- Overlay: writes since the last publish, kept as one float32 matrix of
+  L2-normalized vectors per (namespace, province). Base rows that were deleted or
+  overwritten are hidden until the next publish.
+
+A province-scoped search is a matrix-vector product over a few thousand rows
+followed by an exact top-k selection: single-digit milliseconds, no network.
+Searches without a province filter scan every partition of the namespace.
+flush() publishes base + overlay as a new index version (atomic swap) from a
+worker thread, so searches keep running meanwhile; other processes pick it up
+within LOCAL_VECTOR_STORE_RELOAD_SECONDS. Publishing rewrites the whole index, so
+callers flush at batch end or debounced (see DataManagementService), not per write.
+
+Metadata filters use Pinecone's syntax (see app.utils.metadata_filter). With an
+empty LOCAL_VECTOR_STORE_PATH the store is memory-only (useful for tests and
+benchmarks).
+"""
+
+import asyncio
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+import structlog
+
+from app.core.config import settings
+from app.services.mmap_vector_index import (
+    MappedVectorIndex,
+    open_current,
+    publish_index,
+    read_current_version,
+)
+from app.services.vector_store import VectorStore, VectorStoreError
+from app.utils.metadata_filter import matches_filter, province_from_filter
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms publish without a lock
+    fcntl = None
+
+logger = structlog.get_logger(__name__)
+
+
+class _Partition:
+    """Vectors of one province in one namespace (internal)."""
+
+    def __init__(self, dimension: int):
+        self.vectors = np.zeros((16, dimension), dtype=np.float32)
+        self.size = 0
+        self.ids: List[str] = []
+        self.metadata: List[Dict[str, Any]] = []
+        self.rows: Dict[str, int] = {}
+
+    def upsert(self, vector_id: str, vector: np.ndarray, metadata: Dict[str, Any]) -> None:
+        row = self.rows.get(vector_id)
+        if row is None:
+            if self.size == len(self.vectors):
+                grown = np.zeros((len(self.vectors) * 2, self.vectors.shape[1]), dtype=np.float32)
+                grown[:self.size] = self.vectors[:self.size]
+                self.vectors = grown
+            row = self.size
+            self.size += 1
+            self.rows[vector_id] = row
+            self.ids.append(vector_id)
+            self.metadata.append(metadata)
+        else:
+            self.metadata[row] = metadata
+        self.vectors[row] = vector
+
+    def delete(self, vector_id: str) -> None:
+        row = self.rows.pop(vector_id, None)
+        if row is None:
+            return
+        # Move the last row into the hole to keep rows contiguous
+        last = self.size - 1
+        if row != last:
+            moved_id = self.ids[last]
+            self.vectors[row] = self.vectors[last]
+            self.ids[row] = moved_id
+            self.metadata[row] = self.metadata[last]
+            self.rows[moved_id] = row
+        self.ids.pop()
+        self.metadata.pop()
+        self.size -= 1
+
+
+class LocalVectorStore(VectorStore):
+    """Exact cosine-similarity vector store over a shared mapped index plus an in-memory overlay."""
+
+    def __init__(
+        self,
+        dimension: int,
+        path: Optional[str] = None,
+        quantization: str = "float32",
+        rescore_factor: int = 4,
+        reload_seconds: float = 5.0,
+        keep_versions: int = 2,
+    ):
+        """
+        Initialize store, mapping the published index if present.
+
+        Args:
+            dimension: Vector dimension
+            path: Index root directory (None: memory-only)
+            quantization: On-disk format for published versions ("float32" or "int8")
+            rescore_factor: int8 candidates per result rescored with float32 vectors
+            reload_seconds: How often to check for versions published by other processes
+            keep_versions: Published versions kept on disk
+        """
+        self.dimension = dimension
+        self.path = path
+        self.quantization = quantization
+        self.rescore_factor = rescore_factor
+        self.reload_seconds = reload_seconds
+        self.keep_versions = keep_versions
+
+        self._base: Optional[MappedVectorIndex] = None
+        # Overlay: namespace → province → partition
+        self._partitions: Dict[str, Dict[str, _Partition]] = {}
+        # Overlay: namespace → vector id → province (partition lookup for deletes/fetches)
+        self._locations: Dict[str, Dict[str, str]] = {}
+        # namespace → vector ids deleted since the last publish (hidden in the base)
+        self._deleted: Dict[str, Set[str]] = {}
+        self._dirty = False
+        # Bumped by every write; tells flush() whether writes arrived while publishing
+        self._write_seq = 0
+        self._flush_lock = asyncio.Lock()
+        self._last_reload_check = time.monotonic()
+        self._reload_task: Optional[asyncio.Task] = None
+
+        if path:
+            self._base = open_current(path)
+
+        logger.info(
+            "Local vector store initialized",
+            path=path,
+            dimension=dimension,
+            quantization=quantization,
+            version=self._base.version if self._base else None,
+            base_vectors=len(self._base) if self._base else 0,
+        )
+
+    @staticmethod
+    def _namespace(namespace: Optional[str]) -> str:
+        return settings.PINECONE_DEFAULT_NAMESPACE if namespace is None else namespace
+
+    def _normalize(self, values: Any) -> np.ndarray:
+        vector = np.asarray(values, dtype=np.float32)
+        if vector.shape != (self.dimension,):
+            raise VectorStoreError(f"Expected a {self.dimension}-dim vector, got shape {vector.shape}")
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def _hidden(self, namespace: str) -> Set[str]:
+        """Base vector ids shadowed by overlay writes or deletes."""
+        hidden = set(self._deleted.get(namespace, ()))
+        hidden.update(self._locations.get(namespace, {}))
+        return hidden
+
+    def _base_row(self, namespace: str, vector_id: str) -> Optional[int]:
+        if self._base is None or vector_id in self._deleted.get(namespace, ()):
+            return None
+        if vector_id in self._locations.get(namespace, {}):
+            return None
+        return self._base.row_of(namespace, vector_id)
+
+    def _maybe_reload(self) -> None:
+        """
+        Start mapping a version published by another process, if one may exist.
+
+        The version check and the mapping run in a worker thread; the result is
+        swapped in on the event loop. Callers keep using the current base meanwhile.
+        """
+        if not self.path or self._dirty or self._flush_lock.locked():
+            return
+        if self._reload_task is not None and not self._reload_task.done():
+            return
+        now = time.monotonic()
+        if now - self._last_reload_check < self.reload_seconds:
+            return
+        self._last_reload_check = now
+        self._reload_task = asyncio.get_running_loop().create_task(self._reload(self._base))
+
+    async def _reload(self, base: Optional[MappedVectorIndex]) -> None:
+        try:
+            index = await asyncio.to_thread(self._open_newer, base)
+        except Exception as e:
+            logger.warning("Local vector store reload failed", path=self.path, error=str(e))
+            return
+        # Only swap if nothing was written or published by this process meanwhile
+        if index is None or self._base is not base or self._dirty or self._flush_lock.locked():
+            return
+        self._base = index
+        logger.info("Local vector store reloaded", version=index.version, base_vectors=len(index))
+
+    def _open_newer(self, base: Optional[MappedVectorIndex]) -> Optional[MappedVectorIndex]:
+        """Map the published version if it differs from base (runs in a worker thread)."""
+        version = read_current_version(self.path)
+        if version is None or (base is not None and version == base.version):
+            return None
+        return open_current(self.path)
+
+    async def search(
+        self,
+        vector: List[float],
+        top_k: int = 10,
+        namespace: Optional[str] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        include_metadata: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Cosine top-k over the matching province partition(s) of base and overlay."""
+        self._maybe_reload()
+        namespace = self._namespace(namespace)
+        query = self._normalize(vector)
+        province = province_from_filter(filter_dict)
+
+        # (score, vector id, metadata)
+        scored: List[Tuple[float, str, Dict[str, Any]]] = []
+
+        if self._base is not None:
+            for score, row in self._base.search(
+                query,
+                namespace,
+                top_k,
+                province=province,
+                filter_dict=filter_dict,
+                hidden=self._hidden(namespace),
+                rescore_factor=self.rescore_factor,
+            ):
+                scored.append((score, self._base.id_at(row), self._base.metadata_at(row)))
+
+        partitions = self._partitions.get(namespace, {})
+        if province is not None:
+            candidates = [partitions[province]] if province in partitions else []
+        else:
+            candidates = list(partitions.values())
+
+        for partition in candidates:
+            if partition.size == 0:
+                continue
+            scores = partition.vectors[:partition.size] @ query
+
+            if filter_dict:
+                mask = np.fromiter(
+                    (matches_filter(metadata, filter_dict) for metadata in partition.metadata),
+                    dtype=bool,
+                    count=partition.size,
+                )
+                rows = np.flatnonzero(mask)
+                if rows.size == 0:
+                    continue
+                row_scores = scores[rows]
+            else:
+                rows = None
+                row_scores = scores
+
+            k = min(top_k, row_scores.size)
+            best = np.argpartition(-row_scores, k - 1)[:k]
+            for i in best:
+                row = int(rows[i]) if rows is not None else int(i)
+                scored.append((float(row_scores[i]), partition.ids[row], partition.metadata[row]))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+
+        results = []
+        for score, vector_id, metadata in scored[:top_k]:
+            result = {"id": vector_id, "score": score}
+            if include_metadata:
+                result["metadata"] = metadata
+            results.append(result)
+
+        logger.info(f"Local search in namespace '{namespace}' returned {len(results)} results")
+        return results
+
+    async def upsert_vectors(self, vectors: List[Dict[str, Any]], namespace: Optional[str] = None) -> bool:
+        """Insert or overwrite vectors in the overlay."""
+        namespace = self._namespace(namespace)
+        try:
+            self._upsert_normalized(
+                namespace,
+                (
+                    (item["id"], self._normalize(item["values"]), dict(item.get("metadata") or {}))
+                    for item in vectors
+                ),
+            )
+            logger.info(f"Upserted {len(vectors)} vectors to local namespace '{namespace}'")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to upsert vectors to local namespace '{namespace}': {e}")
+            return False
+
+    def _upsert_normalized(self, namespace: str, items) -> None:
+        partitions = self._partitions.setdefault(namespace, {})
+        locations = self._locations.setdefault(namespace, {})
+        deleted = self._deleted.get(namespace)
+
+        for vector_id, normalized, metadata in items:
+            province = metadata.get("province") or ""
+
+            # A vector whose province changed moves to the new partition
+            previous = locations.get(vector_id)
+            if previous is not None and previous != province:
+                partitions[previous].delete(vector_id)
+
+            partition = partitions.get(province)
+            if partition is None:
+                partition = partitions[province] = _Partition(self.dimension)
+            partition.upsert(vector_id, normalized, metadata)
+            locations[vector_id] = province
+            if deleted:
+                deleted.discard(vector_id)
+
+        self._dirty = True
+        self._write_seq += 1
+
+    async def delete_vectors(self, ids: List[str], namespace: Optional[str] = None) -> bool:
+        """Delete vectors by ID (unknown IDs are ignored)."""
+        namespace = self._namespace(namespace)
+        partitions = self._partitions.get(namespace, {})
+        locations = self._locations.get(namespace, {})
+        deleted = self._deleted.setdefault(namespace, set())
+
+        for vector_id in ids:
+            province = locations.pop(vector_id, None)
+            if province is not None:
+                partitions[province].delete(vector_id)
+            # Also hides the ID in a version being published right now
+            deleted.add(vector_id)
+
+        self._dirty = True
+        self._write_seq += 1
+        logger.info(f"Deleted {len(ids)} vectors from local namespace '{namespace}'")
+        return True
+
+    async def list_ids(self, prefix: str, namespace: Optional[str] = None) -> List[str]:
+        """List vector IDs starting with a prefix."""
+        self._maybe_reload()
+        namespace = self._namespace(namespace)
+        ids = [vector_id for vector_id in self._locations.get(namespace, {}) if vector_id.startswith(prefix)]
+        if self._base is not None:
+            hidden = self._hidden(namespace)
+            ids.extend(
+                vector_id for vector_id in self._base.ids_with_prefix(namespace, prefix)
+                if vector_id not in hidden
+            )
+        return ids
+
+    async def fetch_metadata(self, ids: List[str], namespace: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Fetch metadata of vectors by ID."""
+        return {
+            vector_id: vector["metadata"]
+            for vector_id, vector in self._fetch(ids, namespace, include_values=False).items()
+        }
+
+    async def fetch_vectors(self, ids: List[str], namespace: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Fetch vectors (L2-normalized values) and metadata by ID."""
+        return self._fetch(ids, namespace, include_values=True)
+
+    def _fetch(self, ids: List[str], namespace: Optional[str], include_values: bool) -> Dict[str, Dict[str, Any]]:
+        self._maybe_reload()
+        namespace = self._namespace(namespace)
+        partitions = self._partitions.get(namespace, {})
+        locations = self._locations.get(namespace, {})
+
+        found = {}
+        for vector_id in ids:
+            province = locations.get(vector_id)
+            if province is not None:
+                partition = partitions[province]
+                row = partition.rows[vector_id]
+                found[vector_id] = {"id": vector_id, "metadata": partition.metadata[row]}
+                if include_values:
+                    found[vector_id]["values"] = partition.vectors[row].tolist()
+                continue
+            row = self._base_row(namespace, vector_id)
+            if row is not None:
+                found[vector_id] = {"id": vector_id, "metadata": self._base.metadata_at(row)}
+                if include_values:
+                    found[vector_id]["values"] = np.asarray(self._base.vectors[row]).tolist()
+        return found
+
+    async def get_index_stats(self) -> Dict[str, Any]:
+        """Get store statistics in the same shape as PineconeService."""
+        self._maybe_reload()
+        namespace_names = set(self._locations)
+        if self._base is not None:
+            namespace_names.update(self._base.namespaces())
+
+        namespaces = {}
+        for namespace in namespace_names:
+            count = len(self._locations.get(namespace, {}))
+            if self._base is not None:
+                hidden_rows = self._base.rows_of(namespace, self._hidden(namespace))
+                count += self._base.namespace_size(namespace) - hidden_rows.size
+            if count:
+                namespaces[namespace] = {"vector_count": count}
+
+        return {
+            "total_vectors": sum(ns["vector_count"] for ns in namespaces.values()),
+            "dimension": self.dimension,
+            "index_fullness": 0.0,
+            "namespaces": namespaces,
+            "backend": "local",
+            "version": self._base.version if self._base else None,
+            "quantization": self._base.quantization if self._base else self.quantization,
+            "unpublished_writes": self._dirty,
+        }
+
+    async def health_check(self) -> bool:
+        """The in-process store is always available."""
+        return True
+
+    async def flush(self) -> None:
+        """
+        Publish base + overlay as a new on-disk index version and map it.
+
+        The overlay is snapshotted on the event loop; sorting, writing and fsyncing
+        the new version run in a worker thread. Publishing is serialized across
+        processes with a lock file; pending writes are applied on top of the newest
+        published version, so concurrent writers do not drop each other's changes.
+        Writes made while publishing stay in the overlay for the next flush.
+        """
+        if not self.path or not self._dirty:
+            return
+
+        async with self._flush_lock:
+            if not self._dirty:
+                return
+
+            write_seq = self._write_seq
+            overlay = [
+                (namespace, partition.ids[row], partition.vectors[row].copy(), partition.metadata[row])
+                for namespace, partitions in self._partitions.items()
+                for partition in partitions.values()
+                for row in range(partition.size)
+            ]
+            hidden = {
+                namespace: self._hidden(namespace)
+                for namespace in set(self._partitions) | set(self._deleted)
+            }
+
+            self._base = await asyncio.to_thread(self._publish, overlay, hidden)
+
+            if self._write_seq == write_seq:
+                self._partitions.clear()
+                self._locations.clear()
+                self._deleted.clear()
+                self._dirty = False
+            self._last_reload_check = time.monotonic()
+            logger.info(
+                "Local vector store flushed",
+                path=self.path,
+                version=self._base.version,
+                total_vectors=len(self._base),
+                pending_writes=self._dirty,
+            )
+
+    def _publish(
+        self,
+        overlay: List[Tuple[str, str, np.ndarray, Dict[str, Any]]],
+        hidden: Dict[str, Set[str]],
+    ) -> MappedVectorIndex:
+        """Write and map a new version (runs in a worker thread)."""
+        with self._publish_lock():
+            # Rebase onto whatever another process may have published meanwhile
+            base = self._base
+            latest = read_current_version(self.path)
+            if latest is not None and (base is None or latest != base.version):
+                base = open_current(self.path) or base
+
+            version = publish_index(
+                self.path,
+                self.dimension,
+                self._iter_rows(base, overlay, hidden),
+                quantization=self.quantization,
+                keep_versions=self.keep_versions,
+            )
+            return MappedVectorIndex(self.path, version)
+
+    @staticmethod
+    def _iter_rows(
+        base: Optional[MappedVectorIndex],
+        overlay: List[Tuple[str, str, np.ndarray, Dict[str, Any]]],
+        hidden: Dict[str, Set[str]],
+    ) -> Iterator[Tuple[str, str, np.ndarray, Dict[str, Any]]]:
+        """All live vectors as (namespace, id, normalized vector, metadata)."""
+        if base is not None:
+            for namespace in base.namespaces():
+                namespace_hidden = hidden.get(namespace, set())
+                for row in base.namespace_rows(namespace):
+                    vector_id = base.id_at(row)
+                    if vector_id not in namespace_hidden:
+                        yield namespace, vector_id, np.asarray(base.vectors[row]), base.metadata_at(row)
+
+        yield from overlay
+
+    @contextmanager
+    def _publish_lock(self):
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, ".lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+_store_instance: Optional[LocalVectorStore] = None
+
+
+def get_local_vector_store() -> LocalVectorStore:
+    """Get singleton instance of LocalVectorStore."""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = LocalVectorStore(
+            dimension=settings.VECTOR_DIMENSION,
+            path=settings.LOCAL_VECTOR_STORE_PATH or None,
+            quantization=settings.LOCAL_VECTOR_STORE_QUANTIZATION,
+            rescore_factor=settings.LOCAL_VECTOR_STORE_RESCORE_FACTOR,
+            reload_seconds=settings.LOCAL_VECTOR_STORE_RELOAD_SECONDS,
+            keep_versions=settings.LOCAL_VECTOR_STORE_KEEP_VERSIONS,
+        )
+    return _store_instance
+
+
+__all__ = ["LocalVectorStore", "get_local_vector_store"]
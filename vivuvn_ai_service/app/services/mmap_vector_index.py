@@ -0,0 +1,455 @@
+"""
+Read-only, memory-mapped on-disk vector index.
+
+Layout under the index root directory:
+
+    CURRENT                 name of the active version directory
+    v<ms>-<pid>/
+        index.json          format, dimension, quantization, partition row ranges
+                            and the names of the numeric metadata columns
+        vectors.npy         float32 [N, D], L2-normalized rows
+        vectors_int8.npy    int8 [N, D] (int8 quantization only)
+        scales.npy          float32 [N] per-row dequantization scales (int8 only)
+        ids.npy             bytes [N] UTF-8 vector ids
+        keys.npy            bytes [N] sorted "<namespace>\\0<id>" lookup keys
+        key_rows.npy        int64 [N] row of each lookup key
+        metadata.npy        uint8 UTF-8 JSON metadata of all rows, concatenated
+        metadata_offsets.npy  int64 [N + 1] start offset of each row's metadata
+        column_<i>.npy      float64 [N] numeric metadata field i (NaN if missing)
+
+Rows are sorted by (namespace, province), so every province is one contiguous
+row range. Every array is opened with np.load(mmap_mode="r"): worker processes
+map the same files and share the OS page cache instead of each holding its own
+copy, and opening a version reads only the small index.json header. Metadata is
+decoded per row, on access; ID lookups are binary searches over keys.npy.
+
+A new version is written to a fresh directory and published by atomically
+replacing CURRENT, so readers never see a partially written index. Readers keep
+using the mapping they opened until they reload.
+
+In int8 mode the scan reads the quantized matrix (4x fewer bytes) and only the
+best rescore_factor * top_k candidates are rescored with float32 vectors.
+"""
+
+import json
+import os
+import shutil
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import structlog
+
+from app.utils.metadata_filter import matches_filter, split_range_filter
+
+logger = structlog.get_logger(__name__)
+
+INDEX_FORMAT = 2
+CURRENT_FILE = "CURRENT"
+QUANTIZATIONS = ("float32", "int8")
+
+# Rows dequantized per step during int8 scans (bounds temporary memory)
+_SCAN_BLOCK_ROWS = 4096
+
+# Separates namespace and vector id in lookup keys (never part of either)
+_KEY_SEPARATOR = b"\x00"
+
+_RANGE_COMPARATORS = {
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+}
+
+
+class MappedVectorIndex:
+    """One published, immutable version of the on-disk index."""
+
+    def __init__(self, root: str, version: str):
+        """
+        Map a published index version.
+
+        Args:
+            root: Index root directory
+            version: Version directory name
+
+        Raises:
+            OSError, ValueError: If the version is missing or corrupt
+        """
+        self.root = root
+        self.version = version
+        directory = os.path.join(root, version)
+
+        with open(os.path.join(directory, "index.json"), "r", encoding="utf-8") as f:
+            header = json.load(f)
+        if header.get("format") != INDEX_FORMAT:
+            raise ValueError(f"Unsupported index format: {header.get('format')}")
+
+        self.dimension: int = header["dimension"]
+        self.quantization: str = header["quantization"]
+
+        def load(name: str) -> np.ndarray:
+            return np.load(os.path.join(directory, name), mmap_mode="r")
+
+        self.vectors = load("vectors.npy")
+        self.vectors_int8 = None
+        self.scales = None
+        if self.quantization == "int8":
+            self.vectors_int8 = load("vectors_int8.npy")
+            self.scales = load("scales.npy")
+
+        self._ids = load("ids.npy")
+        self._keys = load("keys.npy")
+        self._key_rows = load("key_rows.npy")
+        self._metadata = load("metadata.npy")
+        self._metadata_offsets = load("metadata_offsets.npy")
+        # metadata field → float64 column (NaN where missing/non-numeric)
+        self._columns: Dict[str, np.ndarray] = {
+            field: load(f"column_{i}.npy") for i, field in enumerate(header["columns"])
+        }
+
+        if not len(self.vectors) == len(self._ids) == len(self._keys) == len(self._metadata_offsets) - 1:
+            raise ValueError("Index row count does not match its records")
+
+        # namespace → province → (start, end) row range
+        self.partitions: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        for namespace, province, start, end in header["partitions"]:
+            self.partitions.setdefault(namespace, {})[province] = (start, end)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def id_at(self, row: int) -> str:
+        """Vector ID of a row."""
+        return self._ids[row].decode("utf-8")
+
+    def metadata_at(self, row: int) -> Dict[str, Any]:
+        """Metadata of a row (decoded on every call; callers may modify it)."""
+        start, end = self._metadata_offsets[row], self._metadata_offsets[row + 1]
+        return json.loads(self._metadata[start:end].tobytes().decode("utf-8"))
+
+    def row_of(self, namespace: str, vector_id: str) -> Optional[int]:
+        """Row of a vector ID, or None if the namespace does not contain it."""
+        key = _lookup_key(namespace, vector_id)
+        if len(key) > self._keys.dtype.itemsize:
+            return None
+        i = int(np.searchsorted(self._keys, np.array(key, dtype=self._keys.dtype)))
+        if i < len(self._keys) and self._keys[i] == key:
+            return int(self._key_rows[i])
+        return None
+
+    def rows_of(self, namespace: str, vector_ids: Iterable[str]) -> np.ndarray:
+        """Rows of the vector IDs the namespace contains (unknown IDs are skipped)."""
+        rows = (self.row_of(namespace, vector_id) for vector_id in vector_ids)
+        return np.array([row for row in rows if row is not None], dtype=np.int64)
+
+    def ids_with_prefix(self, namespace: str, prefix: str) -> List[str]:
+        """Vector IDs of a namespace starting with a prefix."""
+        key = _lookup_key(namespace, prefix)
+        width = self._keys.dtype.itemsize
+        if len(key) > width:
+            return []
+        # 0xFF never occurs in UTF-8, so the padded key sorts after every key with the prefix
+        lo = int(np.searchsorted(self._keys, np.array(key, dtype=self._keys.dtype)))
+        upper = np.array(key + b"\xff" * (width - len(key)), dtype=self._keys.dtype)
+        hi = int(np.searchsorted(self._keys, upper, "right"))
+        return [self.id_at(int(row)) for row in self._key_rows[lo:hi]]
+
+    def namespaces(self) -> List[str]:
+        """Namespaces with at least one row."""
+        return list(self.partitions)
+
+    def namespace_size(self, namespace: str) -> int:
+        """Number of rows in a namespace."""
+        return sum(end - start for start, end in self.partitions.get(namespace, {}).values())
+
+    def namespace_rows(self, namespace: str) -> Iterator[int]:
+        """Rows of a namespace, in row order."""
+        for start, end in self.partitions.get(namespace, {}).values():
+            yield from range(start, end)
+
+    def search(
+        self,
+        query: np.ndarray,
+        namespace: str,
+        top_k: int,
+        province: Optional[str] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        hidden: Optional[Set[str]] = None,
+        rescore_factor: int = 4,
+    ) -> List[Tuple[float, int]]:
+        """
+        Exact (float32) or quantized-then-rescored (int8) cosine top-k.
+
+        Args:
+            query: L2-normalized float32 query vector
+            namespace: Namespace to search
+            top_k: Number of results
+            province: Restrict the scan to one province's row range
+            filter_dict: Metadata filter applied to candidate rows (numeric range
+                         conditions such as a latitude/longitude box are
+                         evaluated as column masks before the rest)
+            hidden: Vector IDs to exclude (deleted/overwritten since publishing)
+            rescore_factor: int8 candidates per result rescored with float32
+
+        Returns:
+            (score, row) pairs, best first
+        """
+        partitions = self.partitions.get(namespace, {})
+        if province is not None:
+            ranges = [partitions[province]] if province in partitions else []
+        else:
+            ranges = list(partitions.values())
+
+        quantized = self.quantization == "int8"
+        candidate_count = top_k * max(1, rescore_factor) if quantized else top_k
+        range_filter, filter_dict = split_range_filter(filter_dict)
+        if province is not None:
+            # Every row of the province's range matches the province condition
+            filter_dict.pop("province", None)
+        hidden_rows = self.rows_of(namespace, hidden) if hidden else None
+
+        rows_list: List[np.ndarray] = []
+        scores_list: List[np.ndarray] = []
+        for start, end in ranges:
+            rows = np.arange(start, end)
+            in_range = self._range_mask(range_filter, start, end) if range_filter else None
+            if in_range is not None and not in_range.any():
+                continue
+
+            scores = self._scan(query, start, end) if quantized else np.asarray(self.vectors[start:end] @ query)
+            if in_range is not None:
+                rows, scores = rows[in_range], scores[in_range]
+            if hidden_rows is not None and hidden_rows.size:
+                visible = ~np.isin(rows, hidden_rows)
+                rows, scores = rows[visible], scores[visible]
+            if rows.size == 0:
+                continue
+
+            if filter_dict:
+                # Decode metadata best-first and stop once enough rows matched
+                best = []
+                for i in np.argsort(-scores).tolist():
+                    if matches_filter(self.metadata_at(int(rows[i])), filter_dict):
+                        best.append(i)
+                        if len(best) == candidate_count:
+                            break
+                if not best:
+                    continue
+            else:
+                k = min(candidate_count, rows.size)
+                best = np.argpartition(-scores, k - 1)[:k]
+            rows_list.append(rows[best])
+            scores_list.append(scores[best])
+
+        if not rows_list:
+            return []
+
+        rows = np.concatenate(rows_list)
+        scores = np.concatenate(scores_list)
+
+        if quantized:
+            # Keep the best approximate candidates, then rescore them exactly
+            k = min(candidate_count, rows.size)
+            best = np.argpartition(-scores, k - 1)[:k]
+            rows = np.sort(rows[best])
+            scores = np.asarray(self.vectors[rows] @ query)
+
+        order = np.argsort(-scores)[:top_k]
+        return [(float(scores[i]), int(rows[i])) for i in order]
+
+    def _range_mask(self, range_filter: Dict[str, Dict[str, float]], start: int, end: int) -> np.ndarray:
+        """Rows of [start, end) satisfying every numeric range condition (NaN never matches)."""
+        mask = np.ones(end - start, dtype=bool)
+        for field, condition in range_filter.items():
+            column = self._columns.get(field)
+            if column is None:
+                # No row has a numeric value for the field
+                return np.zeros(end - start, dtype=bool)
+            column = column[start:end]
+            for operator, bound in condition.items():
+                mask &= _RANGE_COMPARATORS[operator](column, bound)
+        return mask
+
+    def _scan(self, query: np.ndarray, start: int, end: int) -> np.ndarray:
+        """Approximate scores from the int8 matrix, one block at a time."""
+        scores = np.empty(end - start, dtype=np.float32)
+        for block_start in range(start, end, _SCAN_BLOCK_ROWS):
+            block_end = min(end, block_start + _SCAN_BLOCK_ROWS)
+            block = self.vectors_int8[block_start:block_end].astype(np.float32)
+            scores[block_start - start:block_end - start] = (block @ query) * self.scales[block_start:block_end]
+        return scores
+
+
+def read_current_version(root: str) -> Optional[str]:
+    """Name of the published version, or None if nothing was published yet."""
+    try:
+        with open(os.path.join(root, CURRENT_FILE), "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def open_current(root: str) -> Optional[MappedVectorIndex]:
+    """
+    Map the published version of an index.
+
+    Args:
+        root: Index root directory
+
+    Returns:
+        MappedVectorIndex, or None if nothing was published or it is unreadable
+    """
+    version = read_current_version(root)
+    if version is None:
+        return None
+    try:
+        return MappedVectorIndex(root, version)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Ignoring unreadable vector index", root=root, version=version, error=str(e))
+        return None
+
+
+def publish_index(
+    root: str,
+    dimension: int,
+    rows: Iterable[Tuple[str, str, np.ndarray, Dict[str, Any]]],
+    quantization: str = "float32",
+    keep_versions: int = 2,
+) -> str:
+    """
+    Write a new index version and make it current.
+
+    Args:
+        root: Index root directory
+        dimension: Vector dimension
+        rows: (namespace, vector_id, normalized float32 vector, metadata) tuples
+        quantization: "float32" or "int8"
+        keep_versions: Published versions kept on disk (older ones are removed;
+                       processes that still map them keep working on POSIX)
+
+    Returns:
+        str: Name of the published version
+
+    Raises:
+        ValueError: If the quantization mode is unknown
+    """
+    if quantization not in QUANTIZATIONS:
+        raise ValueError(f"Unknown quantization: {quantization} (expected one of {QUANTIZATIONS})")
+
+    ordered = sorted(rows, key=lambda row: (row[0], (row[3] or {}).get("province") or "", row[1]))
+
+    matrix = (
+        np.stack([vector for _, _, vector, _ in ordered]).astype(np.float32, copy=False)
+        if ordered else np.zeros((0, dimension), dtype=np.float32)
+    )
+
+    partitions: List[List[Any]] = []
+    for row, (namespace, _, _, meta) in enumerate(ordered):
+        province = (meta or {}).get("province") or ""
+        if partitions and partitions[-1][0] == namespace and partitions[-1][1] == province:
+            partitions[-1][3] = row + 1
+        else:
+            partitions.append([namespace, province, row, row + 1])
+
+    os.makedirs(root, exist_ok=True)
+    version = f"v{int(time.time() * 1000)}-{os.getpid()}"
+    while os.path.exists(os.path.join(root, version)):
+        version += "a"
+    tmp_directory = os.path.join(root, f".{version}.tmp")
+    os.makedirs(tmp_directory)
+
+    _save_array(os.path.join(tmp_directory, "vectors.npy"), matrix)
+    if quantization == "int8":
+        scales = np.abs(matrix).max(axis=1) / 127.0 if len(matrix) else np.zeros(0, dtype=np.float32)
+        scales = np.where(scales > 0, scales, 1.0).astype(np.float32)
+        quantized = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+        _save_array(os.path.join(tmp_directory, "vectors_int8.npy"), quantized)
+        _save_array(os.path.join(tmp_directory, "scales.npy"), scales)
+
+    columns = _write_records(tmp_directory, ordered)
+
+    header = {
+        "format": INDEX_FORMAT,
+        "dimension": dimension,
+        "quantization": quantization,
+        "partitions": partitions,
+        "columns": columns,
+    }
+    with open(os.path.join(tmp_directory, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(header, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.rename(tmp_directory, os.path.join(root, version))
+
+    current_tmp = os.path.join(root, f"{CURRENT_FILE}.tmp")
+    with open(current_tmp, "w", encoding="utf-8") as f:
+        f.write(version)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(current_tmp, os.path.join(root, CURRENT_FILE))
+
+    _remove_old_versions(root, keep_versions)
+    logger.info("Vector index published", root=root, version=version, rows=len(ordered), quantization=quantization)
+    return version
+
+
+def _lookup_key(namespace: str, vector_id: str) -> bytes:
+    return namespace.encode("utf-8") + _KEY_SEPARATOR + vector_id.encode("utf-8")
+
+
+def _write_records(
+    directory: str,
+    ordered: Sequence[Tuple[str, str, np.ndarray, Dict[str, Any]]],
+) -> List[str]:
+    """Write ids, lookup keys, metadata and numeric columns; return the column field names."""
+    ids = [vector_id.encode("utf-8") for _, vector_id, _, _ in ordered]
+    keys = [_lookup_key(namespace, vector_id) for namespace, vector_id, _, _ in ordered]
+    key_order = sorted(range(len(keys)), key=keys.__getitem__)
+
+    encoded = [json.dumps(meta or {}, ensure_ascii=False).encode("utf-8") for _, _, _, meta in ordered]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(item) for item in encoded])
+
+    numeric: Dict[str, np.ndarray] = {}
+    for row, (_, _, _, meta) in enumerate(ordered):
+        for field, value in (meta or {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                column = numeric.get(field)
+                if column is None:
+                    column = numeric[field] = np.full(len(ordered), np.nan, dtype=np.float64)
+                column[row] = value
+
+    _save_array(os.path.join(directory, "ids.npy"), np.array(ids, dtype=f"S{max([1] + [len(i) for i in ids])}"))
+    _save_array(
+        os.path.join(directory, "keys.npy"),
+        np.array([keys[i] for i in key_order], dtype=f"S{max([1] + [len(k) for k in keys])}"),
+    )
+    _save_array(os.path.join(directory, "key_rows.npy"), np.array(key_order, dtype=np.int64))
+    _save_array(os.path.join(directory, "metadata.npy"), np.frombuffer(b"".join(encoded), dtype=np.uint8))
+    _save_array(os.path.join(directory, "metadata_offsets.npy"), offsets)
+
+    fields = sorted(numeric)
+    for i, field in enumerate(fields):
+        _save_array(os.path.join(directory, f"column_{i}.npy"), numeric[field])
+    return fields
+
+
+def _save_array(path: str, array: np.ndarray) -> None:
+    with open(path, "wb") as f:
+        np.save(f, array)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _remove_old_versions(root: str, keep_versions: int) -> None:
+    versions: Sequence[str] = sorted(
+        (name for name in os.listdir(root) if name.startswith("v") and os.path.isdir(os.path.join(root, name))),
+        key=lambda name: os.path.getmtime(os.path.join(root, name)),
+    )
+    for name in versions[:max(0, len(versions) - max(1, keep_versions))]:
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+__all__ = ["MappedVectorIndex", "open_current", "publish_index", "read_current_version"]
@@ -6,30 +6,50 @@ It uses the PineconeClient for connection pooling and index access.
 
 Architecture:
 - PineconeClient: Low-level Pinecone SDK operations
-- PineconeService: High-level business logic (search, upsert, stats, health checks)
+- PineconeService: High-level business logic (search, upsert, stats, health checks),
+  the Pinecone implementation of VectorStore
 """
 
 import asyncio
+import math
 import structlog
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from app.core.config import settings
 from app.clients.pinecone_client import get_pinecone_client, PineconeClientError
+from app.services.vector_store import VectorStore, VectorStoreError
+from app.utils.executors import get_executor
 
 logger = structlog.get_logger(__name__)
 
 
-class PineconeServiceError(Exception):
+class PineconeServiceError(VectorStoreError):
     """Pinecone service-specific exception."""
     pass
 
 
-class PineconeService:
+def _normalized(values: List[float]) -> List[float]:
+    """Scale a dense vector to unit length (dotproduct indexes then rank like cosine)."""
+    norm = math.sqrt(sum(value * value for value in values))
+    return [value / norm for value in values] if norm > 0 else list(values)
+
+
+def _dense_query(vector: List[float]) -> List[float]:
+    """Dense query as sent to the index (unit length on dotproduct indexes, like stored vectors)."""
+    return _normalized(vector) if settings.PINECONE_METRIC == "dotproduct" else vector
+
+
+class PineconeService(VectorStore):
     """
     High-level Pinecone service for vector database operations.
 
     This service handles vector search, CRUD operations, index management,
     and health checks. It uses PineconeClient for connection pooling.
+
+    Every SDK call runs on the dedicated, instrumented "pinecone" executor
+    (PINECONE_EXECUTOR_WORKERS threads), never on the event loop. The index handle (existence check/creation
+    and host lookup) is resolved once by initialize(), called at startup, or
+    lazily by the first operation.
     """
 
     def __init__(
@@ -58,24 +78,57 @@ class PineconeService:
         self.index_name = index_name
         self.pool_threads = pool_threads
 
+        self.index = None
+        self._init_lock = asyncio.Lock()
+        self._executor = get_executor("pinecone")
+
         try:
-            # Get singleton Pinecone client
+            # Get singleton Pinecone client (no network calls)
             self.pinecone_client = get_pinecone_client()
+        except PineconeClientError as e:
+            logger.error("Failed to initialize Pinecone service", error=str(e))
+            raise PineconeServiceError(f"Failed to initialize Pinecone service: {e}")
 
-            # Create index if it doesn't exist
-            self._ensure_index_exists()
+    async def initialize(self) -> None:
+        """
+        Resolve the index handle once (create index if missing, look up its host).
 
-            # Get index reference with connection pooling
-            self.index = self.pinecone_client.get_index(
-                index_name=self.index_name,
-                pool_threads=self.pool_threads
-            )
+        Safe to call concurrently and repeatedly; only the first successful call
+        does network I/O.
+
+        Raises:
+            PineconeServiceError: If the index cannot be created or accessed
+        """
+        if self.index is not None:
+            return
+
+        async with self._init_lock:
+            if self.index is not None:
+                return
+
+            await self._run(self._ensure_index_exists)
+
+            try:
+                # Get index reference with connection pooling
+                self.index = await self._run(
+                    self.pinecone_client.get_index,
+                    index_name=self.index_name,
+                    pool_threads=self.pool_threads
+                )
+            except PineconeClientError as e:
+                logger.error("Failed to initialize Pinecone service", error=str(e))
+                raise PineconeServiceError(f"Failed to initialize Pinecone service: {e}")
 
             logger.info("Pinecone service initialized", index_name=self.index_name)
 
-        except PineconeClientError as e:
-            logger.error("Failed to initialize Pinecone service", error=str(e))
-            raise PineconeServiceError(f"Failed to initialize Pinecone service: {e}")
+    async def _run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking SDK call on the Pinecone executor."""
+        return await self._executor.run(fn, *args, **kwargs)
+
+    async def _index_call(self, method: str, *args, **kwargs) -> Any:
+        """Call an index method on the Pinecone executor, resolving the index first."""
+        await self.initialize()
+        return await self._run(getattr(self.index, method), *args, **kwargs)
 
     def _ensure_index_exists(self):
         """Create index if it doesn't exist."""
@@ -83,7 +136,7 @@ class PineconeService:
             created = self.pinecone_client.create_index(
                 name=self.index_name,
                 dimension=settings.VECTOR_DIMENSION,
-                metric="cosine",
+                metric=settings.PINECONE_METRIC,  # "dotproduct" enables sparse-dense (hybrid) vectors
                 cloud=self.cloud,
                 region=self.region
             )
@@ -97,49 +150,16 @@ class PineconeService:
             logger.error("Failed to ensure index exists", error=str(e))
             raise PineconeServiceError(f"Failed to create/access index: {e}")
 
-    async def search_places(
-        self,
-        query_embedding: List[float],
-        top_k: int = 10,
-        filter_dict: Optional[Dict[str, Any]] = None,
-        province_filter: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """
-        Search for places using vector similarity with enhanced filtering.
-
-        Args:
-            query_embedding: Query vector embedding (768-dimensional)
-            top_k: Number of results to return
-            filter_dict: Optional metadata filters (e.g., {"province": "Hà Nội"})
-            province_filter: Filter by specific province
-            min_rating: Minimum rating filter (0.0-5.0)
-            place_ids: Filter by specific place IDs
-
-        Returns:
-            List of matching places with metadata
-        """
-        # Build comprehensive filter
-        combined_filter = filter_dict.copy() if filter_dict else {}
-
-        # Add province filter
-        if province_filter:
-            combined_filter["province"] = {"$eq": province_filter}
-
-        # Use async search
-        return await self.search(
-            vector=query_embedding,
-            top_k=top_k,
-            namespace=settings.PINECONE_DEFAULT_NAMESPACE,
-            filter_dict=combined_filter if combined_filter else None,
-            include_metadata=True
-        )
-
     async def upsert_vectors(self, vectors: List[Dict[str, Any]], namespace: Optional[str] = None) -> bool:
         """
         Upsert vectors to Pinecone index.
 
+        On dotproduct indexes dense values are normalized to unit length and
+        'sparse_values' are stored for hybrid search; other metrics cannot hold
+        sparse values, so they are dropped.
+
         Args:
-            vectors: List of dicts with 'id', 'values', and 'metadata'
+            vectors: List of dicts with 'id', 'values', 'metadata' and optional 'sparse_values'
                      Format: [{"id": "...", "values": [...], "metadata": {...}}]
             namespace: Pinecone namespace (default: uses PINECONE_DEFAULT_NAMESPACE from settings)
 
@@ -151,9 +171,17 @@ class PineconeService:
             if namespace is None:
                 namespace = settings.PINECONE_DEFAULT_NAMESPACE
 
+            if settings.PINECONE_METRIC == "dotproduct":
+                vectors = [{**vector, "values": _normalized(vector["values"])} for vector in vectors]
+            elif any("sparse_values" in vector for vector in vectors):
+                vectors = [
+                    {key: value for key, value in vector.items() if key != "sparse_values"}
+                    for vector in vectors
+                ]
+
             # Pinecone v6+ accepts dict format directly - no conversion needed
-            await asyncio.to_thread(
-                self.index.upsert,
+            await self._index_call(
+                "upsert",
                 vectors=vectors,
                 namespace=namespace
             )
@@ -167,6 +195,9 @@ class PineconeService:
         """
         Delete vectors by IDs from Pinecone index.
 
+        Runs off the event loop and deletes in slices of 1000 IDs (Pinecone's
+        per-request limit), so one call covers any number of places.
+
         Args:
             ids: List of vector IDs to delete
             namespace: Pinecone namespace (default: uses PINECONE_DEFAULT_NAMESPACE from settings)
@@ -179,16 +210,135 @@ class PineconeService:
             if namespace is None:
                 namespace = settings.PINECONE_DEFAULT_NAMESPACE
 
-            self.index.delete(ids=ids, namespace=namespace)
+            for start in range(0, len(ids), 1000):
+                await self._index_call(
+                    "delete",
+                    ids=ids[start:start + 1000],
+                    namespace=namespace
+                )
+            logger.info(f"Deleted {len(ids)} vectors from namespace '{namespace}'")
             return True
         except Exception as e:
-            logger.error(f"Failed to delete vectors {ids}: {e}")
+            logger.error(f"Failed to delete {len(ids)} vectors from namespace '{namespace}': {e}")
             return False
 
+    async def list_ids(self, prefix: str, namespace: Optional[str] = None) -> List[str]:
+        """
+        List vector IDs starting with a prefix (e.g. "place_<id>_chunk_").
+
+        Uses Pinecone's ID listing, which reads no vectors and scores nothing.
+
+        Args:
+            prefix: Vector ID prefix
+            namespace: Pinecone namespace (default: uses PINECONE_DEFAULT_NAMESPACE from settings)
+
+        Returns:
+            List of matching vector IDs
+
+        Raises:
+            PineconeServiceError: If listing fails
+        """
+        if namespace is None:
+            namespace = settings.PINECONE_DEFAULT_NAMESPACE
+
+        def _list(index) -> List[str]:
+            ids: List[str] = []
+            for page in index.list(prefix=prefix, namespace=namespace):
+                ids.extend(page)
+            return ids
+
+        try:
+            await self.initialize()
+            return await self._run(_list, self.index)
+        except Exception as e:
+            logger.error(f"Failed to list vector IDs with prefix '{prefix}' in namespace '{namespace}': {e}")
+            raise PineconeServiceError(f"Vector ID listing failed: {e}")
+
+    async def fetch_metadata(
+        self,
+        ids: List[str],
+        namespace: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch metadata for vectors by ID (cheap point lookup, no similarity query).
+
+        Args:
+            ids: Vector IDs to fetch (missing IDs are simply absent from the result)
+            namespace: Pinecone namespace (default: uses PINECONE_DEFAULT_NAMESPACE from settings)
+
+        Returns:
+            Dict mapping found vector IDs to their metadata
+
+        Raises:
+            PineconeServiceError: If the fetch fails
+        """
+        vectors = await self.fetch_vectors(ids, namespace=namespace)
+        return {vector_id: vector["metadata"] for vector_id, vector in vectors.items()}
+
+    async def fetch_vectors(
+        self,
+        ids: List[str],
+        namespace: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch vectors with their values and metadata by ID.
+
+        Args:
+            ids: Vector IDs to fetch (missing IDs are simply absent from the result)
+            namespace: Pinecone namespace (default: uses PINECONE_DEFAULT_NAMESPACE from settings)
+
+        Returns:
+            Dict mapping found vector IDs to {"id", "values", "metadata"} (plus
+            "sparse_values" for hybrid vectors)
+
+        Raises:
+            PineconeServiceError: If the fetch fails
+        """
+        if not ids:
+            return {}
+
+        if namespace is None:
+            namespace = settings.PINECONE_DEFAULT_NAMESPACE
+
+        try:
+            found: Dict[str, Dict[str, Any]] = {}
+            # Fetch is limited per request, so look up in slices
+            for start in range(0, len(ids), 100):
+                response = await self._index_call(
+                    "fetch",
+                    ids=ids[start:start + 100],
+                    namespace=namespace
+                )
+                vectors = response.get('vectors', {}) if isinstance(response, dict) else getattr(response, 'vectors', {})
+                for vector_id, vector in (vectors or {}).items():
+                    if isinstance(vector, dict):
+                        values, metadata = vector.get('values'), vector.get('metadata')
+                        sparse = vector.get('sparse_values')
+                    else:
+                        values, metadata = getattr(vector, 'values', None), getattr(vector, 'metadata', None)
+                        sparse = getattr(vector, 'sparse_values', None)
+                    found[vector_id] = {
+                        "id": vector_id,
+                        "values": list(values or []),
+                        "metadata": metadata or {},
+                    }
+                    if sparse:
+                        indices = sparse.get('indices') if isinstance(sparse, dict) else getattr(sparse, 'indices', None)
+                        sparse_values = sparse.get('values') if isinstance(sparse, dict) else getattr(sparse, 'values', None)
+                        if indices:
+                            found[vector_id]["sparse_values"] = {
+                                "indices": list(indices),
+                                "values": list(sparse_values or []),
+                            }
+            return found
+        except Exception as e:
+            logger.error(f"Failed to fetch vectors in namespace '{namespace}': {e}")
+            raise PineconeServiceError(f"Vector fetch failed: {e}")
+
     async def get_index_stats(self) -> Dict[str, Any]:
         """Get Pinecone index statistics as JSON-serializable dict."""
         try:
-            stats = self.index.describe_index_stats()
+            stats = await self._index_call("describe_index_stats")
 
             # Extract values from Pinecone stats object (may be dict or object)
             total_vectors = stats.get("total_vector_count", 0) if isinstance(stats, dict) else getattr(stats, 'total_vector_count', 0)
@@ -226,6 +376,8 @@ class PineconeService:
         namespace: Optional[str] = None,
         filter_dict: Optional[Dict[str, Any]] = None,
         include_metadata: bool = True,
+        sparse_vector: Optional[Dict[str, List]] = None,
+        normalize_query: bool = True,
         attempt: int = 0,
         max_retries: int = 2
     ) -> List[Dict[str, Any]]:
@@ -238,6 +390,9 @@ class PineconeService:
             namespace: Namespace to search (default: uses PINECONE_DEFAULT_NAMESPACE from settings)
             filter_dict: Metadata filters
             include_metadata: Include metadata in results
+            sparse_vector: Optional sparse query vector (dotproduct indexes only)
+            normalize_query: Scale the query to unit length on dotproduct indexes, so
+                             scores are cosine similarities (off for pre-scaled hybrid queries)
             attempt: Current retry attempt (0-based)
             max_retries: Maximum number of retries (default: 2 for 3 total attempts)
 
@@ -249,17 +404,21 @@ class PineconeService:
             if namespace is None:
                 namespace = settings.PINECONE_DEFAULT_NAMESPACE
 
+            # Only sent for sparse-dense (hybrid) queries
+            sparse_kwargs = {"sparse_vector": sparse_vector} if sparse_vector else {}
+
             # Run blocking Pinecone call in thread pool (async-safe)
-            response = await asyncio.to_thread(
-                self.index.query,
-                vector=vector,
+            response = await self._index_call(
+                "query",
+                vector=_dense_query(vector) if normalize_query else vector,
                 top_k=top_k,
                 namespace=namespace,
                 filter=filter_dict,
                 include_metadata=include_metadata,
                 include_values=False,  # Optimization: don't return vectors
-                metric="cosine",       # Explicit metric
-                show_progress=False    # Production mode
+                metric=settings.PINECONE_METRIC,  # Explicit metric
+                show_progress=False,   # Production mode
+                **sparse_kwargs
             )
 
             # Process results
@@ -296,6 +455,8 @@ class PineconeService:
                     namespace=namespace,
                     filter_dict=filter_dict,
                     include_metadata=include_metadata,
+                    sparse_vector=sparse_vector,
+                    normalize_query=normalize_query,
                     attempt=attempt + 1,
                     max_retries=max_retries
                 )
@@ -323,6 +484,8 @@ class PineconeService:
                     namespace=namespace,
                     filter_dict=filter_dict,
                     include_metadata=include_metadata,
+                    sparse_vector=sparse_vector,
+                    normalize_query=normalize_query,
                     attempt=attempt + 1,
                     max_retries=max_retries
                 )
@@ -330,6 +493,52 @@ class PineconeService:
                 logger.error(f"[Node 2/6] Vector search in namespace '{namespace}' failed: {e}")
                 raise PineconeServiceError(f"Vector search failed: {e}")
 
+    async def search_hybrid(
+        self,
+        vector: List[float],
+        sparse_vector: Dict[str, List],
+        top_k: int = 10,
+        namespace: Optional[str] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        alpha: float = 0.75
+    ) -> List[Dict[str, Any]]:
+        """
+        Hybrid search as one native sparse-dense query on dotproduct indexes.
+
+        The dense query is normalized and scaled by alpha, the sparse query by
+        1 - alpha, so scores are alpha * cosine + (1 - alpha) * BM25 score (stored
+        dense vectors are normalized on upsert). Other metrics use the in-process
+        fallback of VectorStore.search_hybrid.
+
+        Args:
+            vector: Query embedding vector
+            sparse_vector: Query vector from the BM25 sparse encoder
+            top_k: Number of results
+            namespace: Namespace to search
+            filter_dict: Metadata filters
+            alpha: Dense weight in [0, 1]
+
+        Returns:
+            List of results with id, hybrid score, and metadata
+        """
+        if settings.PINECONE_METRIC != "dotproduct":
+            return await super().search_hybrid(vector, sparse_vector, top_k, namespace, filter_dict, alpha)
+
+        dense = [value * alpha for value in _normalized(vector)]
+        sparse = {
+            "indices": list(sparse_vector["indices"]),
+            "values": [value * (1 - alpha) for value in sparse_vector["values"]],
+        }
+        return await self.search(
+            vector=dense,
+            top_k=top_k,
+            namespace=namespace,
+            filter_dict=filter_dict,
+            include_metadata=True,
+            sparse_vector=sparse if sparse["indices"] else None,
+            normalize_query=False,
+        )
+
     async def query_namespaces(
         self,
         vector: List[float],
@@ -352,11 +561,11 @@ class PineconeService:
             Combined results from all namespaces
         """
         try:
-            response = await asyncio.to_thread(
-                self.index.query_namespaces,
-                vector=vector,
+            response = await self._index_call(
+                "query_namespaces",
+                vector=_dense_query(vector),
                 namespaces=namespaces,
-                metric="cosine",
+                metric=settings.PINECONE_METRIC,
                 top_k=top_k,
                 include_values=False,
                 include_metadata=include_metadata,
@@ -391,74 +600,6 @@ class PineconeService:
             logger.error(f"Multi-namespace query failed: {e}")
             raise PineconeServiceError(f"Multi-namespace query failed: {e}")
 
-    async def query_by_metadata(
-        self,
-        place_id: str,
-        namespace: Optional[str] = None
-    ) -> List[str]:
-        """
-        Query Pinecone to find all vector IDs matching a place_id in metadata.
-
-        This is used by the delete operation to find all chunks (vectors) associated
-        with a place before deletion. This fixes the bug in the original data_loader
-        that hardcoded a max of 10 chunks.
-
-        Args:
-            place_id: Google Place ID to search for
-            namespace: Pinecone namespace (default: uses PINECONE_DEFAULT_NAMESPACE)
-
-        Returns:
-            List of vector IDs matching the place_id
-        """
-        try:
-            if namespace is None:
-                namespace = settings.PINECONE_DEFAULT_NAMESPACE
-
-            logger.info(
-                "Querying vectors by place_id",
-                place_id=place_id,
-                namespace=namespace,
-            )
-
-            # Use index.query with filter on place_id metadata
-            # We'll use a dummy vector and rely on metadata filtering
-            dummy_vector = [0.0] * settings.VECTOR_DIMENSION
-
-            response = await asyncio.to_thread(
-                self.index.query,
-                vector=dummy_vector,
-                top_k=1000,  # Max limit to ensure we get all vectors
-                namespace=namespace,
-                filter={"place_id": {"$eq": place_id}},
-                include_metadata=False,
-                include_values=False,
-                show_progress=False
-            )
-
-            # Extract vector IDs from response
-            matches = response.get('matches', []) if isinstance(response, dict) else getattr(response, 'matches', [])
-            vector_ids = [
-                match.get('id') if isinstance(match, dict) else getattr(match, 'id')
-                for match in matches
-            ]
-
-            logger.info(
-                "Found vectors by place_id",
-                place_id=place_id,
-                vector_count=len(vector_ids),
-            )
-
-            return vector_ids
-
-        except Exception as e:
-            logger.error(
-                "Failed to query vectors by place_id",
-                place_id=place_id,
-                namespace=namespace,
-                error=str(e),
-            )
-            return []
-
     async def health_check(self) -> bool:
         """
         Check if Pinecone service is healthy.
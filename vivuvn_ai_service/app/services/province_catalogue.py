@@ -0,0 +1,303 @@
+"""
+In-memory catalogue snapshots of small provinces.
+
+Many provinces have only a few dozen indexed places, so a search with the usual
+top_k returns nearly the whole province anyway. For those, a snapshot of every
+chunk vector (place metadata plus stored embeddings) is kept in memory and
+searched with one matrix-vector product instead of a remote vector query.
+
+Snapshots are built on first use from the chunk manifest (place IDs and chunk
+counts per province) and a fetch of the chunk vectors by ID. They are dropped
+by data writes in this process and expire after PROVINCE_CATALOGUE_TTL_SECONDS,
+which bounds staleness for writes made by other processes. Places missing from
+the chunk manifest are invisible to snapshots, so the catalogue is opt-in
+(PROVINCE_CATALOGUE_ENABLED).
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+from app.core.config import settings
+from app.services.chunk_manifest import ChunkManifest, chunk_vector_ids, get_chunk_manifest
+from app.services.sparse_encoder import SparseVector, get_sparse_encoder
+from app.services.vector_store import VectorStore, get_vector_store, province_namespace
+from app.utils.geo_utils import filter_within_radius
+from app.utils.metadata_filter import matches_filter
+from app.utils.single_flight import SingleFlight
+
+logger = structlog.get_logger(__name__)
+
+# Vector IDs per fetch request while building a snapshot
+_FETCH_BATCH_SIZE = 100
+
+
+class ProvinceSnapshot:
+    """Chunk vectors and metadata of one province (internal, immutable once built)."""
+
+    def __init__(
+        self,
+        province: str,
+        place_count: int,
+        ids: List[str],
+        vectors: np.ndarray,
+        metadata: List[Dict[str, Any]],
+    ):
+        self.province = province
+        self.place_count = place_count
+        self.ids = ids
+        self.vectors = vectors
+        self.metadata = metadata
+        self.rows = {vector_id: row for row, vector_id in enumerate(ids)}
+        self.built_at = time.monotonic()
+
+
+class ProvinceCatalogue:
+    """
+    Per-province snapshots for the small-province search fast path.
+
+    Intended for use from a single asyncio event loop.
+    """
+
+    def __init__(
+        self,
+        vector_store: Optional[VectorStore] = None,
+        manifest: Optional[ChunkManifest] = None,
+        ttl_seconds: float = 600.0,
+    ):
+        """
+        Initialize catalogue.
+
+        Args:
+            vector_store: Store the chunk vectors are fetched from (default: global store)
+            manifest: Chunk manifest listing places per province (default: global manifest)
+            ttl_seconds: Snapshot and place-count lifetime in seconds
+        """
+        self.vector_store = vector_store or get_vector_store()
+        self.manifest = manifest or get_chunk_manifest()
+        self.ttl_seconds = ttl_seconds
+        self._snapshots: Dict[str, ProvinceSnapshot] = {}
+        self._counts: Optional[Dict[Optional[str], int]] = None
+        self._counts_at = 0.0
+        # Bumped by every invalidation; snapshots built before it are not stored
+        self.generation = 0
+        self._build_flight: SingleFlight[Optional[ProvinceSnapshot]] = SingleFlight("province_catalogue")
+        self.hits = 0
+        self.builds = 0
+
+    def _expired(self, timestamp: float) -> bool:
+        return time.monotonic() - timestamp > self.ttl_seconds
+
+    async def _place_counts(self) -> Dict[Optional[str], int]:
+        if self._counts is None or self._expired(self._counts_at):
+            self._counts = await asyncio.to_thread(self.manifest.province_counts)
+            self._counts_at = time.monotonic()
+        return self._counts
+
+    async def get_snapshots(self, provinces: Sequence[str], max_places: int) -> Optional[List[ProvinceSnapshot]]:
+        """
+        Snapshots of the provinces, if together they have at most max_places places.
+
+        Args:
+            provinces: Province names (empty: all provinces, never served from snapshots)
+            max_places: Largest place count worth ranking in-process (the search top_k)
+
+        Returns:
+            One snapshot per province, or None if the provinces are too large,
+            unknown to the manifest, or a snapshot cannot be built
+        """
+        if not provinces:
+            return None
+
+        counts = await self._place_counts()
+        total = sum(counts.get(province, 0) for province in provinces)
+        if total == 0 or total > max_places:
+            return None
+
+        snapshots = []
+        for province in provinces:
+            snapshot = self._snapshots.get(province)
+            if snapshot is None or self._expired(snapshot.built_at):
+                snapshot = await self._build_flight.do(province, lambda province=province: self._build(province))
+            if snapshot is None:
+                return None
+            snapshots.append(snapshot)
+
+        self.hits += 1
+        return snapshots
+
+    async def _build(self, province: str) -> Optional[ProvinceSnapshot]:
+        generation = self.generation
+        try:
+            places = await asyncio.to_thread(self.manifest.list_province, province)
+            vector_ids = [
+                vector_id
+                for place_id, chunk_count in places.items()
+                for vector_id in chunk_vector_ids(place_id, chunk_count)
+            ]
+            namespace = province_namespace(province)
+            batches = await asyncio.gather(
+                *(
+                    self.vector_store.fetch_vectors(vector_ids[start:start + _FETCH_BATCH_SIZE], namespace=namespace)
+                    for start in range(0, len(vector_ids), _FETCH_BATCH_SIZE)
+                )
+            )
+        except Exception as e:
+            logger.warning("Failed to build province catalogue snapshot", province=province, error=str(e))
+            return None
+
+        fetched = {vector_id: vector for batch in batches for vector_id, vector in batch.items()}
+        ids = [vector_id for vector_id in vector_ids if vector_id in fetched and fetched[vector_id].get("values")]
+        if not ids:
+            return None
+        if len(ids) < len(vector_ids):
+            logger.warning(
+                "Province catalogue snapshot is missing chunk vectors",
+                province=province,
+                expected=len(vector_ids),
+                fetched=len(ids),
+            )
+
+        vectors = np.asarray([fetched[vector_id]["values"] for vector_id in ids], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms > 0, norms, 1.0)
+
+        snapshot = ProvinceSnapshot(
+            province=province,
+            place_count=len(places),
+            ids=ids,
+            vectors=vectors,
+            metadata=[fetched[vector_id].get("metadata") or {} for vector_id in ids],
+        )
+        self.builds += 1
+        if generation == self.generation:
+            self._snapshots[province] = snapshot
+        logger.info("Province catalogue snapshot built", province=province, places=len(places), chunks=len(ids))
+        return snapshot
+
+    def search(
+        self,
+        snapshots: Sequence[ProvinceSnapshot],
+        query_embedding: List[float],
+        top_k: int,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        sparse_vector: Optional[SparseVector] = None,
+        alpha: Optional[float] = None,
+        center: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Exact in-process counterpart of VectorStore.search_provinces over snapshots.
+
+        Args:
+            snapshots: Snapshots from get_snapshots
+            query_embedding: Query vector embedding
+            top_k: Number of results to return
+            filter_dict: Optional metadata filters
+            sparse_vector: Optional BM25 query vector (hybrid scoring as search_hybrid)
+            alpha: Dense weight for hybrid scoring (default: HYBRID_SEARCH_ALPHA)
+            center: Optional (latitude, longitude) of the search area
+            radius_km: Search radius around center in km
+
+        Returns:
+            Chunk matches {"id", "score", "metadata"}, best first
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm > 0:
+            query = query / norm
+
+        encoder = get_sparse_encoder() if sparse_vector is not None and sparse_vector.get("indices") else None
+        if alpha is None:
+            alpha = settings.HYBRID_SEARCH_ALPHA
+
+        results: List[Dict[str, Any]] = []
+        for snapshot in snapshots:
+            scores = snapshot.vectors @ query
+            for row, vector_id in enumerate(snapshot.ids):
+                metadata = snapshot.metadata[row]
+                if filter_dict and not matches_filter(metadata, filter_dict):
+                    continue
+                score = float(scores[row])
+                if encoder is not None:
+                    score = alpha * score + (1 - alpha) * encoder.score(sparse_vector, vector_id)
+                results.append({"id": vector_id, "score": score, "metadata": metadata})
+
+        if center is not None and radius_km:
+            results = filter_within_radius(results, center[0], center[1], radius_km)
+        results.sort(key=lambda result: result["score"], reverse=True)
+        return results[:top_k]
+
+    def get_vectors(self, ids: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Stored (normalized) vectors of snapshot chunks.
+
+        Args:
+            ids: Vector IDs
+
+        Returns:
+            Dict mapping the IDs found in a live snapshot to their values
+        """
+        found: Dict[str, List[float]] = {}
+        for vector_id in ids:
+            for snapshot in self._snapshots.values():
+                row = snapshot.rows.get(vector_id)
+                if row is not None:
+                    found[vector_id] = snapshot.vectors[row].tolist()
+                    break
+        return found
+
+    def invalidate_provinces(self, provinces: Iterable[Optional[str]]) -> None:
+        """
+        Drop snapshots of written/deleted provinces and the cached place counts.
+
+        Args:
+            provinces: Province names (None: unknown province, which drops every snapshot)
+        """
+        provinces = list(provinces)
+        self.generation += 1
+        self._counts = None
+        if any(not province for province in provinces):
+            self._snapshots.clear()
+        else:
+            for province in provinces:
+                self._snapshots.pop(province, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get catalogue statistics.
+
+        Returns:
+            dict: Cached snapshots with their place/chunk counts, fast-path hits and builds
+        """
+        return {
+            "snapshots": {
+                province: {"places": snapshot.place_count, "chunks": len(snapshot.ids)}
+                for province, snapshot in self._snapshots.items()
+            },
+            "hits": self.hits,
+            "builds": self.builds,
+        }
+
+
+# Global catalogue instance
+_province_catalogue: Optional[ProvinceCatalogue] = None
+
+
+def get_province_catalogue() -> Optional[ProvinceCatalogue]:
+    """
+    Get global province catalogue.
+
+    Returns:
+        ProvinceCatalogue, or None if PROVINCE_CATALOGUE_ENABLED is off
+    """
+    global _province_catalogue
+    if _province_catalogue is None and settings.PROVINCE_CATALOGUE_ENABLED:
+        _province_catalogue = ProvinceCatalogue(ttl_seconds=settings.PROVINCE_CATALOGUE_TTL_SECONDS)
+    return _province_catalogue
+
+
+__all__ = ["ProvinceCatalogue", "ProvinceSnapshot", "get_province_catalogue"]
@@ -0,0 +1,161 @@
+"""
+In-process search-result cache.
+
+Searches for the same destination and preferences return the same matches for
+every user, so results are cached by (provinces, semantic query, top_k, filter).
+A hit skips both the query embedding and the vector query.
+
+Entries are LRU-evicted (SEARCH_CACHE_SIZE) and expire after
+SEARCH_CACHE_TTL_SECONDS. Writes through DataManagementService invalidate every
+entry of the affected provinces in this process; the TTL bounds staleness for
+writes made by other processes.
+"""
+
+import json
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.utils.cache import TTLCache
+from app.utils.helpers import province_slug
+
+logger = structlog.get_logger(__name__)
+
+
+class SearchResultCache:
+    """
+    Province-scoped search-result cache.
+
+    Keys are (province slugs, query, top_k, filter); searches over every province
+    use an empty province tuple and are invalidated by any write.
+    """
+
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 600.0):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum cached searches before LRU eviction
+            ttl_seconds: Result lifetime in seconds
+        """
+        self._cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        # Bumped by every invalidation; results computed before it are not stored
+        self.generation = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(
+        provinces: Iterable[str],
+        query: str,
+        top_k: int,
+        filter_dict: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Tuple[str, ...], str, int, str]:
+        """
+        Build a cache key.
+
+        Args:
+            provinces: Searched province names (empty for all provinces)
+            query: Semantic query text
+            top_k: Number of results
+            filter_dict: Additional metadata filter
+
+        Returns:
+            Hashable cache key
+        """
+        slugs = tuple(sorted({province_slug(province) for province in provinces if province}))
+        filter_key = json.dumps(filter_dict or {}, sort_keys=True, ensure_ascii=False, default=str)
+        return slugs, query.strip().lower(), top_k, filter_key
+
+    def get(self, key: Hashable) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached results.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Copy of the cached result list (safe to reorder), or None on a miss
+        """
+        results = self._cache.get(key)
+        return list(results) if results is not None else None
+
+    def set(self, key: Hashable, results: List[Dict[str, Any]], generation: Optional[int] = None) -> None:
+        """
+        Store results.
+
+        Args:
+            key: Key from make_key
+            results: Search results
+            generation: Value of self.generation read before the search started;
+                        results are dropped if an invalidation happened since
+        """
+        if generation is not None and generation != self.generation:
+            return
+        self._cache.set(key, list(results))
+
+    def invalidate_provinces(self, provinces: Iterable[Optional[str]]) -> int:
+        """
+        Drop every cached search that covers one of the provinces.
+
+        Args:
+            provinces: Province names of written/deleted places (None: unknown
+                       province, which clears the whole cache)
+
+        Returns:
+            int: Number of entries removed
+        """
+        provinces = list(provinces)
+        self.generation += 1
+        self.invalidations += 1
+
+        if any(not province for province in provinces):
+            removed = len(self._cache)
+            self._cache.clear()
+        else:
+            slugs = {province_slug(province) for province in provinces}
+            # Searches over all provinces (empty tuple) include every province
+            removed = self._cache.delete_where(lambda key: not key[0] or not slugs.isdisjoint(key[0]))
+
+        if removed:
+            logger.debug("Search cache invalidated", provinces=provinces, entries=removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all cached searches."""
+        self.generation += 1
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: TTLCache statistics plus invalidation count
+        """
+        stats = self._cache.get_stats()
+        stats["invalidations"] = self.invalidations
+        return stats
+
+
+# Global cache instance
+_search_cache: Optional[SearchResultCache] = None
+
+
+def get_search_cache() -> Optional[SearchResultCache]:
+    """
+    Get global search-result cache.
+
+    Returns:
+        SearchResultCache, or None if SEARCH_CACHE_ENABLED is off
+    """
+    global _search_cache
+    if _search_cache is None and settings.SEARCH_CACHE_ENABLED:
+        _search_cache = SearchResultCache(
+            max_size=settings.SEARCH_CACHE_SIZE,
+            ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+        )
+    return _search_cache
+
+
+__all__ = ["SearchResultCache", "get_search_cache"]
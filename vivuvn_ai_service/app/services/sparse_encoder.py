@@ -0,0 +1,489 @@
+"""
+Local BM25 sparse encoder for hybrid (sparse + dense) retrieval.
+
+Dense embeddings can miss venues whose description names the category
+explicitly ("chợ đêm", "bảo tàng", "thác"). The encoder turns text into sparse
+BM25 vectors over diacritic-normalized Vietnamese tokens (unigrams and adjacent
+bigrams, so "chợ đêm" also matches as a phrase), hashed into a 32-bit index space.
+
+Scoring is split Pinecone-style:
+- documents carry the saturated, length-normalized term frequency part
+- queries carry the IDF part, scaled so a document's score is in [0, 1]
+The dot product of the two is therefore a normalized BM25 score, comparable
+with cosine similarity when mixed with a dense score (HYBRID_SEARCH_ALPHA).
+
+Document vectors depend on the document alone: length normalization uses a fixed
+reference length (BM25_AVG_DOC_LENGTH) instead of the running corpus average, so
+vectors stored in Pinecone early in a load never go stale as the corpus grows.
+Everything corpus-dependent (IDF) is computed at query time.
+
+Corpus statistics are fitted at ingest: chunks are registered under their vector
+ID once their upsert is committed (re-adding an ID replaces it) and deleted chunks
+are removed, so document frequencies stay exact. Statistics are persisted to the
+SQLite database at SPARSE_ENCODER_PATH (only documents changed since the last
+save are written) and other processes pick up changes incrementally.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.utils.helpers import strip_diacritics
+
+logger = structlog.get_logger(__name__)
+
+ENCODER_FORMAT = 2
+
+# How often queries check for statistics saved by other processes
+_RELOAD_CHECK_SECONDS = 5.0
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Sparse vector in Pinecone format
+SparseVector = Dict[str, List]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into diacritic-free lowercase tokens plus adjacent bigrams.
+
+    Args:
+        text: Vietnamese (or any) text
+
+    Returns:
+        List of unigram and "a_b" bigram tokens
+    """
+    words = _TOKEN_PATTERN.findall(strip_diacritics(text or "").lower())
+    return words + [f"{first}_{second}" for first, second in zip(words, words[1:])]
+
+
+def _term_index(token: str) -> int:
+    """Stable 32-bit index for a token (same in every process)."""
+    return int.from_bytes(hashlib.md5(token.encode("utf-8")).digest()[:4], "little")
+
+
+class BM25SparseEncoder:
+    """BM25 corpus statistics with document/query sparse encoding."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        avg_document_length: float = 300.0,
+    ):
+        """
+        Initialize encoder, loading persisted statistics if present.
+
+        Args:
+            path: SQLite database for corpus statistics (None: memory-only)
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+            avg_document_length: Reference document length (tokens) for length normalization
+        """
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self.avg_document_length = max(1.0, avg_document_length)
+        self._lock = threading.Lock()
+        # Guards the database connection (held without self._lock while writing)
+        self._db_lock = threading.Lock()
+
+        # vector id → term index → term frequency
+        self._docs: Dict[str, Dict[int, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._df: Counter = Counter()
+        # term index → vector ids containing it (for sparse-only candidate lookup)
+        self._postings: Dict[int, Set[str]] = {}
+        # vector id → group (province slug), to restrict keyword candidates
+        self._groups: Dict[str, str] = {}
+        self._total_length = 0
+        # Documents added/replaced or removed since the last save
+        self._changed: Set[str] = set()
+        self._removed: Set[str] = set()
+        # Last database change applied to memory
+        self._loaded_seq = 0
+        self._last_reload_check = time.monotonic()
+        self._reload_task: Optional[asyncio.Task] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if path:
+            self._open(path)
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Corpus maintenance
+    # ------------------------------------------------------------------
+
+    def add_documents(self, documents: Sequence[Tuple[str, str, str]]) -> None:
+        """
+        Register (or replace) documents in the corpus statistics.
+
+        Call only once the documents' vectors are committed, so failed writes
+        never change document frequencies.
+
+        Args:
+            documents: (vector id, text, group) triples; the group (province slug)
+                       lets search() consider only one province's documents
+        """
+        with self._lock:
+            for doc_id, text, group in documents:
+                self._add(doc_id, dict(Counter(_term_index(token) for token in tokenize(text))), group)
+                self._changed.add(doc_id)
+                self._removed.discard(doc_id)
+
+    def remove_documents(self, doc_ids: Iterable[str]) -> None:
+        """
+        Remove documents from the corpus statistics (unknown IDs are ignored).
+
+        Args:
+            doc_ids: Vector IDs
+        """
+        with self._lock:
+            for doc_id in doc_ids:
+                if self._remove(doc_id):
+                    self._changed.discard(doc_id)
+                    self._removed.add(doc_id)
+
+    @property
+    def _dirty(self) -> bool:
+        return bool(self._changed or self._removed)
+
+    def _add(self, doc_id: str, terms: Dict[int, int], group: str) -> None:
+        self._remove(doc_id)
+        self._docs[doc_id] = terms
+        self._groups[doc_id] = group
+        self._lengths[doc_id] = sum(terms.values())
+        self._total_length += self._lengths[doc_id]
+        for term in terms:
+            self._df[term] += 1
+            self._postings.setdefault(term, set()).add(doc_id)
+
+    def _remove(self, doc_id: str) -> bool:
+        terms = self._docs.pop(doc_id, None)
+        if terms is None:
+            return False
+        self._groups.pop(doc_id, None)
+        self._total_length -= self._lengths.pop(doc_id, 0)
+        for term in terms:
+            self._df[term] -= 1
+            if self._df[term] <= 0:
+                del self._df[term]
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.discard(doc_id)
+                if not postings:
+                    del self._postings[term]
+        return True
+
+    # ------------------------------------------------------------------
+    # Encoding and scoring
+    # ------------------------------------------------------------------
+
+    def _encode_terms(self, terms: Dict[int, int]) -> SparseVector:
+        if not terms:
+            return {"indices": [], "values": []}
+
+        length_norm = 1 - self.b + self.b * sum(terms.values()) / self.avg_document_length
+        indices = sorted(terms)
+        values = [
+            terms[term] * (self.k1 + 1) / (terms[term] + self.k1 * length_norm)
+            for term in indices
+        ]
+        return {"indices": indices, "values": values}
+
+    def _document_vector(self, doc_id: str) -> SparseVector:
+        return self._encode_terms(self._docs.get(doc_id) or {})
+
+    def encode_documents(self, texts: Sequence[str]) -> List[SparseVector]:
+        """
+        Encode document texts without registering them.
+
+        Vectors depend only on the text, so they match what the corpus holds
+        once the documents are registered with add_documents.
+
+        Args:
+            texts: Document texts
+
+        Returns:
+            Sparse document vectors, in input order (empty for texts without tokens)
+        """
+        return [
+            self._encode_terms(dict(Counter(_term_index(token) for token in tokenize(text))))
+            for text in texts
+        ]
+
+    def document_vector(self, doc_id: str) -> Optional[SparseVector]:
+        """
+        Current sparse vector of an indexed document.
+
+        Args:
+            doc_id: Vector ID
+
+        Returns:
+            Sparse vector, or None if the document is unknown
+        """
+        with self._lock:
+            if doc_id not in self._docs:
+                return None
+            return self._document_vector(doc_id)
+
+    def encode_query(self, text: str) -> SparseVector:
+        """
+        Encode a query as IDF weights.
+
+        Weights are scaled by 1 / (sum of IDF * (k1 + 1)), so the dot product with
+        any document vector lies in [0, 1]. Uses the in-memory statistics only;
+        see maybe_reload for picking up other processes' changes.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Sparse query vector (empty if no query term is in the corpus)
+        """
+        with self._lock:
+            doc_count = len(self._docs)
+            weights: Dict[int, float] = {}
+            for token in set(tokenize(text)):
+                term = _term_index(token)
+                df = self._df.get(term, 0)
+                if df:
+                    weights[term] = math.log((doc_count - df + 0.5) / (df + 0.5) + 1)
+
+        total = sum(weights.values()) * (self.k1 + 1)
+        if total <= 0:
+            return {"indices": [], "values": []}
+        indices = sorted(weights)
+        return {"indices": indices, "values": [weights[term] / total for term in indices]}
+
+    def score(self, query: SparseVector, doc_id: str) -> float:
+        """
+        Sparse score of one document for an encoded query.
+
+        Args:
+            query: Vector from encode_query
+            doc_id: Vector ID
+
+        Returns:
+            Score in [0, 1] (0 for unknown documents)
+        """
+        document = self.document_vector(doc_id)
+        if not document:
+            return 0.0
+        weights = dict(zip(document["indices"], document["values"]))
+        return sum(value * weights.get(term, 0.0) for term, value in zip(query["indices"], query["values"]))
+
+    def search(
+        self,
+        query: SparseVector,
+        top_n: int,
+        groups: Optional[Set[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Best-scoring documents for an encoded query (inverted-index scan).
+
+        Args:
+            query: Vector from encode_query
+            top_n: Number of documents
+            groups: Only consider documents of these groups (None: all)
+
+        Returns:
+            (vector id, score) pairs, best first
+        """
+        with self._lock:
+            candidates: Set[str] = set()
+            for term in query["indices"]:
+                candidates.update(self._postings.get(term, ()))
+            if groups is not None:
+                candidates = {doc_id for doc_id in candidates if self._groups.get(doc_id) in groups}
+            vectors = {doc_id: self._document_vector(doc_id) for doc_id in candidates}
+
+        query_weights = dict(zip(query["indices"], query["values"]))
+        scored = [
+            (
+                doc_id,
+                sum(query_weights.get(term, 0.0) * value for term, value in zip(vector["indices"], vector["values"])),
+            )
+            for doc_id, vector in vectors.items()
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:top_n]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _open(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # terms NULL marks a removed document (tombstone, so other processes see the removal)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id TEXT PRIMARY KEY,
+                doc_group TEXT,
+                terms TEXT,
+                seq INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_seq ON documents(seq)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('format', ?)", (ENCODER_FORMAT,))
+        self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('seq', 0)")
+        self._conn.commit()
+
+        stored_format = self._conn.execute("SELECT value FROM meta WHERE key = 'format'").fetchone()[0]
+        if stored_format != ENCODER_FORMAT:
+            logger.warning("Ignoring sparse encoder database with unknown format", path=path)
+            self._conn.close()
+            self._conn = None
+
+    def save(self) -> None:
+        """Persist documents changed since the last save (one transaction)."""
+        if self._conn is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            changed = [
+                (doc_id, self._groups.get(doc_id), json.dumps(list(self._docs[doc_id].items())))
+                for doc_id in self._changed
+                if doc_id in self._docs
+            ]
+            removed = list(self._removed)
+            self._changed.clear()
+            self._removed.clear()
+
+        try:
+            with self._db_lock, self._conn:
+                seq = self._conn.execute("SELECT value FROM meta WHERE key = 'seq'").fetchone()[0] + 1
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO documents (doc_id, doc_group, terms, seq) VALUES (?, ?, ?, ?)",
+                    [row + (seq,) for row in changed] + [(doc_id, None, None, seq) for doc_id in removed],
+                )
+                self._conn.execute("UPDATE meta SET value = ? WHERE key = 'seq'", (seq,))
+        except sqlite3.Error:
+            with self._lock:
+                # Keep the changes for the next save unless superseded meanwhile
+                self._changed.update(d for d, _, _ in changed if d in self._docs and d not in self._removed)
+                self._removed.update(d for d in removed if d not in self._docs and d not in self._changed)
+            raise
+
+        with self._lock:
+            if seq == self._loaded_seq + 1:
+                # No other process wrote in between; otherwise the next reload catches up
+                self._loaded_seq = seq
+        logger.info("Sparse encoder saved", path=self.path, changed=len(changed), removed=len(removed))
+
+    def maybe_reload(self) -> None:
+        """
+        Start applying statistics saved by other processes, if any may exist.
+
+        Reading and decoding run in a worker thread (see _load); call from the
+        event loop before encoding queries. Skipped while this process has
+        unsaved changes.
+        """
+        if self._conn is None or self._dirty:
+            return
+        if self._reload_task is not None and not self._reload_task.done():
+            return
+        now = time.monotonic()
+        if now - self._last_reload_check < _RELOAD_CHECK_SECONDS:
+            return
+        self._last_reload_check = now
+        self._reload_task = asyncio.get_running_loop().create_task(asyncio.to_thread(self._load))
+
+    def _load(self) -> None:
+        """Apply database changes newer than the last applied one."""
+        if self._conn is None:
+            return
+        loaded_seq = self._loaded_seq
+        try:
+            with self._db_lock:
+                seq = self._conn.execute("SELECT value FROM meta WHERE key = 'seq'").fetchone()[0]
+                if seq == loaded_seq:
+                    return
+                rows = self._conn.execute(
+                    "SELECT doc_id, doc_group, terms FROM documents WHERE seq > ? AND seq <= ?",
+                    (loaded_seq, seq),
+                ).fetchall()
+            # Decode outside the locks; queries only wait for the in-memory update
+            changes = [
+                (doc_id, group or "", None if terms is None else {int(term): tf for term, tf in json.loads(terms)})
+                for doc_id, group, terms in rows
+            ]
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("Failed to load sparse encoder statistics", path=self.path, error=str(e))
+            return
+
+        with self._lock:
+            if self._loaded_seq != loaded_seq or self._dirty:
+                # Another load or a local change got in first; the next check catches up
+                return
+            for doc_id, group, terms in changes:
+                if terms is None:
+                    self._remove(doc_id)
+                else:
+                    self._add(doc_id, terms, group)
+            self._loaded_seq = seq
+        logger.info("Sparse encoder loaded", path=self.path, applied=len(changes), documents=len(self._docs))
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Get corpus statistics.
+
+        Returns:
+            dict: Document count, vocabulary size and average document length
+        """
+        with self._lock:
+            documents = len(self._docs)
+            return {
+                "documents": documents,
+                "terms": len(self._df),
+                "avg_document_length": round(self._total_length / documents, 2) if documents else 0.0,
+                "reference_document_length": self.avg_document_length,
+                "unsaved_changes": len(self._changed) + len(self._removed),
+            }
+
+
+# Global encoder instance
+_sparse_encoder: Optional[BM25SparseEncoder] = None
+
+
+def get_sparse_encoder() -> Optional[BM25SparseEncoder]:
+    """
+    Get global sparse encoder.
+
+    Returns:
+        BM25SparseEncoder, or None if HYBRID_SEARCH_ENABLED is off
+    """
+    global _sparse_encoder
+    if _sparse_encoder is None and settings.HYBRID_SEARCH_ENABLED:
+        _sparse_encoder = BM25SparseEncoder(
+            path=settings.SPARSE_ENCODER_PATH or None,
+            k1=settings.BM25_K1,
+            b=settings.BM25_B,
+            avg_document_length=settings.BM25_AVG_DOC_LENGTH,
+        )
+    return _sparse_encoder
+
+
+__all__ = ["BM25SparseEncoder", "SparseVector", "get_sparse_encoder", "tokenize"]
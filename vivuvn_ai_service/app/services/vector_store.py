@@ -0,0 +1,559 @@
+"""
+Vector store interface for ViVu Vietnam AI Service.
+
+Agents and services talk to the vector database through VectorStore, so the
+backend can be chosen per deployment (VECTOR_BACKEND):
+
+- "pinecone": remote Pinecone serverless index (PineconeService)
+- "local":    in-process NumPy index (LocalVectorStore), exact cosine search with
+              no network round trip; also works fully offline
+
+Vectors are dicts {"id", "values", "metadata"}; search results are dicts
+{"id", "score", "metadata"} with cosine similarity scores. Metadata filters use
+Pinecone's syntax on every backend.
+
+Place vectors live either in the shared PINECONE_DEFAULT_NAMESPACE (searched with a
+`province` metadata filter) or, with PINECONE_NAMESPACE_PER_PROVINCE, in one
+namespace per province (see province_namespace), where a province search is a
+small unfiltered query.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import structlog
+
+from app.core.config import settings
+from app.services.sparse_encoder import SparseVector, get_sparse_encoder
+from app.utils.geo_utils import filter_within_radius, radius_filter
+from app.utils.helpers import province_slug
+from app.utils.metadata_filter import matches_filter, province_from_filter
+
+logger = structlog.get_logger(__name__)
+
+
+class VectorStoreError(Exception):
+    """Vector store-specific exception."""
+    pass
+
+
+def province_namespace(province: Optional[str]) -> str:
+    """
+    Namespace holding a province's place vectors.
+
+    With PINECONE_NAMESPACE_PER_PROVINCE this is
+    "<PINECONE_DEFAULT_NAMESPACE>_<province slug>" (e.g. "travel_location_da-nang");
+    otherwise, or for places without a usable province, the shared default namespace.
+
+    Args:
+        province: Province name (any spelling variant, with or without prefix)
+
+    Returns:
+        str: Namespace name
+    """
+    if settings.PINECONE_NAMESPACE_PER_PROVINCE:
+        slug = province_slug(province or "")
+        if slug:
+            return f"{settings.PINECONE_DEFAULT_NAMESPACE}_{slug}"
+    return settings.PINECONE_DEFAULT_NAMESPACE
+
+
+def _searched_provinces(namespace: Optional[str], filter_dict: Optional[Dict[str, Any]]) -> Optional[Set[str]]:
+    """Province slugs a namespace/filter restricts a search to (None: unrestricted)."""
+    prefix = f"{settings.PINECONE_DEFAULT_NAMESPACE}_"
+    if namespace and namespace.startswith(prefix):
+        return {namespace[len(prefix):]}
+
+    province = province_from_filter(filter_dict)
+    if province is not None:
+        return {province_slug(province)}
+    condition = (filter_dict or {}).get("province")
+    if isinstance(condition, dict) and isinstance(condition.get("$in"), list):
+        return {province_slug(value) for value in condition["$in"]}
+    return None
+
+
+class VectorStore(ABC):
+    """Backend-neutral vector database operations."""
+
+    @abstractmethod
+    async def search(
+        self,
+        vector: List[float],
+        top_k: int = 10,
+        namespace: Optional[str] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        include_metadata: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Vector similarity search.
+
+        Args:
+            vector: Query embedding vector
+            top_k: Number of results
+            namespace: Namespace to search (default: PINECONE_DEFAULT_NAMESPACE)
+            filter_dict: Metadata filters (Pinecone syntax)
+            include_metadata: Include metadata in results
+
+        Returns:
+            List of results with id, score, and metadata, best first
+        """
+
+    async def search_places(
+        self,
+        query_embedding: List[float],
+        top_k: int = 10,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        province_filter: Optional[str] = None,
+        center: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for places using vector similarity with enhanced filtering.
+
+        Args:
+            query_embedding: Query vector embedding (768-dimensional)
+            top_k: Number of results to return
+            filter_dict: Optional metadata filters (e.g., {"rating": {"$gte": 4.0}})
+            province_filter: Filter by specific province
+            center: Optional (latitude, longitude) to search around
+            radius_km: Only return places within this distance of center
+
+        Returns:
+            List of matching places with metadata
+        """
+        return await self.search_provinces(
+            query_embedding,
+            provinces=[province_filter] if province_filter else [],
+            top_k=top_k,
+            filter_dict=filter_dict,
+            center=center,
+            radius_km=radius_km,
+        )
+
+    async def search_provinces(
+        self,
+        query_embedding: List[float],
+        provinces: List[str],
+        top_k: int = 10,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        sparse_vector: Optional[SparseVector] = None,
+        alpha: Optional[float] = None,
+        center: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search places in one or more provinces (all provinces if none are given).
+
+        With per-province namespaces each province is an unfiltered query on its
+        own namespace, and several provinces are merged by query_namespaces.
+        Otherwise the shared namespace is searched with a `province` filter.
+        A sparse query vector switches every namespace query to search_hybrid.
+
+        A center and radius push a latitude/longitude range filter (the circle's
+        bounding box) down to the backend; matches in the box corners are then
+        dropped by exact haversine distance.
+
+        Args:
+            query_embedding: Query vector embedding
+            provinces: Province names (normalized, see normalize_province_name)
+            top_k: Number of results to return
+            filter_dict: Optional additional metadata filters
+            sparse_vector: Optional BM25 query vector for hybrid search
+            alpha: Dense weight for hybrid search (default: HYBRID_SEARCH_ALPHA)
+            center: Optional (latitude, longitude) of the search area
+            radius_km: Search radius around center in km
+
+        Returns:
+            List of matching places with metadata, best first
+        """
+        within_radius = center is not None and bool(radius_km)
+        if within_radius:
+            filter_dict = {**(filter_dict or {}), **radius_filter(center[0], center[1], radius_km)}
+
+        results = await self._search_provinces(query_embedding, provinces, top_k, filter_dict, sparse_vector, alpha)
+        if within_radius:
+            results = filter_within_radius(results, center[0], center[1], radius_km)
+        return results
+
+    async def _search_provinces(
+        self,
+        query_embedding: List[float],
+        provinces: List[str],
+        top_k: int,
+        filter_dict: Optional[Dict[str, Any]],
+        sparse_vector: Optional[SparseVector],
+        alpha: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """Province routing of search_provinces (namespaces or province filter)."""
+        combined_filter = filter_dict.copy() if filter_dict else {}
+        provinces = list(dict.fromkeys(province for province in provinces if province))
+
+        if settings.PINECONE_NAMESPACE_PER_PROVINCE:
+            if provinces:
+                namespaces = list(dict.fromkeys(province_namespace(province) for province in provinces))
+            else:
+                namespaces = await self.list_place_namespaces()
+            if sparse_vector is not None:
+                return await self._search_hybrid_namespaces(
+                    query_embedding, sparse_vector, namespaces, top_k, combined_filter or None, alpha
+                )
+            if len(namespaces) == 1:
+                return await self.search(
+                    vector=query_embedding,
+                    top_k=top_k,
+                    namespace=namespaces[0],
+                    filter_dict=combined_filter or None,
+                    include_metadata=True
+                )
+            return await self.query_namespaces(
+                vector=query_embedding,
+                namespaces=namespaces,
+                top_k=top_k,
+                filter_dict=combined_filter or None,
+                include_metadata=True
+            )
+
+        if len(provinces) == 1:
+            combined_filter["province"] = {"$eq": provinces[0]}
+        elif provinces:
+            combined_filter["province"] = {"$in": provinces}
+
+        if sparse_vector is not None:
+            return await self._search_hybrid_namespaces(
+                query_embedding,
+                sparse_vector,
+                [settings.PINECONE_DEFAULT_NAMESPACE],
+                top_k,
+                combined_filter or None,
+                alpha
+            )
+
+        return await self.search(
+            vector=query_embedding,
+            top_k=top_k,
+            namespace=settings.PINECONE_DEFAULT_NAMESPACE,
+            filter_dict=combined_filter or None,
+            include_metadata=True
+        )
+
+    async def _search_hybrid_namespaces(
+        self,
+        vector: List[float],
+        sparse_vector: SparseVector,
+        namespaces: List[str],
+        top_k: int,
+        filter_dict: Optional[Dict[str, Any]],
+        alpha: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """Hybrid-search several namespaces and merge the results by score."""
+        alpha = settings.HYBRID_SEARCH_ALPHA if alpha is None else alpha
+        per_namespace = await asyncio.gather(
+            *(
+                self.search_hybrid(vector, sparse_vector, top_k, namespace, filter_dict, alpha)
+                for namespace in namespaces
+            )
+        )
+        merged = [result for results in per_namespace for result in results]
+        merged.sort(key=lambda result: result["score"], reverse=True)
+        return merged[:top_k]
+
+    async def search_hybrid(
+        self,
+        vector: List[float],
+        sparse_vector: SparseVector,
+        top_k: int = 10,
+        namespace: Optional[str] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        alpha: float = 0.75
+    ) -> List[Dict[str, Any]]:
+        """
+        Hybrid dense + BM25 search (in-process fallback).
+
+        Dense matches are merged with the best keyword matches of the local sparse
+        encoder (HYBRID_SPARSE_CANDIDATES, restricted to the namespace and filter
+        by fetching them), and every candidate is scored
+        alpha * cosine + (1 - alpha) * BM25 score. Backends with native
+        sparse-dense queries override this.
+
+        Args:
+            vector: Query embedding vector
+            sparse_vector: Query vector from the BM25 sparse encoder
+            top_k: Number of results
+            namespace: Namespace to search
+            filter_dict: Metadata filters
+            alpha: Dense weight in [0, 1]
+
+        Returns:
+            List of results with id, hybrid score, and metadata, best first
+        """
+        dense = await self.search(
+            vector=vector,
+            top_k=top_k,
+            namespace=namespace,
+            filter_dict=filter_dict,
+            include_metadata=True
+        )
+        sparse_encoder = get_sparse_encoder()
+        if sparse_encoder is None or not sparse_vector["indices"] or alpha >= 1:
+            return dense
+
+        candidates = {result["id"]: result for result in dense}
+        keyword_scores = dict(sparse_encoder.search(
+            sparse_vector,
+            settings.HYBRID_SPARSE_CANDIDATES,
+            groups=_searched_provinces(namespace, filter_dict)
+        ))
+
+        missing = [vector_id for vector_id in keyword_scores if vector_id not in candidates]
+        if missing:
+            fetched = await self.fetch_vectors(missing, namespace=namespace)
+            matches = [
+                (vector_id, match) for vector_id, match in fetched.items()
+                if matches_filter(match["metadata"], filter_dict)
+            ]
+            if matches:
+                query = np.asarray(vector, dtype=np.float32)
+                matrix = np.asarray([match["values"] for _, match in matches], dtype=np.float32)
+                norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(query) or 1.0)
+                cosines = (matrix @ query) / np.where(norms > 0, norms, 1.0)
+                for (vector_id, match), cosine in zip(matches, cosines.tolist()):
+                    candidates[vector_id] = {"id": vector_id, "score": cosine, "metadata": match["metadata"]}
+
+        results = []
+        for vector_id, result in candidates.items():
+            keyword_score = keyword_scores.get(vector_id)
+            if keyword_score is None:
+                keyword_score = sparse_encoder.score(sparse_vector, vector_id)
+            results.append({**result, "score": alpha * result["score"] + (1 - alpha) * keyword_score})
+
+        results.sort(key=lambda result: result["score"], reverse=True)
+        return results[:top_k]
+
+    async def query_namespaces(
+        self,
+        vector: List[float],
+        namespaces: List[str],
+        top_k: int = 10,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        include_metadata: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several namespaces and merge the results.
+
+        Args:
+            vector: Query embedding vector
+            namespaces: Namespaces to search
+            top_k: Number of merged results
+            filter_dict: Metadata filters
+            include_metadata: Include metadata in results
+
+        Returns:
+            Combined results, best first
+        """
+        per_namespace = await asyncio.gather(
+            *(
+                self.search(
+                    vector=vector,
+                    top_k=top_k,
+                    namespace=namespace,
+                    filter_dict=filter_dict,
+                    include_metadata=include_metadata,
+                )
+                for namespace in namespaces
+            )
+        )
+        merged = [result for results in per_namespace for result in results]
+        merged.sort(key=lambda result: result["score"], reverse=True)
+        return merged[:top_k]
+
+    @abstractmethod
+    async def upsert_vectors(self, vectors: List[Dict[str, Any]], namespace: Optional[str] = None) -> bool:
+        """
+        Insert or overwrite vectors.
+
+        Args:
+            vectors: List of dicts with 'id', 'values', and 'metadata'
+            namespace: Target namespace (default: PINECONE_DEFAULT_NAMESPACE)
+
+        Returns:
+            True if successful, False otherwise
+        """
+
+    @abstractmethod
+    async def delete_vectors(self, ids: List[str], namespace: Optional[str] = None) -> bool:
+        """
+        Delete vectors by ID (unknown IDs are ignored).
+
+        Args:
+            ids: Vector IDs to delete
+            namespace: Target namespace (default: PINECONE_DEFAULT_NAMESPACE)
+
+        Returns:
+            True if successful, False otherwise
+        """
+
+    @abstractmethod
+    async def list_ids(self, prefix: str, namespace: Optional[str] = None) -> List[str]:
+        """
+        List vector IDs starting with a prefix.
+
+        Args:
+            prefix: Vector ID prefix
+            namespace: Target namespace (default: PINECONE_DEFAULT_NAMESPACE)
+
+        Returns:
+            Matching vector IDs
+        """
+
+    @abstractmethod
+    async def fetch_metadata(self, ids: List[str], namespace: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch metadata of vectors by ID.
+
+        Args:
+            ids: Vector IDs
+            namespace: Target namespace (default: PINECONE_DEFAULT_NAMESPACE)
+
+        Returns:
+            Dict mapping found vector IDs to their metadata
+        """
+
+    @abstractmethod
+    async def fetch_vectors(self, ids: List[str], namespace: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch vectors with their values and metadata by ID.
+
+        Args:
+            ids: Vector IDs
+            namespace: Target namespace (default: PINECONE_DEFAULT_NAMESPACE)
+
+        Returns:
+            Dict mapping found vector IDs to {"id", "values", "metadata"}
+        """
+
+    async def upsert_place_vectors(self, vectors: List[Dict[str, Any]]) -> bool:
+        """
+        Upsert place chunk vectors into their provinces' namespaces.
+
+        Args:
+            vectors: Chunk vectors whose metadata carries "province"
+
+        Returns:
+            True if every namespace write succeeded
+        """
+        by_namespace: Dict[str, List[Dict[str, Any]]] = {}
+        for vector in vectors:
+            namespace = province_namespace((vector.get("metadata") or {}).get("province"))
+            by_namespace.setdefault(namespace, []).append(vector)
+
+        results = await asyncio.gather(
+            *(
+                self.upsert_vectors(namespace_vectors, namespace=namespace)
+                for namespace, namespace_vectors in by_namespace.items()
+            )
+        )
+        return all(results)
+
+    async def delete_place_vectors(self, ids_by_namespace: Dict[str, List[str]]) -> bool:
+        """
+        Delete vectors spread over several namespaces.
+
+        Args:
+            ids_by_namespace: Namespace → vector IDs
+
+        Returns:
+            True if every namespace delete succeeded
+        """
+        results = await asyncio.gather(
+            *(
+                self.delete_vectors(ids, namespace=namespace)
+                for namespace, ids in ids_by_namespace.items()
+                if ids
+            )
+        )
+        return all(results)
+
+    async def list_place_namespaces(self) -> List[str]:
+        """
+        Namespaces that hold place vectors (shared and per-province).
+
+        Returns:
+            Namespace names (at least PINECONE_DEFAULT_NAMESPACE)
+        """
+        stats = await self.get_index_stats()
+        default = settings.PINECONE_DEFAULT_NAMESPACE
+        namespaces = [
+            namespace for namespace in (stats.get("namespaces") or {})
+            if namespace == default or namespace.startswith(f"{default}_")
+        ]
+        return sorted(set(namespaces) | {default})
+
+    @abstractmethod
+    async def get_index_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict with total_vectors, dimension, index_fullness and namespaces
+            ({namespace: {"vector_count": n}})
+        """
+
+    @abstractmethod
+    async def health_check(self) -> bool:
+        """Check if the backend is reachable and queryable."""
+
+    async def initialize(self) -> None:
+        """Resolve connections/handles up front (no-op for backends that need none)."""
+
+    async def flush(self) -> None:
+        """Persist buffered writes (no-op for backends that write through)."""
+
+    async def close(self) -> None:
+        """Persist buffered writes and release resources."""
+        await self.flush()
+
+
+_vector_store: Optional[VectorStore] = None
+
+
+def get_vector_store() -> VectorStore:
+    """
+    Get singleton vector store for the configured VECTOR_BACKEND.
+
+    Returns:
+        VectorStore: PineconeService or LocalVectorStore
+
+    Raises:
+        VectorStoreError: If the backend is unknown or cannot be initialized
+    """
+    global _vector_store
+    if _vector_store is None:
+        backend = settings.VECTOR_BACKEND.lower()
+        if backend == "pinecone":
+            from app.services.pinecone_service import get_pinecone_service
+            _vector_store = get_pinecone_service()
+        elif backend == "local":
+            from app.services.local_vector_store import get_local_vector_store
+            _vector_store = get_local_vector_store()
+        else:
+            raise VectorStoreError(f"Unknown VECTOR_BACKEND: {settings.VECTOR_BACKEND}")
+        logger.info("Vector store initialized", backend=backend)
+    return _vector_store
+
+
+async def close_vector_store() -> None:
+    """Close the vector store if one was created (application shutdown)."""
+    if _vector_store is not None:
+        await _vector_store.close()
+
+
+__all__ = [
+    "VectorStore",
+    "VectorStoreError",
+    "close_vector_store",
+    "get_vector_store",
+    "province_namespace",
+]
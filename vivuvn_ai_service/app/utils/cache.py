@@ -0,0 +1,137 @@
+"""
+In-process caching utilities.
+
+Provides a small LRU cache with per-entry TTL, used for hot lookups that are too
+cheap to justify a network or disk round trip (query embeddings, search results).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache with time-to-live expiry.
+
+    Entries expire ttl_seconds after they are written. Pinned entries never expire
+    and are never evicted (use for small, pre-warmed working sets).
+    Not thread-safe: intended for use from a single asyncio event loop.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 3600.0):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of unpinned entries before LRU eviction
+            ttl_seconds: Entry lifetime in seconds (0 disables expiry)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._pinned: Dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        if key in self._pinned:
+            self.hits += 1
+            return self._pinned[key]
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, pin: bool = False) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            pin: Keep the entry forever (exempt from TTL and LRU eviction)
+        """
+        if pin:
+            self._entries.pop(key, None)
+            self._pinned[key] = value
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key (pinned or not) if present."""
+        self._entries.pop(key, None)
+        self._pinned.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every entry whose key matches a predicate.
+
+        Args:
+            predicate: Function called with each key
+
+        Returns:
+            int: Number of entries removed
+        """
+        keys = [key for key in list(self._entries) + list(self._pinned) if predicate(key)]
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries, including pinned ones."""
+        self._entries.clear()
+        self._pinned.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pinned)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Size, capacity and hit/miss counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "pinned": len(self._pinned),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+__all__ = ["TTLCache"]
@@ -0,0 +1,303 @@
+"""
+Dedicated, instrumented concurrency limits per external dependency.
+
+Calls to different dependencies must not queue behind each other: a burst of
+10-30s Gemini generations would otherwise occupy a shared pool and delay
+unrelated Pinecone queries. Each dependency gets its own bound, sized in Settings:
+
+- "pinecone": thread pool for the blocking SDK (PINECONE_EXECUTOR_WORKERS)
+- "gemini_generate" / "gemini_embed": concurrency limits for native async
+              generation and embedding calls (GEMINI_GENERATE_/EMBED_MAX_CONCURRENT_REQUESTS),
+              so bulk-ingestion embeddings cannot hold the slots itinerary
+              generations need; waiting calls are coroutines, not threads
+- "gemini":   global cap on all in-flight Gemini requests (GEMINI_MAX_CONCURRENT_REQUESTS),
+              acquired on top of the per-kind limit
+
+Every executor/limiter records queue depth, in-flight calls and queue wait / run
+times, so head-of-line blocking is visible (see get_executor_stats()).
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Recent samples kept per executor for wait/run time percentiles
+_SAMPLE_WINDOW = 1000
+
+
+def _percentile(samples: Deque[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class InstrumentedExecutor:
+    """Bounded thread pool that measures how long calls wait for a worker."""
+
+    def __init__(self, name: str, max_workers: int):
+        """
+        Initialize executor.
+
+        Args:
+            name: Dependency name (used in thread names and metrics)
+            max_workers: Worker threads
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._max_queued = 0
+        self._wait_samples: Deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+        self._run_samples: Deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking call on this executor.
+
+        Args:
+            fn: Callable to run
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Result of fn
+        """
+        submitted = time.perf_counter()
+        # Guarded by self._lock: a call abandoned while still queued is skipped
+        state = {"started": False, "abandoned": False}
+        with self._lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+
+        def call():
+            started = time.perf_counter()
+            with self._lock:
+                if state["abandoned"]:
+                    return None
+                state["started"] = True
+                self._queued -= 1
+                self._active += 1
+                self._wait_samples.append(started - submitted)
+            failed = False
+            try:
+                return fn(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._run_samples.append(time.perf_counter() - started)
+                    if failed:
+                        self._failed += 1
+                    else:
+                        self._completed += 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, call)
+        except asyncio.CancelledError:
+            with self._lock:
+                if not state["started"]:
+                    state["abandoned"] = True
+                    self._queued -= 1
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, utilization and latency figures."""
+        with self._lock:
+            waits = deque(self._wait_samples)
+            runs = deque(self._run_samples)
+            stats = {
+                "max_workers": self.max_workers,
+                "queued": self._queued,
+                "max_queued": self._max_queued,
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+            }
+        stats.update({
+            "wait_ms_p50": round(_percentile(waits, 0.50) * 1000, 2),
+            "wait_ms_p95": round(_percentile(waits, 0.95) * 1000, 2),
+            "wait_ms_max": round(max(waits, default=0.0) * 1000, 2),
+            "run_ms_p50": round(_percentile(runs, 0.50) * 1000, 2),
+            "run_ms_p95": round(_percentile(runs, 0.95) * 1000, 2),
+        })
+        return stats
+
+    def shutdown(self) -> None:
+        """Stop accepting calls and release threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ConcurrencyLimiter:
+    """Async semaphore that measures how long callers wait for a slot."""
+
+    def __init__(self, name: str, max_concurrent: int):
+        """
+        Initialize limiter.
+
+        Args:
+            name: Dependency name (used in metrics)
+            max_concurrent: Calls allowed in flight at once
+        """
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._max_queued = 0
+        self._wait_samples: Deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+        self._run_samples: Deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one concurrency slot for the duration of the block."""
+        submitted = time.perf_counter()
+        self._queued += 1
+        self._max_queued = max(self._max_queued, self._queued)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        started = time.perf_counter()
+        self._wait_samples.append(started - submitted)
+        self._active += 1
+        try:
+            yield
+        except BaseException:
+            self._failed += 1
+            raise
+        else:
+            self._completed += 1
+        finally:
+            self._active -= 1
+            self._run_samples.append(time.perf_counter() - started)
+            self._semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, utilization and latency figures."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "queued": self._queued,
+            "max_queued": self._max_queued,
+            "active": self._active,
+            "completed": self._completed,
+            "failed": self._failed,
+            "wait_ms_p50": round(_percentile(self._wait_samples, 0.50) * 1000, 2),
+            "wait_ms_p95": round(_percentile(self._wait_samples, 0.95) * 1000, 2),
+            "wait_ms_max": round(max(self._wait_samples, default=0.0) * 1000, 2),
+            "run_ms_p50": round(_percentile(self._run_samples, 0.50) * 1000, 2),
+            "run_ms_p95": round(_percentile(self._run_samples, 0.95) * 1000, 2),
+        }
+
+
+_EXECUTOR_SIZES: Dict[str, Callable[[], int]] = {
+    "pinecone": lambda: settings.PINECONE_EXECUTOR_WORKERS,
+}
+
+_LIMITER_SIZES: Dict[str, Callable[[], int]] = {
+    "gemini": lambda: settings.GEMINI_MAX_CONCURRENT_REQUESTS,
+    "gemini_generate": lambda: settings.GEMINI_GENERATE_MAX_CONCURRENT_REQUESTS,
+    "gemini_embed": lambda: settings.GEMINI_EMBED_MAX_CONCURRENT_REQUESTS,
+}
+
+_executors: Dict[str, InstrumentedExecutor] = {}
+_executors_lock = threading.Lock()
+_limiters: Dict[str, ConcurrencyLimiter] = {}
+
+
+def get_executor(name: str) -> InstrumentedExecutor:
+    """
+    Get the executor for a dependency (created on first use).
+
+    Args:
+        name: "pinecone"
+
+    Returns:
+        InstrumentedExecutor: Shared executor for that dependency
+
+    Raises:
+        KeyError: If the dependency name is unknown
+    """
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                executor = InstrumentedExecutor(name, _EXECUTOR_SIZES[name]())
+                _executors[name] = executor
+                logger.info("Executor created", executor=name, max_workers=executor.max_workers)
+    return executor
+
+
+async def run_in_executor(name: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call on a dependency's executor (see get_executor)."""
+    return await get_executor(name).run(functools.partial(fn, *args, **kwargs))
+
+
+def get_limiter(name: str) -> ConcurrencyLimiter:
+    """
+    Get the concurrency limiter for a dependency (created on first use).
+
+    Args:
+        name: "gemini", "gemini_generate" or "gemini_embed"
+
+    Returns:
+        ConcurrencyLimiter: Shared limiter for that dependency
+
+    Raises:
+        KeyError: If the dependency name is unknown
+    """
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = ConcurrencyLimiter(name, _LIMITER_SIZES[name]())
+        _limiters[name] = limiter
+        logger.info("Concurrency limiter created", limiter=name, max_concurrent=limiter.max_concurrent)
+    return limiter
+
+
+def get_executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Metrics for every executor and limiter created so far."""
+    stats = {name: executor.get_stats() for name, executor in _executors.items()}
+    stats.update({name: limiter.get_stats() for name, limiter in _limiters.items()})
+    return stats
+
+
+def shutdown_executors() -> None:
+    """Shut down all executors (application shutdown)."""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown()
+        _executors.clear()
+
+
+__all__ = [
+    "ConcurrencyLimiter",
+    "InstrumentedExecutor",
+    "get_executor",
+    "get_executor_stats",
+    "get_limiter",
+    "run_in_executor",
+    "shutdown_executors",
+]
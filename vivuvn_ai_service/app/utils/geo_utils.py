@@ -46,6 +46,78 @@ def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
     return R * c
 
 
+def bounding_box(lat: float, lng: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """
+    Latitude/longitude box enclosing a circle.
+
+    Args:
+        lat, lng: Circle center (degrees)
+        radius_km: Circle radius in km
+
+    Returns:
+        (min_lat, max_lat, min_lng, max_lng) in degrees
+    """
+    lat_delta = math.degrees(radius_km / 6371)
+    cos_lat = math.cos(math.radians(lat))
+    # Near the poles the box spans every longitude
+    lng_delta = 180.0 if cos_lat < 1e-6 else min(180.0, lat_delta / cos_lat)
+    return (
+        max(-90.0, lat - lat_delta),
+        min(90.0, lat + lat_delta),
+        lng - lng_delta,
+        lng + lng_delta,
+    )
+
+
+def radius_filter(lat: float, lng: float, radius_km: float) -> Dict[str, Any]:
+    """
+    Pinecone metadata range filter selecting the bounding box of a circle.
+
+    Range filters on the stored latitude/longitude cannot express a circle; the
+    box corners are removed afterwards with filter_within_radius.
+
+    Args:
+        lat, lng: Circle center (degrees)
+        radius_km: Circle radius in km
+
+    Returns:
+        Filter on the "latitude" and "longitude" metadata fields
+    """
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    return {
+        "latitude": {"$gte": min_lat, "$lte": max_lat},
+        "longitude": {"$gte": min_lng, "$lte": max_lng},
+    }
+
+
+def filter_within_radius(
+    results: List[Dict[str, Any]],
+    lat: float,
+    lng: float,
+    radius_km: float
+) -> List[Dict[str, Any]]:
+    """
+    Keep results whose metadata coordinates lie within a radius.
+
+    Args:
+        results: Search results with "metadata" latitude/longitude
+        lat, lng: Circle center (degrees)
+        radius_km: Radius in km
+
+    Returns:
+        Results inside the circle, in input order
+    """
+    kept = []
+    for result in results:
+        metadata = result.get("metadata") or {}
+        place_lat, place_lng = metadata.get("latitude"), metadata.get("longitude")
+        if place_lat is None or place_lng is None:
+            continue
+        if haversine_distance(lat, lng, float(place_lat), float(place_lng)) <= radius_km:
+            kept.append(result)
+    return kept
+
+
 def simple_kmeans_geo(
     places: List[Dict[str, Any]],
     k: int = None,
@@ -348,6 +420,9 @@ def calculate_cluster_stats(cluster: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 __all__ = [
     'haversine_distance',
+    'bounding_box',
+    'radius_filter',
+    'filter_within_radius',
     'simple_kmeans_geo',
     'get_cluster_name',
     'calculate_cluster_stats'
@@ -4,6 +4,8 @@ Helper utility functions for ViVu Vietnam AI Service.
 This module provides common utility functions used across the application.
 """
 
+import re
+import unicodedata
 from typing import List, Any
 
 
@@ -51,6 +53,48 @@ def normalize_province_name(province: str) -> str:
     return normalized
 
 
+def strip_diacritics(text: str) -> str:
+    """
+    Remove Vietnamese diacritics, keeping the base ASCII letters.
+
+    Examples:
+        - "Đà Nẵng" -> "Da Nang"
+        - "Thừa Thiên Huế" -> "Thua Thien Hue"
+
+    Args:
+        text: Text with or without diacritics
+
+    Returns:
+        str: Text without combining marks ("đ"/"Đ" become "d"/"D")
+    """
+    if not text:
+        return ""
+
+    decomposed = unicodedata.normalize("NFD", text.replace("đ", "d").replace("Đ", "D"))
+    return "".join(char for char in decomposed if unicodedata.category(char) != "Mn")
+
+
+def province_slug(province: str) -> str:
+    """
+    Build a stable ASCII key for a province name.
+
+    Administrative prefixes, diacritics, case and punctuation are ignored, so
+    spelling variants of the same province map to the same key.
+
+    Examples:
+        - "Thành phố Hồ Chí Minh" -> "ho-chi-minh"
+        - "Hồ Chí Minh" -> "ho-chi-minh"
+
+    Args:
+        province: Province name
+
+    Returns:
+        str: Lowercase slug of ASCII letters, digits and hyphens (empty if none)
+    """
+    ascii_name = strip_diacritics(normalize_province_name(province)).lower()
+    return re.sub(r"[^a-z0-9]+", "-", ascii_name).strip("-")
+
+
 def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     """
     Split list into chunks of specified size.
@@ -68,5 +112,7 @@ def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
 # Export all utility functions
 __all__ = [
     "normalize_province_name",
+    "strip_diacritics",
+    "province_slug",
     "chunk_list",
 ]
@@ -0,0 +1,196 @@
+"""
+Incremental readers for place data files.
+
+Yields places one at a time instead of loading the whole file, so peak memory is
+bounded by the largest single province (JSON) or line (NDJSON) regardless of
+file size, and ingestion can start as soon as the first province is parsed.
+
+Supported formats:
+- JSON array of provinces: [{"province": "Hà Nội", "places": [...]}, ...]
+- JSON array of places (each carrying its own "province")
+- NDJSON (.ndjson/.jsonl): one province object or one place object per line
+"""
+
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterator, TextIO, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+_decoder = json.JSONDecoder()
+
+
+def iter_places_from_file(file_path: str, read_size: int = 64 * 1024) -> Iterator[Dict[str, Any]]:
+    """
+    Stream places from a location data file, province by province.
+
+    Each yielded place carries a "province" key taken from its parent province
+    object (or its own field for flat formats).
+
+    Args:
+        file_path: Path to a .json, .ndjson or .jsonl file
+        read_size: Bytes of text to read per refill for JSON arrays
+
+    Yields:
+        Place dictionaries
+
+    Raises:
+        ValueError: If the file is not valid JSON/NDJSON in a supported shape
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        if file_path.lower().endswith(NDJSON_SUFFIXES):
+            items = _iter_ndjson(f)
+        else:
+            items = _iter_json_array(f, read_size)
+
+        for item in items:
+            yield from _expand_item(item)
+
+
+async def aiter_ndjson_lines(
+    chunks: AsyncIterable[bytes],
+    max_line_bytes: int = 1024 * 1024,
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Split a streamed byte body (e.g. a request body) into NDJSON lines.
+
+    Lines are yielded as soon as they are complete, so a consumer can start
+    processing records before the body has been fully received.
+
+    Args:
+        chunks: Async iterable of raw byte chunks
+        max_line_bytes: Longest accepted line
+
+    Yields:
+        (line_number, line) pairs for non-empty lines, line numbers starting at 1
+
+    Raises:
+        ValueError: If a line exceeds max_line_bytes or is not valid UTF-8
+    """
+    buffer = b""
+    line_number = 0
+
+    def decode(raw: bytes) -> str:
+        try:
+            return raw.decode("utf-8").strip()
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Invalid UTF-8 on line {line_number}: {e}") from e
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            line_number += 1
+            line = decode(raw)
+            if line:
+                yield line_number, line
+        if len(buffer) > max_line_bytes:
+            raise ValueError(f"Line {line_number + 1} exceeds {max_line_bytes} bytes")
+
+    if buffer:
+        line_number += 1
+        line = decode(buffer)
+        if line:
+            yield line_number, line
+
+
+def _expand_item(item: Any) -> Iterator[Dict[str, Any]]:
+    """Turn a province object into its places, or pass a flat place through."""
+    if not isinstance(item, dict):
+        logger.warning("Skipping non-object entry in location data", entry_type=type(item).__name__)
+        return
+
+    if "places" in item:
+        province_name = item.get("province", "")
+        for place in item.get("places") or []:
+            if isinstance(place, dict):
+                yield {**place, "province": province_name}
+        return
+
+    yield item
+
+
+def _iter_ndjson(f: TextIO) -> Iterator[Any]:
+    """Decode one JSON value per non-empty line."""
+    for line_number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_number}: {e}") from e
+
+
+def _iter_json_array(f: TextIO, read_size: int) -> Iterator[Any]:
+    """
+    Decode the elements of a top-level JSON array one at a time.
+
+    Only the current element (plus one read buffer) is held in memory.
+    """
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill(min_size: int) -> bool:
+        """Append more text to the buffer; False once the file is exhausted."""
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        chunk = f.read(max(read_size, min_size))
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def skip_whitespace() -> None:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n":
+                position += 1
+            if position < len(buffer) or not fill(read_size):
+                return
+
+    skip_whitespace()
+    if position >= len(buffer) or buffer[position] != "[":
+        raise ValueError("Expected a JSON array at the top level")
+    position += 1
+
+    skip_whitespace()
+    if position < len(buffer) and buffer[position] == "]":
+        return
+
+    while True:
+        skip_whitespace()
+        # Grow the buffer until a complete element can be decoded
+        needed = read_size
+        while True:
+            try:
+                item, end = _decoder.raw_decode(buffer, position)
+                break
+            except json.JSONDecodeError as e:
+                if not fill(needed):
+                    raise ValueError(f"Invalid or truncated JSON array: {e}") from e
+                # Double the read size so very large elements stay linear overall
+                needed *= 2
+
+        position = end
+        yield item
+
+        skip_whitespace()
+        if position >= len(buffer):
+            raise ValueError("Unexpected end of file inside JSON array")
+        separator = buffer[position]
+        position += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, found {separator!r}")
+
+
+__all__ = ["aiter_ndjson_lines", "iter_places_from_file", "NDJSON_SUFFIXES"]
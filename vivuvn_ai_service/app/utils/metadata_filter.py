@@ -0,0 +1,147 @@
+"""
+Pinecone-compatible metadata filter evaluation.
+
+Lets in-process vector backends apply the same filter dictionaries that are sent
+to Pinecone, e.g.:
+
+    {"province": {"$eq": "Hà Nội"}, "rating": {"$gte": 4.0}}
+    {"$or": [{"province": "Huế"}, {"province": "Đà Nẵng"}]}
+
+Supported operators: $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin, $exists, $and, $or.
+A bare value is shorthand for $eq.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_RANGE_OPERATORS = ("$gt", "$gte", "$lt", "$lte")
+
+_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "$eq": lambda value, target: value == target,
+    "$ne": lambda value, target: value != target,
+    "$gt": lambda value, target: value is not None and value > target,
+    "$gte": lambda value, target: value is not None and value >= target,
+    "$lt": lambda value, target: value is not None and value < target,
+    "$lte": lambda value, target: value is not None and value <= target,
+    "$in": lambda value, target: value in target,
+    "$nin": lambda value, target: value not in target,
+}
+
+
+def matches_filter(metadata: Dict[str, Any], filter_dict: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check whether a metadata dictionary satisfies a Pinecone-style filter.
+
+    Args:
+        metadata: Vector metadata
+        filter_dict: Filter expression (None or empty matches everything)
+
+    Returns:
+        bool: True if the metadata matches
+
+    Raises:
+        ValueError: If the filter uses an unsupported operator
+    """
+    if not filter_dict:
+        return True
+
+    for key, condition in filter_dict.items():
+        if key == "$and":
+            if not all(matches_filter(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_filter(metadata, clause) for clause in condition):
+                return False
+        elif not _matches_field(metadata, key, condition):
+            return False
+
+    return True
+
+
+def _matches_field(metadata: Dict[str, Any], field: str, condition: Any) -> bool:
+    """Evaluate the condition on one metadata field."""
+    if not isinstance(condition, dict):
+        condition = {"$eq": condition}
+
+    for operator, target in condition.items():
+        if operator == "$exists":
+            if (field in metadata) != bool(target):
+                return False
+            continue
+
+        comparator = _COMPARATORS.get(operator)
+        if comparator is None:
+            raise ValueError(f"Unsupported metadata filter operator: {operator}")
+
+        value = metadata.get(field)
+        if isinstance(value, list) and operator in ("$eq", "$in"):
+            # Pinecone matches list-valued metadata if any element matches
+            if not any(comparator(item, target) for item in value):
+                return False
+        elif isinstance(value, list) and operator in ("$ne", "$nin"):
+            if not all(comparator(item, target) for item in value):
+                return False
+        else:
+            try:
+                if not comparator(value, target):
+                    return False
+            except TypeError:
+                return False
+
+    return True
+
+
+def province_from_filter(filter_dict: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Extract a single required province from a filter, if there is one.
+
+    Args:
+        filter_dict: Filter expression
+
+    Returns:
+        Province name when the filter pins province with $eq (or a bare value), else None
+    """
+    if not filter_dict:
+        return None
+    condition = filter_dict.get("province")
+    if isinstance(condition, str):
+        return condition
+    if isinstance(condition, dict) and isinstance(condition.get("$eq"), str):
+        return condition["$eq"]
+    return None
+
+
+def split_range_filter(filter_dict: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, float]], Dict[str, Any]]:
+    """
+    Separate top-level numeric range conditions from the rest of a filter.
+
+    Range conditions ({"latitude": {"$gte": 20.9, "$lte": 21.1}}) can be evaluated
+    as vectorized masks over numeric columns; the remainder still goes through
+    matches_filter. Both parts must match.
+
+    Args:
+        filter_dict: Filter expression
+
+    Returns:
+        (field → {operator: bound} for $gt/$gte/$lt/$lte, remaining filter)
+    """
+    ranges: Dict[str, Dict[str, float]] = {}
+    remaining: Dict[str, Any] = {}
+    for key, condition in (filter_dict or {}).items():
+        if (
+            not key.startswith("$")
+            and isinstance(condition, dict)
+            and condition
+            and all(
+                operator in _RANGE_OPERATORS
+                and isinstance(bound, (int, float))
+                and not isinstance(bound, bool)
+                for operator, bound in condition.items()
+            )
+        ):
+            ranges[key] = {operator: float(bound) for operator, bound in condition.items()}
+        else:
+            remaining[key] = condition
+    return ranges, remaining
+
+
+__all__ = ["matches_filter", "province_from_filter", "split_range_filter"]
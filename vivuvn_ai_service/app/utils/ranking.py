@@ -0,0 +1,296 @@
+"""
+Result-list fusion and diversification utilities.
+
+Used to collapse chunk matches into places, to merge the ranked lists returned
+by several sub-queries (one per travel preference) into a single list, to rerank
+it with place features and to pick a diverse subset of it for the itinerary prompt.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def aggregate_by_place(
+    results: List[Dict[str, Any]],
+    top_k: Optional[int] = None,
+    mode: str = "max",
+) -> List[Dict[str, Any]]:
+    """
+    Collapse chunk matches into one result per place.
+
+    Each place keeps its best-scoring chunk (id and metadata, including the most
+    relevant chunk_text) with a place-level score: the best chunk score ("max") or
+    the sum of its matched chunk scores ("sum", favouring places that match in
+    several chunks). Results without a place_id are kept as their own place.
+
+    Args:
+        results: Chunk matches ({"id", "score", "metadata"})
+        top_k: Number of places to keep (None: all)
+        mode: "max" or "sum"
+
+    Returns:
+        Place results, best place score first, each with a top-level "place_id"
+        and "matched_chunks" count
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if mode not in ("max", "sum"):
+        raise ValueError(f"Unknown place score mode: {mode} (expected 'max' or 'sum')")
+
+    best_chunks: Dict[Any, Dict[str, Any]] = {}
+    place_scores: Dict[Any, float] = {}
+    chunk_counts: Dict[Any, int] = {}
+
+    for result in results:
+        place_id = (result.get("metadata") or {}).get("place_id") or result.get("id")
+        score = result.get("score", 0.0) or 0.0
+
+        if place_id not in best_chunks:
+            place_scores[place_id] = score
+            chunk_counts[place_id] = 0
+        elif mode == "sum":
+            place_scores[place_id] += score
+        else:
+            place_scores[place_id] = max(place_scores[place_id], score)
+        chunk_counts[place_id] += 1
+
+        if place_id not in best_chunks or score > best_chunks[place_id].get("score", 0.0):
+            best_chunks[place_id] = result
+
+    ordered = sorted(place_scores, key=place_scores.get, reverse=True)
+    if top_k is not None:
+        ordered = ordered[:top_k]
+    return [
+        {
+            **best_chunks[place_id],
+            "score": place_scores[place_id],
+            "place_id": place_id,
+            "matched_chunks": chunk_counts[place_id],
+        }
+        for place_id in ordered
+    ]
+
+
+def reciprocal_rank_fusion(
+    result_lists: Sequence[List[Dict[str, Any]]],
+    top_k: int,
+    k: int = 60,
+    quotas: Optional[Sequence[int]] = None,
+    key: str = "id",
+) -> List[Dict[str, Any]]:
+    """
+    Merge ranked result lists with reciprocal-rank fusion (RRF).
+
+    Each result scores sum(1 / (k + rank)) over the lists it appears in (rank is
+    1-based), so items ranked well by several lists rise to the top while raw
+    similarity scores of different queries never need to be comparable.
+
+    Quotas guarantee coverage: the best quotas[i] results of list i are always
+    selected (results shared with an earlier list count for both), and the
+    remaining slots go to the highest fused scores.
+
+    Args:
+        result_lists: Ranked result lists (best first), e.g. one per sub-query
+        top_k: Number of results to return
+        k: RRF rank constant (larger values flatten the rank weighting)
+        quotas: Optional minimum number of results reserved for each list
+        key: Result field identifying the same item across lists
+
+    Returns:
+        Fused results, best fused score first. Each result is a copy of its best
+        scoring occurrence with an added "rrf_score".
+    """
+    fused: Dict[Any, float] = {}
+    best: Dict[Any, Dict[str, Any]] = {}
+
+    for results in result_lists:
+        for rank, result in enumerate(results, start=1):
+            item_key = result.get(key)
+            if item_key is None:
+                continue
+            fused[item_key] = fused.get(item_key, 0.0) + 1.0 / (k + rank)
+            if item_key not in best or result.get("score", 0.0) > best[item_key].get("score", 0.0):
+                best[item_key] = result
+
+    selected: List[Any] = []
+    chosen = set()
+
+    if quotas:
+        for results, quota in zip(result_lists, quotas):
+            taken = 0
+            for result in results:
+                if taken >= quota or len(selected) >= top_k:
+                    break
+                item_key = result.get(key)
+                if item_key is None:
+                    continue
+                taken += 1
+                if item_key in chosen:
+                    # Already selected through another list: covers this one too
+                    continue
+                selected.append(item_key)
+                chosen.add(item_key)
+
+    for item_key in sorted(fused, key=fused.get, reverse=True):
+        if len(selected) >= top_k:
+            break
+        if item_key not in chosen:
+            selected.append(item_key)
+            chosen.add(item_key)
+
+    selected.sort(key=fused.get, reverse=True)
+    return [{**best[item_key], "rrf_score": fused[item_key]} for item_key in selected]
+
+
+def _haversine_km(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """Broadcasting haversine distance in km between degree coordinates."""
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _distance_matrix_km(coords: np.ndarray) -> np.ndarray:
+    """Pairwise haversine distances in km for [N, 2] (latitude, longitude) degrees."""
+    lat = coords[:, 0]
+    lng = coords[:, 1]
+    return _haversine_km(lat[:, None], lng[:, None], lat[None, :], lng[None, :])
+
+
+def _min_max(values: np.ndarray) -> np.ndarray:
+    spread = values.max() - values.min() if len(values) else 0.0
+    return (values - values.min()) / spread if spread > 0 else np.ones(len(values))
+
+
+def rerank_scores(
+    similarity: np.ndarray,
+    ratings: np.ndarray,
+    coords: np.ndarray,
+    keyword_hits: np.ndarray,
+    weights: Sequence[float] = (0.6, 0.2, 0.1, 0.1),
+    rating_prior: float = 2.0,
+    distance_scale_km: float = 10.0,
+    center: Optional[Sequence[float]] = None,
+) -> np.ndarray:
+    """
+    Score candidates as a weighted sum of four features in [0, 1].
+
+    - similarity: retrieval score, min-max normalized over the candidates
+    - rating: Bayesian-smoothed rating / 5, i.e. (C * m + r) / (C + 1) with m the
+      mean rating of rated candidates and C = rating_prior; unrated places (0) get m
+    - distance: exp(-km / distance_scale_km) from the given center, or else the
+      median coordinate of the candidates (the destination centroid); unknown
+      coordinates (0, 0) score 0
+    - keywords: hits / (hits + 1), saturating in the number of keyword hits
+
+    Args:
+        similarity: [N] retrieval scores
+        ratings: [N] ratings 0-5 (0: unrated)
+        coords: [N, 2] (latitude, longitude) degrees
+        keyword_hits: [N] matched preference keywords
+        weights: (similarity, rating, distance, keywords) weights
+        rating_prior: Pseudo-ratings at the mean pulling each rating toward it
+        distance_scale_km: Distance at which closeness decays to 1/e
+        center: Optional (latitude, longitude) to measure distance from
+
+    Returns:
+        [N] rerank scores (higher is better)
+    """
+    n = len(similarity)
+    if n == 0:
+        return np.zeros(0)
+
+    similarity = _min_max(np.asarray(similarity, dtype=np.float64))
+
+    ratings = np.asarray(ratings, dtype=np.float64)
+    rated = ratings > 0
+    prior_mean = ratings[rated].mean() if rated.any() else 0.0
+    smoothed = (rating_prior * prior_mean + ratings * rated) / (rating_prior + rated)
+    rating_feature = smoothed / 5.0
+
+    coords = np.asarray(coords, dtype=np.float64)
+    known = np.any(coords != 0, axis=1)
+    closeness = np.zeros(n)
+    if known.any():
+        center = np.asarray(center, dtype=np.float64) if center is not None else np.median(coords[known], axis=0)
+        distances = _haversine_km(coords[known, 0], coords[known, 1], center[0], center[1])
+        closeness[known] = np.exp(-distances / max(distance_scale_km, 1e-6))
+
+    keyword_hits = np.asarray(keyword_hits, dtype=np.float64)
+    keyword_feature = keyword_hits / (keyword_hits + 1.0)
+
+    features = np.stack([similarity, rating_feature, closeness, keyword_feature])
+    return np.asarray(weights, dtype=np.float64) @ features
+
+
+def mmr_select(
+    relevance: np.ndarray,
+    vectors: np.ndarray,
+    k: int,
+    lambda_: float = 0.7,
+    coords: Optional[np.ndarray] = None,
+    geo_weight: float = 0.3,
+    geo_radius_km: float = 1.0,
+) -> List[int]:
+    """
+    Maximal Marginal Relevance selection with a geographic co-location penalty.
+
+    Greedily picks the candidate maximizing
+    lambda * relevance - (1 - lambda) * max redundancy with the picks so far, where
+    redundancy = (1 - geo_weight) * cosine similarity
+               + geo_weight * exp(-distance_km / geo_radius_km).
+    Near-identical venues (five pagodas) and venues at the same spot both count
+    as redundant.
+
+    Args:
+        relevance: [N] relevance scores (higher is better)
+        vectors: [N, D] candidate embeddings (zero rows: no similarity penalty)
+        k: Number of candidates to select
+        lambda_: Relevance/diversity trade-off in [0, 1] (1: pure relevance)
+        coords: Optional [N, 2] (latitude, longitude); rows of (0, 0) are unknown
+        geo_weight: Share of the redundancy taken from geographic proximity
+        geo_radius_km: Distance at which proximity decays to 1/e
+
+    Returns:
+        Indices of the selected candidates, in selection order
+    """
+    n = len(relevance)
+    if n == 0 or k <= 0:
+        return []
+    if n <= k:
+        return [int(i) for i in np.argsort(-relevance)]
+
+    relevance = _min_max(np.asarray(relevance, dtype=np.float64))
+
+    vectors = np.asarray(vectors, dtype=np.float64)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+    redundancy = unit @ unit.T
+
+    if coords is not None and geo_weight > 0:
+        coords = np.asarray(coords, dtype=np.float64)
+        known = np.any(coords != 0, axis=1)
+        proximity = np.exp(-_distance_matrix_km(coords) / max(geo_radius_km, 1e-6))
+        proximity *= known[:, None] & known[None, :]
+        redundancy = (1 - geo_weight) * redundancy + geo_weight * proximity
+
+    selected = [int(np.argmax(relevance))]
+    max_redundancy = redundancy[selected[0]].copy()
+    available = np.ones(n, dtype=bool)
+    available[selected[0]] = False
+
+    while len(selected) < k:
+        scores = lambda_ * relevance - (1 - lambda_) * max_redundancy
+        scores[~available] = -np.inf
+        pick = int(np.argmax(scores))
+        selected.append(pick)
+        available[pick] = False
+        np.maximum(max_redundancy, redundancy[pick], out=max_redundancy)
+
+    return selected
+
+
+__all__ = ["aggregate_by_place", "mmr_select", "reciprocal_rank_fusion", "rerank_scores"]
@@ -0,0 +1,94 @@
+"""
+Async rate limiting utilities.
+
+Provides a token-bucket limiter used to keep outbound API calls within a
+provider's requests-per-minute quota.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+
+class TokenBucketRateLimiter:
+    """
+    Token-bucket rate limiter for asyncio code.
+
+    Tokens refill continuously at rate_per_minute / 60 per second up to `burst`.
+    acquire() waits until enough tokens are available, so callers saturate the
+    quota without exceeding it.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 0):
+        """
+        Initialize limiter.
+
+        Args:
+            rate_per_minute: Sustained requests per minute (<= 0 disables limiting)
+            burst: Bucket capacity (defaults to 1/10 of the per-minute rate, at least 1)
+        """
+        self.rate_per_minute = rate_per_minute
+        self.rate_per_second = rate_per_minute / 60.0 if rate_per_minute > 0 else 0.0
+        self.capacity = float(burst or max(1, int(rate_per_minute // 10)))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.total_acquired = 0
+        self.total_wait_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the limiter enforces a rate."""
+        return self.rate_per_second > 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+
+    async def acquire(self, tokens: int = 1) -> float:
+        """
+        Wait until `tokens` tokens are available and consume them.
+
+        Args:
+            tokens: Number of tokens (requests) to consume
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+
+        started = time.monotonic()
+        # Lock keeps waiters FIFO so a burst cannot starve earlier callers
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    break
+                deficit = tokens - self._tokens
+                await asyncio.sleep(deficit / self.rate_per_second)
+
+        waited = time.monotonic() - started
+        self.total_acquired += tokens
+        self.total_wait_seconds += waited
+        return waited
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            dict: Configured rate and cumulative usage
+        """
+        return {
+            "rate_per_minute": self.rate_per_minute,
+            "burst": self.capacity,
+            "total_acquired": self.total_acquired,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+        }
+
+
+__all__ = ["TokenBucketRateLimiter"]
@@ -0,0 +1,104 @@
+"""
+Single-flight coalescing of concurrent identical calls.
+
+When many requests need the same result at once (e.g. identical destination
+searches during a booking peak), only the first caller runs the work; the others
+await the same shared task. Once it finishes the key is released, so later calls
+run again (results are cached elsewhere, not here).
+
+Cancellation is per waiter: a cancelled waiter stops waiting without cancelling
+the shared task for the others. The task is cancelled only when every waiter has
+left, and its key is released at that moment.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """One shared in-flight call (internal)."""
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent calls with the same key into one shared task.
+
+    Not thread-safe: intended for use from a single asyncio event loop.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize group.
+
+        Args:
+            name: Name used in logs and metrics
+        """
+        self.name = name
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once per key among concurrent callers and share its outcome.
+
+        Args:
+            key: Identity of the call
+            fn: Zero-argument coroutine function doing the work
+
+        Returns:
+            Result of the shared call (exceptions are raised to every waiter)
+        """
+        self.calls += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda task: self._finish(key, flight))
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            # shield(): cancelling this waiter must not cancel the shared task
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Last waiter gone: nobody needs the result any more. Release the key
+                # now, so a caller arriving before the task finishes cancelling starts
+                # a fresh call instead of joining the cancelled one.
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the exception retrieved even if every waiter was cancelled
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            dict: Calls, calls that joined an in-flight task, and current in-flight keys
+        """
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights),
+        }
+
+
+__all__ = ["SingleFlight"]
@@ -5,8 +5,15 @@ with chunking and minimal metadata approach.
 
 This script uses the new EmbeddingService with LangChain chunking for better
 semantic search and 90% smaller metadata for cost optimization.
+
+Progress is checkpointed durably while loading. If a run dies (quota exhaustion,
+crash, deploy), re-run with --resume to skip every place already committed:
+
+    python load_location_data.py --resume
+    python load_location_data.py --file data/other.ndjson --checkpoint data/cache/other.ckpt.json
 """
 
+import argparse
 import asyncio
 import os
 import structlog
@@ -17,7 +24,11 @@ current_dir = Path(__file__).parent
 app_dir = current_dir / "app"
 sys.path.insert(0, str(app_dir))
 
+from app.core.config import settings
 from app.services.data_management_service import get_data_management_service
+from app.services.ingestion_checkpoint import IngestionCheckpoint
+from app.services.ingestion_pipeline import IngestionProgress
+from app.utils.json_stream import iter_places_from_file
 
 # Configure structlog for script
 structlog.configure(
@@ -32,13 +43,64 @@ structlog.configure(
 logger = structlog.get_logger(__name__)
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Load location data into Pinecone")
+    parser.add_argument(
+        "--file",
+        default="data/location_data.json",
+        help="Location data file (.json array or .ndjson/.jsonl)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Checkpoint file (default: data/cache/<file name>.checkpoint.json)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip places already committed by a previous (interrupted) run",
+    )
+    parser.add_argument(
+        "--count",
+        action="store_true",
+        help="Count the places in the file first (an extra pass) so the first run can report an ETA; "
+             "resumed runs take the count from the checkpoint",
+    )
+    return parser.parse_args()
+
+
 async def main():
     """Main function to load location data with optimized chunking."""
+    args = parse_args()
     try:
         logger.info("Starting optimized location data loading process...")
-        
-        location_data_path = "data/location_data.json"
-        
+
+        location_data_path = args.file
+        checkpoint_path = args.checkpoint or os.path.join(
+            "data", "cache", f"{Path(location_data_path).name}.checkpoint.json"
+        )
+
+        if args.resume:
+            checkpoint = IngestionCheckpoint.load(checkpoint_path, location_data_path)
+            logger.info(
+                f"Resuming from checkpoint: {len(checkpoint.committed_hashes)} places already committed "
+                f"(last committed #{checkpoint.last_committed_ordinal}, "
+                f"province: {checkpoint.last_committed_province})"
+            )
+        else:
+            checkpoint = IngestionCheckpoint(checkpoint_path, location_data_path)
+
+        # ETA total: recorded by the previous run, or counted on request
+        total_places = checkpoint.total_places
+        if args.count:
+            total_places = sum(1 for _ in iter_places_from_file(location_data_path))
+        pending_places = None
+        if total_places is not None:
+            # Everything up to the committed position is skipped on resume
+            pending_places = max(0, total_places - (checkpoint.last_committed_ordinal + 1))
+            logger.info(f"Places in file: {total_places} (pending: ~{pending_places})")
+
         dm_service = get_data_management_service()
 
         logger.info("Vector services initialized (index auto-created if needed)")
@@ -51,15 +113,23 @@ async def main():
         logger.info("Loading places from location_data.json with optimized chunking...")
         logger.info("This will create multiple vectors per place if descriptions are long...")
 
-        loaded_count = await dm_service.load_from_json_file(location_data_path)
-        
+        loaded_count = await dm_service.load_from_json_file(
+            location_data_path,
+            checkpoint=checkpoint,
+            on_progress=IngestionProgress(total_places=pending_places),
+        )
+
         logger.info(f"Successfully processed {loaded_count} places")
+        logger.info(
+            f"Checkpoint: {len(checkpoint.committed_hashes)}/{checkpoint.total_places or '?'} places committed "
+            f"({'complete' if checkpoint.completed else 'incomplete - re-run with --resume'})"
+        )
         
-        from app.services.pinecone_service import get_pinecone_service
-        pinecone_service = get_pinecone_service()
-        stats = await pinecone_service.get_index_stats()
+        from app.services.vector_store import get_vector_store
+        vector_store = get_vector_store()
+        stats = await vector_store.get_index_stats()
         
-        logger.info("Final Pinecone index statistics:")
+        logger.info(f"Final vector index statistics ({settings.VECTOR_BACKEND}):")
         logger.info(f"  Total vectors: {stats.get('total_vectors', 'unknown')}")
         logger.info(f"  Dimension: {stats.get('dimension', 'unknown')}")
         logger.info(f"  Index fullness: {stats.get('index_fullness', 'unknown')}")
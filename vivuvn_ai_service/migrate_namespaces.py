@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Move place vectors from the shared namespace into per-province namespaces.
+
+Run once after enabling PINECONE_NAMESPACE_PER_PROVINCE on an index that was
+loaded with the single shared PINECONE_DEFAULT_NAMESPACE layout:
+
+    PINECONE_NAMESPACE_PER_PROVINCE=true python migrate_namespaces.py --dry-run
+    PINECONE_NAMESPACE_PER_PROVINCE=true python migrate_namespaces.py
+
+Vectors are copied as-is (values and metadata are fetched by ID, nothing is
+re-embedded), then removed from the shared namespace batch by batch. An
+interrupted migration can simply be re-run: moved vectors are no longer listed
+in the shared namespace. Vectors without a province stay where they are.
+"""
+
+import argparse
+import asyncio
+import structlog
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+current_dir = Path(__file__).parent
+app_dir = current_dir / "app"
+sys.path.insert(0, str(app_dir))
+
+from app.core.config import settings
+from app.services.vector_store import close_vector_store, get_vector_store, province_namespace
+
+# Configure structlog for script
+structlog.configure(
+    processors=[
+        structlog.stdlib.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.dev.ConsoleRenderer()  # Human-readable output for scripts
+    ],
+    logger_factory=structlog.PrintLoggerFactory(),
+    cache_logger_on_first_use=True,
+)
+logger = structlog.get_logger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Move place vectors into per-province namespaces")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100,
+        help="Vectors fetched, upserted and deleted per batch",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report how many vectors would move to each namespace",
+    )
+    parser.add_argument(
+        "--keep-source",
+        action="store_true",
+        help="Copy vectors without deleting them from the shared namespace",
+    )
+    return parser.parse_args()
+
+
+async def main():
+    """Copy every place vector of the shared namespace to its province namespace."""
+    args = parse_args()
+
+    if not settings.PINECONE_NAMESPACE_PER_PROVINCE:
+        logger.error("PINECONE_NAMESPACE_PER_PROVINCE is disabled; enable it before migrating")
+        sys.exit(1)
+
+    source = settings.PINECONE_DEFAULT_NAMESPACE
+    vector_store = get_vector_store()
+    await vector_store.initialize()
+
+    try:
+        vector_ids = await vector_store.list_ids(prefix="place_", namespace=source)
+        logger.info(f"Vectors in shared namespace '{source}': {len(vector_ids)}")
+
+        moved: Dict[str, int] = {}
+        skipped = 0
+        batch_size = max(1, args.batch_size)
+
+        for start in range(0, len(vector_ids), batch_size):
+            vectors = await vector_store.fetch_vectors(vector_ids[start:start + batch_size], namespace=source)
+
+            by_namespace: Dict[str, List[Dict[str, Any]]] = {}
+            for vector in vectors.values():
+                target = province_namespace(vector["metadata"].get("province"))
+                if target == source:
+                    skipped += 1
+                    continue
+                by_namespace.setdefault(target, []).append(vector)
+
+            for target, target_vectors in by_namespace.items():
+                moved[target] = moved.get(target, 0) + len(target_vectors)
+                if args.dry_run:
+                    continue
+                if not await vector_store.upsert_vectors(target_vectors, namespace=target):
+                    raise RuntimeError(f"Failed to upsert {len(target_vectors)} vectors to '{target}'")
+                if not args.keep_source and not await vector_store.delete_vectors(
+                    [vector["id"] for vector in target_vectors], namespace=source
+                ):
+                    raise RuntimeError(f"Failed to delete {len(target_vectors)} migrated vectors from '{source}'")
+
+            logger.info(f"Processed {min(start + batch_size, len(vector_ids))}/{len(vector_ids)} vectors")
+
+        await vector_store.flush()
+
+        action = "Would move" if args.dry_run else "Moved"
+        for target in sorted(moved):
+            logger.info(f"  {action} {moved[target]} vectors to '{target}'")
+        logger.info(
+            f"{action} {sum(moved.values())} vectors into {len(moved)} province namespaces "
+            f"({skipped} without a province left in '{source}')"
+        )
+    except Exception as e:
+        logger.error(f"Namespace migration failed: {e}")
+        raise
+    finally:
+        await close_vector_store()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())